@@ -0,0 +1,49 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare finding the elements attached to nodes by scanning all elements and by the reverse index.
+
+Run with `python -m benchmarks.bench_attachments [n_elements] [n_nodes]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+
+
+def main(n_elements: int = 300_000, n_nodes: int = 100) -> None:
+    topology = synthetic_topology(n_elements)
+    step = max(len(topology.nodes) // n_nodes, 1)
+    names = [node.name for node in topology.nodes[::step][:n_nodes]]
+
+    start = time.perf_counter()
+    for name in names:
+        _ = (
+            [e for e in topology.branches if name in {e.node_1, e.node_2}],
+            [e for e in topology.transformers if any(w.node == name for w in e.windings)],
+            [e for e in topology.loads if e.node == name],
+            [e for e in topology.external_grids if e.node == name],
+        )
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _ = topology.attachments
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for name in names:
+        topology.attached(name)
+    lookup = time.perf_counter() - start
+
+    logger.info("attached elements of {n} nodes:", n=len(names))
+    logger.info("  scan:          {duration:10.6f} s", duration=scan)
+    logger.info("  reverse index: {duration:10.6f} s (build {build:.3f} s)", duration=lookup, build=build)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,44 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare load time and disk footprint of plain and compressed JSON files.
+
+Run with `python -m benchmarks.bench_compression [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import tempfile
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+from psdm.topology.topology import Topology
+
+
+def main(n_elements: int = 100_000) -> None:
+    topology = synthetic_topology(n_elements)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for suffix in (".json", ".json.gz", ".json.xz", ".json.bz2"):
+            file_path = pathlib.Path(tmp_dir) / ("topology" + suffix)
+            start = time.perf_counter()
+            topology.to_json(file_path)
+            write_time = time.perf_counter() - start
+            start = time.perf_counter()
+            Topology.from_file(file_path)
+            load_time = time.perf_counter() - start
+            logger.info(
+                "{suffix:>10}: {size:8.1f} MiB, write {write:.2f} s, load {load:.2f} s",
+                suffix=suffix,
+                size=file_path.stat().st_size / 2**20,
+                write=write_time,
+                load=load_time,
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,47 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Measure feeder tracing of a topology and a backward sweep over the cached feeders.
+
+Run with `python -m benchmarks.bench_feeders [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+
+
+def main(n_elements: int = 300_000) -> None:
+    topology = synthetic_topology(n_elements)
+    _ = topology.adjacency
+    start = time.perf_counter()
+    feeders = topology.feeders
+    duration = time.perf_counter() - start
+
+    # accumulate the number of downstream nodes per node, children are visited before their parents
+    start = time.perf_counter()
+    downstream = [1] * len(topology.nodes)
+    for feeder in range(feeders.n_feeders):
+        for node in reversed(feeders.nodes_of(feeder)):
+            parent = feeders.node_parent[node]
+            if parent != -1:
+                downstream[parent] += downstream[node]
+    sweep = time.perf_counter() - start
+    logger.info(
+        "{n_nodes} nodes, {n_feeders} feeders, {n_meshes} meshes: tracing {duration:.3f} s, sweep {sweep:.3f} s",
+        n_nodes=len(topology.nodes),
+        n_feeders=feeders.n_feeders,
+        n_meshes=len(feeders.meshes),
+        duration=duration,
+        sweep=sweep,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,40 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Measure the referential integrity check of a topology and a steadystate case.
+
+Run with `python -m benchmarks.bench_integrity [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_case
+from benchmarks.grid import synthetic_topology
+
+
+def main(n_elements: int = 300_000) -> None:
+    topology = synthetic_topology(n_elements)
+    case = synthetic_case(topology)
+    start = time.perf_counter()
+    report = topology.check_integrity()
+    duration = time.perf_counter() - start
+    start = time.perf_counter()
+    case_report = case.check_integrity(topology)
+    duration_case = time.perf_counter() - start
+    logger.info(
+        "{n} elements: topology {duration:.3f} s ({n_violations} violations), case {duration_case:.3f} s",
+        n=len(topology.branches) + len(topology.nodes) + len(topology.loads) + len(topology.transformers),
+        duration=duration,
+        n_violations=len(report.violations) + len(case_report.violations),
+        duration_case=duration_case,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,51 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Measure island detection of a topology with some feeders cut off by open switches.
+
+Run with `python -m benchmarks.bench_islands [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import FEEDER_SIZE
+from benchmarks.grid import synthetic_topology
+from psdm.meta import Meta
+from psdm.topology.graph import islands
+from psdm.topology_case.case import Case
+from psdm.topology_case.element_state import ElementState
+
+
+def main(n_elements: int = 300_000) -> None:
+    topology = synthetic_topology(n_elements)
+    topology_case = Case(
+        meta=Meta(grid="synthetic", date=dt.date(2025, 1, 1)),
+        elements=tuple(
+            ElementState(name=f"L_{i + FEEDER_SIZE // 2}", open_switches=(f"N_{i + FEEDER_SIZE // 2}",))
+            for i in range(0, len(topology.nodes) - FEEDER_SIZE, 10 * FEEDER_SIZE)
+        ),
+    )
+    start = time.perf_counter()
+    _ = topology.adjacency
+    adjacency = time.perf_counter() - start
+    start = time.perf_counter()
+    result = islands(topology, topology_case)
+    duration = time.perf_counter() - start
+    logger.info(
+        "{n_nodes} nodes, {n_islands} islands: adjacency {adjacency:.3f} s, islands {duration:.3f} s",
+        n_nodes=len(topology.nodes),
+        n_islands=result.n_islands,
+        adjacency=adjacency,
+        duration=duration,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
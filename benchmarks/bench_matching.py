@@ -0,0 +1,62 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare matching steadystate cases against one topology with list membership and with hashed name sets.
+
+Run with `python -m benchmarks.bench_matching [n_elements] [n_cases]`. The list-based check is only timed for one
+case and extrapolated to `n_cases`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import typing as t
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_case
+from benchmarks.grid import synthetic_topology
+
+if t.TYPE_CHECKING:
+    from psdm.steadystate_case.case import Case
+    from psdm.topology.topology import Topology
+
+
+def legacy_matches_topology(case: Case, topology: Topology) -> bool:
+    """List-based check as in psdm 2.3.3."""
+    if topology.meta != case.meta:
+        return False
+
+    for section in ("loads", "transformers", "external_grids"):
+        if len(getattr(case, section)) != len(getattr(topology, section)):
+            return False
+
+        names = [e.name for e in getattr(case, section)]
+        if any(e.name not in names for e in getattr(topology, section)):
+            return False
+
+    return True
+
+
+def main(n_elements: int = 30_000, n_cases: int = 30_000) -> None:
+    topology = synthetic_topology(n_elements)
+    case = synthetic_case(topology)
+
+    start = time.perf_counter()
+    legacy_matches_topology(case, topology)
+    legacy = (time.perf_counter() - start) * n_cases
+
+    start = time.perf_counter()
+    for _ in range(n_cases):
+        case.match_topology(topology)
+    duration = time.perf_counter() - start
+
+    logger.info("{n_cases} cases of {n_loads} loads:", n_cases=n_cases, n_loads=len(case.loads))
+    logger.info("  list membership: {legacy:10.1f} s (extrapolated)", legacy=legacy)
+    logger.info("  name sets:       {duration:10.1f} s", duration=duration)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,54 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare joining steadystate loads to topology loads and branches to nodes by linear scan and by name index.
+
+Run with `python -m benchmarks.bench_name_index [n_elements] [n_lookups]`. The linear scan is only timed for a sample
+of `SCAN_SAMPLE` lookups and extrapolated to `n_lookups`, as it is quadratic in the number of elements.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_case
+from benchmarks.grid import synthetic_topology
+
+SCAN_SAMPLE = 1000
+
+
+def main(n_elements: int = 100_000, n_lookups: int = 100_000) -> None:
+    topology = synthetic_topology(n_elements)
+    case = synthetic_case(topology)
+    names = [case.loads[i % len(case.loads)].name for i in range(n_lookups)]
+    node_names = [topology.branches[i % len(topology.branches)].node_1 for i in range(n_lookups)]
+
+    start = time.perf_counter()
+    for name in names[:SCAN_SAMPLE]:
+        next(e for e in topology.loads if e.name == name)
+    for name in node_names[:SCAN_SAMPLE]:
+        next(e for e in topology.nodes if e.name == name)
+    scan = (time.perf_counter() - start) * n_lookups / SCAN_SAMPLE
+
+    start = time.perf_counter()
+    loads = topology.loads_by_name
+    nodes = topology.nodes_by_name
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for name in names:
+        loads[name]
+    for name in node_names:
+        nodes[name]
+    lookup = time.perf_counter() - start
+
+    logger.info("{n} load and {n} node lookups:", n=n_lookups)
+    logger.info("  linear scan: {scan:8.3f} s (extrapolated)", scan=scan)
+    logger.info("  name index:  {total:8.3f} s (build {build:.3f} s)", total=build + lookup, build=build)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,56 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare loading a topology from JSON serially and with the elements validated in a process pool.
+
+The scan of the element byte ranges in the main process is timed on its own, as it bounds the speedup. Run with
+`python -m benchmarks.bench_parallel [n_elements] [n_workers]`.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+from psdm.storage import parallel
+from psdm.topology.topology import Topology
+
+
+class _Discard(concurrent.futures.Executor):
+    """Executor which drops all tasks, to time the scan alone."""
+
+    def submit(self, *_args: object, **_kwargs: object) -> concurrent.futures.Future:
+        return concurrent.futures.Future()
+
+
+def main(n_elements: int = 300_000, n_workers: int = os.cpu_count() or 1) -> None:
+    topology = synthetic_topology(n_elements)
+    data = topology.model_dump_json().encode()
+
+    start = time.perf_counter()
+    Topology.from_json(data)
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel._submit_batches(data, _Discard(), parallel.BATCH_SIZE, {})  # noqa: SLF001
+    scan = time.perf_counter() - start
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+        start = time.perf_counter()
+        parallel.load_topology(data, executor=executor)
+        duration = time.perf_counter() - start
+
+    logger.info("loading {n} elements from json:", n=n_elements)
+    logger.info("  serial: {duration:.3f} s", duration=serial)
+    logger.info("  {n_workers} workers: {duration:.3f} s", n_workers=n_workers, duration=duration)
+    logger.info("  scan in the main process: {duration:.3f} s", duration=scan)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
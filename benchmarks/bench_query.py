@@ -0,0 +1,79 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare attribute queries over the loads of a topology by full scan and by secondary indexes.
+
+Every tenth load is a PV producer with a power scaled by its position. Run with
+`python -m benchmarks.bench_query [n_elements] [n_queries]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import typing as t
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+from psdm.topology.load import LoadType
+from psdm.topology.load import SystemType
+
+if t.TYPE_CHECKING:
+    from psdm.topology.topology import Topology
+
+
+def with_producers(topology: Topology) -> Topology:
+    loads = list(topology.loads)
+    for i in range(0, len(loads), 10):
+        rated_power = loads[i].rated_power
+        active_power = rated_power.active_power.model_copy(update={"value": (i, i, i)})
+        loads[i] = loads[i].model_copy(
+            update={
+                "type": LoadType.PRODUCER.value,
+                "system_type": SystemType.PV.value,
+                "rated_power": rated_power.model_copy(update={"active_power": active_power}),
+            },
+        )
+
+    return topology.model_copy(update={"loads": tuple(loads)})
+
+
+def main(n_elements: int = 300_000, n_queries: int = 100) -> None:
+    topology = with_producers(synthetic_topology(n_elements))
+    lower, upper = n_elements // 10, n_elements // 5
+
+    def scan() -> tuple:
+        return tuple(
+            e
+            for e in topology.loads
+            if e.type == LoadType.PRODUCER.value
+            and e.system_type == SystemType.PV.value
+            and lower <= e.rated_power.active_power.total / 3 <= upper
+        )
+
+    def query() -> tuple:
+        loads = topology.query.loads
+        selection = loads.equal("type", LoadType.PRODUCER) & loads.equal("system_type", SystemType.PV)
+        return (selection & loads.between("rated_power.active_power.average", lower, upper)).elements()
+
+    start = time.perf_counter()
+    expected = scan()
+    duration_scan = time.perf_counter() - start
+    start = time.perf_counter()
+    assert query() == expected  # noqa: S101
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(n_queries):
+        query()
+    duration_query = (time.perf_counter() - start) / n_queries
+
+    logger.info("query of {n} out of {n_loads} loads:", n=len(expected), n_loads=len(topology.loads))
+    logger.info("  full scan:     {duration:10.6f} s", duration=duration_scan)
+    logger.info("  first query:   {duration:10.6f} s (building the indexes)", duration=build)
+    logger.info("  indexed query: {duration:10.6f} s", duration=duration_query)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
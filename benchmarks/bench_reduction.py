@@ -0,0 +1,66 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Measure the reduction of a node-breaker topology to buses and the adjacency of both.
+
+Every node of the synthetic grid gets two busbar nodes joined to it by couplers, the load hangs off one of them. Run
+with `python -m benchmarks.bench_reduction [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import typing as t
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+from psdm.topology.branch import BranchType
+from psdm.topology.reduction import buses
+
+if t.TYPE_CHECKING:
+    from psdm.topology.topology import Topology
+
+
+def node_breaker(topology: Topology) -> Topology:
+    nodes = list(topology.nodes)
+    branches = list(topology.branches)
+    coupler = branches[0].model_copy(update={"type": BranchType.COUPLER.value})
+    for node in topology.nodes:
+        for suffix in ("_A", "_B"):
+            nodes.append(node.model_copy(update={"name": node.name + suffix}))
+            update = {"name": f"C_{node.name}{suffix}", "node_1": node.name, "node_2": node.name + suffix}
+            branches.append(coupler.model_copy(update=update))
+
+    loads = tuple(e.model_copy(update={"node": e.node + "_A"}) for e in topology.loads)
+    return topology.model_copy(update={"nodes": tuple(nodes), "branches": tuple(branches), "loads": loads})
+
+
+def main(n_elements: int = 300_000) -> None:
+    topology = node_breaker(synthetic_topology(n_elements))
+    start = time.perf_counter()
+    mapping = buses(topology)
+    duration_buses = time.perf_counter() - start
+    start = time.perf_counter()
+    reduced = mapping.reduce(topology)
+    duration_reduce = time.perf_counter() - start
+    durations = []
+    for grid in (topology, reduced):
+        start = time.perf_counter()
+        _ = grid.adjacency
+        durations.append(time.perf_counter() - start)
+
+    logger.info("{n_nodes} nodes reduced to {n_buses} buses:", n_nodes=len(topology.nodes), n_buses=mapping.n_buses)
+    logger.info("  buses:  {duration:.3f} s", duration=duration_buses)
+    logger.info("  reduce: {duration:.3f} s", duration=duration_reduce)
+    logger.info(
+        "  adjacency: {full:.3f} s node-breaker, {reduced:.3f} s bus-branch",
+        full=durations[0],
+        reduced=durations[1],
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
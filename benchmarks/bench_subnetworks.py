@@ -0,0 +1,49 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Measure the split of a topology into subnetworks per voltage level and the creation of their cycle basis.
+
+The end of each feeder of the synthetic grid but the first is tied to its start by a line, which turns it into a
+ring. Run with `python -m benchmarks.bench_subnetworks [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import FEEDER_SIZE
+from benchmarks.grid import synthetic_topology
+
+
+def main(n_elements: int = 300_000) -> None:
+    topology = synthetic_topology(n_elements)
+    branch = topology.branches[0]
+    n_nodes = len(topology.nodes) - 1
+    ties = tuple(
+        branch.model_copy(update={"name": f"Tie_{i}", "node_1": f"N_{i - 1}", "node_2": f"N_{i - FEEDER_SIZE}"})
+        for i in range(2 * FEEDER_SIZE, n_nodes + 1, FEEDER_SIZE)
+    )
+    topology = topology.model_copy(update={"branches": topology.branches + ties})
+    _ = topology.adjacency
+    start = time.perf_counter()
+    result = topology.subnetworks
+    duration = time.perf_counter() - start
+    start = time.perf_counter()
+    cycles = [result.cycle_basis(s) for s in result.meshed]
+    duration_cycles = time.perf_counter() - start
+    logger.info(
+        "{n_nodes} nodes, {n} subnetworks, {n_cycles} cycles: subnetworks {duration:.3f} s, cycle basis {cycles:.3f} s",
+        n_nodes=len(topology.nodes),
+        n=result.n_subnetworks,
+        n_cycles=sum(len(c) for c in cycles),
+        duration=duration,
+        cycles=duration_cycles,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
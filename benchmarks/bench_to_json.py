@@ -0,0 +1,49 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare the single pass writer of `to_json` with the former dump/loads/dump round trip.
+
+Run with `python -m benchmarks.bench_to_json [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+import tempfile
+import typing as t
+
+from loguru import logger
+
+from benchmarks.grid import measure
+from benchmarks.grid import synthetic_topology
+
+if t.TYPE_CHECKING:
+    from psdm.base import _Base
+
+
+def legacy_to_json(model: _Base, file_path: pathlib.Path, indent: int = 2) -> None:
+    with file_path.open("w+", encoding="utf-8") as file_handle:
+        _json_data = model.model_dump_json()
+        _data = json.loads(_json_data)
+        json.dump(_data, file_handle, indent=indent, sort_keys=True)
+
+
+def main(n_elements: int = 100_000) -> None:
+    topology = synthetic_topology(n_elements)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = pathlib.Path(tmp_dir) / "legacy.json"
+        new_path = pathlib.Path(tmp_dir) / "new.json"
+        legacy_time, legacy_peak = measure(lambda: legacy_to_json(topology, legacy_path))
+        new_time, new_peak = measure(lambda: topology.to_json(new_path))
+        identical = legacy_path.read_bytes() == new_path.read_bytes()
+
+    logger.info("Elements: {n}, byte-identical output: {identical}", n=n_elements, identical=identical)
+    logger.info("legacy: {t:.2f} s, peak {m:.1f} MiB", t=legacy_time, m=legacy_peak)
+    logger.info("single pass: {t:.2f} s, peak {m:.1f} MiB", t=new_time, m=new_peak)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,41 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare loading a topology from JSON with validation and in trusted mode with and without a validated sample.
+
+Run with `python -m benchmarks.bench_trusted [n_elements] [sample]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+from psdm.topology.topology import Topology
+
+
+def main(n_elements: int = 300_000, sample: float = 0.01) -> None:
+    topology = synthetic_topology(n_elements)
+    json_str = topology.model_dump_json()
+
+    def load(**kwargs: float | bool) -> float:
+        start = time.perf_counter()
+        Topology.from_json(json_str, **kwargs)  # type: ignore[arg-type]
+        return time.perf_counter() - start
+
+    logger.info("loading {n} elements from json:", n=n_elements)
+    logger.info("  validated: {duration:.3f} s", duration=load())
+    logger.info("  trusted: {duration:.3f} s", duration=load(trusted=True))
+    logger.info(
+        "  trusted, {share:.1%} validated: {duration:.3f} s",
+        share=sample,
+        duration=load(trusted=True, sample=sample),
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]), *map(float, sys.argv[2:3]))
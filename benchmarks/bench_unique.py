@@ -0,0 +1,49 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare the uniqueness validation of element tuples by hashing whole models and by keying on names.
+
+Both checks run on freshly decoded copies of a topology, so no hash is cached. Run with
+`python -m benchmarks.bench_unique [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import typing as t
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_topology
+from psdm.base import _validate_unique_list
+from psdm.storage.json_stream import TOPOLOGY_SECTIONS
+from psdm.topology.topology import Topology
+
+
+def main(n_elements: int = 300_000) -> None:
+    topology = synthetic_topology(n_elements)
+    data = topology.to_bytes()
+
+    def check(func: t.Callable[[tuple], object]) -> float:
+        fresh = Topology.from_bytes(data)
+        start = time.perf_counter()
+        for section in TOPOLOGY_SECTIONS:
+            func(getattr(fresh, section))
+        return time.perf_counter() - start
+
+    legacy = check(lambda v: len(v) != len(set(v)))
+    by_name = check(_validate_unique_list)
+    json_str = topology.model_dump_json()
+    start = time.perf_counter()
+    Topology.model_validate_json(json_str)
+    load = time.perf_counter() - start
+    logger.info("uniqueness of {n} elements:", n=sum(len(getattr(topology, s)) for s in TOPOLOGY_SECTIONS))
+    logger.info("  hashing models: {duration:.3f} s", duration=legacy)
+    logger.info("  keyed on names: {duration:.3f} s", duration=by_name)
+    logger.info("  loading the topology from json: {duration:.3f} s", duration=load)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
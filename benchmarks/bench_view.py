@@ -0,0 +1,62 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare effective-topology views of contingencies with copies of the topology without the disabled elements.
+
+Run with `python -m benchmarks.bench_view [n_elements] [n_variants]`.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+
+from loguru import logger
+
+from benchmarks.grid import measure
+from benchmarks.grid import synthetic_topology
+from psdm.meta import Meta
+from psdm.topology_case.case import Case
+from psdm.topology_case.element_state import ElementState
+
+
+def main(n_elements: int = 300_000, n_variants: int = 100) -> None:
+    topology = synthetic_topology(n_elements)
+    meta = Meta(grid="synthetic", date=dt.date(2025, 1, 1))
+    step = max(len(topology.branches) // n_variants, 1)
+    cases = [
+        Case(meta=meta, elements=(ElementState(name=branch.name, disabled=True),))
+        for branch in topology.branches[::step][:n_variants]
+    ]
+    _ = topology.adjacency, topology.branches_by_name
+
+    def copies() -> list:
+        return [
+            case.apply(topology).to_topology().model_copy(deep=True)  # what rebuilding a topology per case amounts to
+            for case in cases
+        ]
+
+    def views() -> list:
+        result = []
+        for case in cases:
+            view = case.apply(topology)
+            _ = view.branches, view.branches_by_name, view.edge_blocked
+            result.append(view)
+
+        return result
+
+    for name, func in (("copies", copies), ("views", views)):
+        duration, peak = measure(func)
+        logger.info(
+            "{name}: {n} variants of {n_elements} elements in {duration:.3f} s, peak {peak:.1f} MiB",
+            name=name,
+            n=len(cases),
+            n_elements=n_elements,
+            duration=duration,
+            peak=peak,
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,52 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compare encoding and decoding of a steadystate case with pickle, JSON and the binary wire format.
+
+Run with `python -m benchmarks.bench_wire [n_elements]`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import timeit
+import typing as t
+
+from loguru import logger
+
+from benchmarks.grid import synthetic_case
+from benchmarks.grid import synthetic_topology
+from psdm.steadystate_case.case import Case
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+REPEAT = 5
+
+
+def best(func: cabc.Callable[[], object]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def main(n_elements: int = 100_000) -> None:
+    case = synthetic_case(synthetic_topology(n_elements))
+    formats: dict[str, tuple[cabc.Callable[[], t.Any], cabc.Callable[[t.Any], object]]] = {
+        "pickle": (lambda: pickle.dumps(case, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "json": (case.model_dump_json, Case.model_validate_json),
+        "wire": (case.to_bytes, Case.from_bytes),
+    }
+    for name, (encode, decode) in formats.items():
+        data = encode()
+        logger.info(
+            "{name:>6}: {size:6.1f} MiB, encode {encode:.3f} s, decode {decode:.3f} s",
+            name=name,
+            size=len(data) / 2**20,
+            encode=best(encode),
+            decode=best(lambda: decode(data)),  # noqa: B023
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,191 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import datetime as dt
+import time
+import tracemalloc
+import typing as t
+
+from psdm.base import VoltageSystemType
+from psdm.meta import Meta
+from psdm.quantities.multi_phase import ActivePower as ActivePowerSet
+from psdm.quantities.multi_phase import ApparentPower as ApparentPowerSet
+from psdm.quantities.multi_phase import CosPhi
+from psdm.quantities.multi_phase import Phase
+from psdm.quantities.multi_phase import PhaseConnections
+from psdm.quantities.multi_phase import ReactivePower as ReactivePowerSet
+from psdm.quantities.multi_phase import Voltage as VoltageSet
+from psdm.quantities.single_phase import AdmittancePosSeq
+from psdm.quantities.single_phase import ApparentPower
+from psdm.quantities.single_phase import Current
+from psdm.quantities.single_phase import ImpedancePosSeq
+from psdm.quantities.single_phase import SystemType as QSystemType
+from psdm.quantities.single_phase import Voltage
+from psdm.steadystate_case.active_power import ActivePower
+from psdm.steadystate_case.case import Case
+from psdm.steadystate_case.controller import ControlPConst
+from psdm.steadystate_case.controller import ControlQConst
+from psdm.steadystate_case.controller import PController
+from psdm.steadystate_case.controller import QController
+from psdm.steadystate_case.external_grid import ExternalGrid as SSCExternalGrid
+from psdm.steadystate_case.load import Load as SSCLoad
+from psdm.steadystate_case.reactive_power import ReactivePower
+from psdm.steadystate_case.transformer import Transformer as SSCTransformer
+from psdm.topology.branch import Branch
+from psdm.topology.branch import BranchType
+from psdm.topology.external_grid import ExternalGrid
+from psdm.topology.external_grid import GridType
+from psdm.topology.load import Load
+from psdm.topology.load import LoadType
+from psdm.topology.load import RatedPower
+from psdm.topology.load import SystemType
+from psdm.topology.load_model import LoadModel
+from psdm.topology.node import Node
+from psdm.topology.topology import Topology
+from psdm.topology.transformer import Transformer
+from psdm.topology.transformer import VectorGroup
+from psdm.topology.windings import Winding
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+PHASES = (Phase.A, Phase.B, Phase.C)
+FEEDER_SIZE = 100
+
+
+def synthetic_topology(n_elements: int = 100_000) -> Topology:
+    """Build a grid of roughly `n_elements` elements: MV feeders of `FEEDER_SIZE` nodes below one HV node.
+
+    Every node of a feeder carries one load and is connected to its predecessor by a line. Each feeder is supplied by
+    a transformer from the HV node, the HV node by a slack external grid.
+    """
+    n_nodes = max(n_elements // 3, FEEDER_SIZE)
+    u_mv = Voltage(value=20000, system_type=QSystemType.NATURAL)
+    node = Node(name="HV", u_n=Voltage(value=110000, system_type=QSystemType.NATURAL), phases=PHASES)
+    branch = Branch(
+        name="",
+        node_1="",
+        node_2="",
+        phases_1=PHASES,
+        phases_2=PHASES,
+        u_n=u_mv,
+        i_r=Current(value=400, system_type=QSystemType.NATURAL),
+        type=BranchType.LINE,
+        voltage_system_type=VoltageSystemType.AC,
+        r1=ImpedancePosSeq(value=0.1),
+        x1=ImpedancePosSeq(value=0.2),
+        g1=AdmittancePosSeq(value=0),
+        b1=AdmittancePosSeq(value=0.0001),
+    )
+    load = Load(
+        name="",
+        node="",
+        rated_power=RatedPower.from_apparent_power(
+            ApparentPowerSet(value=(10000, 10000, 10000)),
+            CosPhi(value=(0.9, 0.9, 0.9)),
+        ),
+        active_power_model=LoadModel(u_0=VoltageSet(value=(230, 230, 230))),
+        reactive_power_model=LoadModel(u_0=VoltageSet(value=(230, 230, 230))),
+        phase_connections=PhaseConnections(value=((Phase.A, Phase.N), (Phase.B, Phase.N), (Phase.C, Phase.N))),
+        type=LoadType.CONSUMER,
+        system_type=SystemType.FIXED_CONSUMPTION,
+        voltage_system_type=VoltageSystemType.AC,
+    )
+    winding = Winding(
+        node="",
+        s_r=ApparentPower(value=40e6, system_type=QSystemType.NATURAL),
+        u_n=u_mv,
+        u_r=u_mv,
+        r1=ImpedancePosSeq(value=0.5),
+        x1=ImpedancePosSeq(value=5),
+    )
+
+    nodes = [node]
+    branches = []
+    loads = []
+    transformers = []
+    for i in range(n_nodes):
+        name = f"N_{i}"
+        nodes.append(node.model_copy(update={"name": name, "u_n": u_mv}))
+        loads.append(load.model_copy(update={"name": f"Load_{i}", "node": name}))
+        if i % FEEDER_SIZE:
+            branches.append(branch.model_copy(update={"name": f"L_{i}", "node_1": f"N_{i - 1}", "node_2": name}))
+            continue
+
+        transformers.append(
+            Transformer(
+                name=f"T_{i}",
+                node_1="HV",
+                node_2=name,
+                phases_1=PHASES,
+                phases_2=PHASES,
+                number=1,
+                vector_group=VectorGroup.YNd5,
+                windings=(winding.model_copy(update={"node": "HV"}), winding.model_copy(update={"node": name})),
+                r_fe1=ImpedancePosSeq(value=1e5),
+                x_h1=ImpedancePosSeq(value=1e6),
+            ),
+        )
+
+    external_grid = ExternalGrid(
+        name="ExtGrid",
+        node="HV",
+        description=None,
+        phases=PHASES,
+        short_circuit_power_max=ApparentPower(value=1e9, system_type=QSystemType.NATURAL),
+        short_circuit_power_min=ApparentPower(value=5e8, system_type=QSystemType.NATURAL),
+        type=GridType.SL,
+    )
+    return Topology(
+        meta=Meta(grid="synthetic", date=dt.date(2025, 1, 1)),
+        branches=tuple(branches),
+        nodes=tuple(nodes),
+        loads=tuple(loads),
+        transformers=tuple(transformers),
+        external_grids=(external_grid,),
+    )
+
+
+def synthetic_case(topology: Topology) -> Case:
+    """Build a steadystate case of a topology with constant, individual P and Q setpoints of all loads."""
+    return Case(
+        meta=topology.meta,
+        loads=tuple(
+            SSCLoad(
+                name=load.name,
+                active_power=ActivePower(
+                    controller=PController(
+                        node_target=load.node,
+                        control_type=ControlPConst(p_set=ActivePowerSet(value=(3000 + i % 100,) * 3)),
+                    ),
+                ),
+                reactive_power=ReactivePower(
+                    controller=QController(
+                        node_target=load.node,
+                        control_type=ControlQConst(q_set=ReactivePowerSet(value=(1000 + i % 100,) * 3)),
+                    ),
+                ),
+            )
+            for i, load in enumerate(topology.loads)
+        ),
+        transformers=tuple(SSCTransformer(name=e.name, tap_pos=0) for e in topology.transformers),
+        external_grids=tuple(
+            SSCExternalGrid(name=e.name, u_0=VoltageSet(value=(63508.5, 63508.5, 63508.5)))
+            for e in topology.external_grids
+        ),
+    )
+
+
+def measure(func: cabc.Callable[[], object]) -> tuple[float, float]:
+    """Return the wall time in s and the peak of traced memory in MiB of a call."""
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 2**20
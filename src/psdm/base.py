@@ -4,10 +4,14 @@
 
 from __future__ import annotations
 
+import bz2
 import enum
+import gzip
 import json
+import lzma
 import pathlib
 import sys
+import types
 import typing as t
 import warnings
 
@@ -15,16 +19,60 @@ import annotated_types
 import pydantic
 from pydantic_core import PydanticCustomError
 
+from psdm.storage import trusted as trusted_json
+from psdm.storage import wire
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
 T = t.TypeVar("T")
 U = t.TypeVar("U", bound=t.Hashable)
+B = t.TypeVar("B", bound="_Base")
 PrimitiveTypes = str | bool | int | float
+_HASH = "__hash__"  # key of the cached hash in the instance __dict__, which can not clash with a field name
+
+
+def _duplicates(v: tuple[U]) -> list[str]:
+    """Return the names of duplicated elements, or their positions for elements without a name.
+
+    Elements with a name are grouped by name first, so only elements sharing a name are compared with each other
+    instead of hashing every element including all nested models.
+    """
+    if not v or not isinstance(v[0], _Base) or "name" not in type(v[0]).__pydantic_fields__:
+        if len(v) == len(set(v)):
+            return []
+
+        seen: set[U] = set()
+        positions = []
+        for i, e in enumerate(v):
+            if e in seen:
+                positions.append(f"item {i}")
+            seen.add(e)
+
+        return positions
+
+    keys = [getattr(e, "name", None) for e in v]
+    if len(keys) == len(set(keys)):
+        return []
+
+    groups: dict[t.Any, list[U]] = {}
+    duplicated: dict[str, None] = {}
+    for key, e in zip(keys, v, strict=True):
+        group = groups.setdefault(key, [])
+        if any(other == e for other in group):
+            duplicated[str(key)] = None
+        else:
+            group.append(e)
+
+    return list(duplicated)
 
 
 def _validate_unique_list(v: tuple[U]) -> tuple[U]:
-    if len(v) != len(set(v)):
+    duplicates = _duplicates(v)
+    if duplicates:
         error_type = "unique_list"
-        message_template = "List must be unique"
-        raise PydanticCustomError(error_type, message_template)
+        message_template = "List must be unique, duplicated: {duplicates}"
+        raise PydanticCustomError(error_type, message_template, {"duplicates": ", ".join(duplicates)})
     return v
 
 
@@ -41,8 +89,51 @@ UniqueNonEmptyTuple = t.Annotated[
 ]
 NonEmptyTuple = t.Annotated[tuple[T, ...], annotated_types.Len(1, sys.maxsize)]
 
+COMPRESSIONS: dict[str, t.Callable[..., t.IO]] = {".gz": gzip.open, ".xz": lzma.open, ".bz2": bz2.open}
+MAGIC_NUMBERS: dict[bytes, t.Callable[..., t.IO]] = {
+    b"\x1f\x8b": gzip.open,
+    b"\xfd7zXZ\x00": lzma.open,
+    b"BZh": bz2.open,
+}
+
+
+def open_file(file_path: str | pathlib.Path, mode: str = "r", newline: str | None = None) -> t.IO:
+    """Open a file and transparently (de)compress gzip, xz and bz2.
+
+    Compressed files are detected by their magic number when reading and by their suffix when writing. The data is
+    (de)compressed while streaming, no temporary decompressed file is created. Whether the decompressed data is held in
+    memory at once depends on the reader, e.g. `Base.from_file` reads it completely.
+    """
+    file_path = pathlib.Path(file_path)
+    if "r" in mode:
+        with file_path.open("rb") as file_handle:
+            header = file_handle.read(max(len(e) for e in MAGIC_NUMBERS))
+        _open = next((v for k, v in MAGIC_NUMBERS.items() if header.startswith(k)), None)
+    else:
+        _open = COMPRESSIONS.get(file_path.suffix.lower())
+
+    if "b" in mode:
+        return file_path.open(mode) if _open is None else _open(file_path, mode)
+
+    if _open is None:
+        return file_path.open(mode, encoding="utf-8", newline=newline)
+
+    return _open(file_path, mode.replace("+", "") + "t", encoding="utf-8", newline=newline)
+
+
+def name_index(elements: cabc.Iterable[B]) -> cabc.Mapping[str, B]:
+    """Build an immutable mapping of element name to element."""
+    return types.MappingProxyType({e.name: e for e in elements})  # type: ignore[attr-defined]
+
 
 class _Base(pydantic.BaseModel):
+    """Base of all models.
+
+    Derived data, e.g. name indexes, is cached via `functools.cached_property` in the instance `__dict__`. As models
+    are frozen the cache never becomes outdated. It is not copied by `model_copy`, not pickled and not part of the
+    iteration over the fields, e.g. `dict(model)`.
+    """
+
     model_config = {
         "frozen": True,
         "use_enum_values": True,
@@ -50,24 +141,136 @@ class _Base(pydantic.BaseModel):
         "ser_json_inf_nan": "constants",
     }
 
+    def __hash__(self) -> int:
+        # hashing is recursive through all nested models, so the hash is cached like other derived data
+        try:
+            return self.__dict__[_HASH]
+        except KeyError:
+            data = self.__dict__
+            value = data[_HASH] = hash(tuple([data[name] for name in type(self).__pydantic_fields__]))
+            return value
+
+    def __iter__(self) -> cabc.Generator[tuple[str, t.Any], None, None]:
+        # only fields and extra values, not the derived data cached in the instance __dict__
+        data = self.__dict__
+        for name in type(self).__pydantic_fields__:
+            yield name, data[name]
+
+        if self.__pydantic_extra__:
+            yield from self.__pydantic_extra__.items()
+
+    def _drop_cache(self) -> None:
+        if len(self.__dict__) > len(type(self).model_fields):
+            for name in self.__dict__.keys() - type(self).model_fields.keys():
+                del self.__dict__[name]
+
+    def model_copy(self: B, *, update: cabc.Mapping[str, t.Any] | None = None, deep: bool = False) -> B:  # noqa: PYI019
+        copied = super().model_copy(update=update, deep=deep)
+        copied._drop_cache()  # noqa: SLF001
+        return copied
+
+    def __getstate__(self) -> dict[t.Any, t.Any]:
+        state = super().__getstate__()
+        fields = type(self).model_fields
+        if len(self.__dict__) > len(fields):
+            state["__dict__"] = {k: v for k, v in self.__dict__.items() if k in fields}
+
+        return state
+
     @classmethod
-    def from_file(cls, file_path: str | pathlib.Path) -> _Base:
-        file_path = pathlib.Path(file_path)
-        with file_path.open("r", encoding="utf-8") as file_handle:
-            return cls.model_validate_json(file_handle.read())
+    def from_file(
+        cls,
+        file_path: str | pathlib.Path,
+        *,
+        trusted: bool = False,
+        sample: float = 0.0,
+        seed: int | None = None,
+    ) -> _Base:
+        """Load the model from a JSON file, see `from_json` for the trusted mode.
+
+        The whole decompressed document is read into memory, see `psdm.storage.json_stream.read_topology` to read a
+        large topology with bounded memory.
+        """
+        with open_file(file_path, "rb") as file_handle:
+            return cls.from_json(file_handle.read(), trusted=trusted, sample=sample, seed=seed)
 
     def to_json(self, file_path: str | pathlib.Path, indent: int = 2) -> None:
         file_path = pathlib.Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open("w+", encoding="utf-8") as file_handle:
-            _json_data = self.model_dump_json()
-            _data = json.loads(_json_data)
-            json.dump(_data, file_handle, indent=indent, sort_keys=True)
+        with open_file(file_path, "w+") as file_handle:
+            file_handle.writelines(self.iter_json(indent=indent))
+
+    def iter_json(self, indent: int = 2) -> cabc.Iterator[str]:
+        """Encode the model as sorted and indented JSON in chunks.
+
+        Tuples of models, e.g. the elements of a topology, are dumped one element at a time, so only a single element
+        is held in its serialized form at once. The output is the same as `json.dumps(..., indent=indent, sort_keys=True)`
+        applied to the dumped model.
+        """
+        encoder = json.JSONEncoder(indent=indent, sort_keys=True)
+        newline = "\n" + " " * indent
+        element_newline = newline + " " * indent
+        fields = {name: getattr(self, name) for name in type(self).model_fields}
+        streamed = {
+            name
+            for name, value in fields.items()
+            if isinstance(value, tuple) and value and all(isinstance(e, _Base) for e in value)
+        }
+        data = self.model_dump(mode="json", exclude=streamed)
+        keys = sorted(data.keys() | streamed)
+        if not keys:
+            yield "{}"
+            return
+
+        yield "{"
+        for i, key in enumerate(keys):
+            yield ("," if i else "") + newline + encoder.encode(key) + ": "
+            if key not in streamed:
+                yield encoder.encode(data[key]).replace("\n", newline)
+                continue
+
+            yield "["
+            for j, element in enumerate(getattr(self, key)):
+                _data = element.model_dump(mode="json")
+                yield ("," if j else "") + element_newline + encoder.encode(_data).replace("\n", element_newline)
+
+            yield newline + "]"
+
+        yield "\n}"
 
     @classmethod
-    def from_json(cls, json_str: str) -> _Base:
+    def from_json(
+        cls,
+        json_str: str | bytes,
+        *,
+        trusted: bool = False,
+        sample: float = 0.0,
+        seed: int | None = None,
+    ) -> _Base:
+        """Load the model from JSON.
+
+        With `trusted=True` the model is built without running any validator, which is about twice as fast, for data
+        that was validated before, e.g. written by `to_json`. A random share `sample` of the elements of each section,
+        e.g. 0.01 for 1 %, is validated nevertheless, `seed` makes the sample reproducible. See `psdm.storage.trusted`.
+        """
+        if trusted:
+            return trusted_json.load(cls, json_str, sample=sample, seed=seed)
+
         return cls.model_validate_json(json_str)
 
+    def to_bytes(self) -> bytes:
+        """Encode the model in the compact binary format of `psdm.storage.wire`, e.g. to pass it to worker processes."""
+        return wire.encode(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> _Base:
+        model = wire.decode(data)
+        if not isinstance(model, cls):
+            msg = f"Data does not contain a {cls.__name__} but a {type(model).__name__}."
+            raise TypeError(msg)
+
+        return model
+
 
 def validate_deprecated(self: U, attr_dpr: str, attr_new: str) -> U:
     if getattr(self, attr_dpr) is not None:
@@ -0,0 +1,135 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Referential integrity of node references and phases.
+
+Model validation checks each element on its own. These checks verify that elements refer to existing nodes and are
+connected to phases the node has, using the name index of the nodes, so they take linear time. Phase connections of
+loads may refer to neutral and earth, which need not be phases of the node.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import typing as t
+
+from loguru import logger
+
+from psdm.quantities.multi_phase import Phase
+from psdm.steadystate_case.controller import ControlCosPhiU
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.steadystate_case.case import Case as SteadystateCase
+    from psdm.topology.node import Node
+    from psdm.topology.topology import Topology
+
+REFERENCE_PHASES = frozenset({Phase.N.value, Phase.E.value})
+
+
+@dataclasses.dataclass(frozen=True)
+class Violation:
+    """Reference of an element attribute that does not resolve."""
+
+    element: str
+    attribute: str
+    message: str
+
+
+@dataclasses.dataclass(frozen=True)
+class IntegrityReport:
+    """All integrity violations found, in the order of the elements."""
+
+    violations: tuple[Violation, ...] = ()
+
+    def __bool__(self) -> bool:
+        return self.is_valid
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.violations
+
+    def log(self) -> None:
+        for violation in self.violations:
+            logger.error(
+                "{element}.{attribute}: {message}",
+                element=violation.element,
+                attribute=violation.attribute,
+                message=violation.message,
+            )
+
+
+class _Checker:
+    def __init__(self, nodes: cabc.Mapping[str, Node]) -> None:
+        self.nodes = nodes
+        self.violations: list[Violation] = []
+
+    def node(self, element: str, attribute: str, name: str) -> Node | None:
+        node = self.nodes.get(name)
+        if node is None:
+            self.violations.append(Violation(element, attribute, f"Node {name} does not exist."))
+
+        return node
+
+    def phases(self, element: str, attribute: str, node: Node | None, phases: cabc.Iterable[Phase]) -> None:
+        if node is None:
+            return
+
+        missing = [phase for phase in phases if phase not in node.phases]
+        if missing:
+            msg = f"Phases {', '.join(map(str, missing))} are not phases of node {node.name}."
+            self.violations.append(Violation(element, attribute, msg))
+
+    def report(self) -> IntegrityReport:
+        return IntegrityReport(tuple(self.violations))
+
+
+def check_topology(topology: Topology) -> IntegrityReport:
+    """Check the node references and phases of branches, transformers, loads and external grids."""
+    checker = _Checker(topology.nodes_by_name)
+    for branch in topology.branches:
+        node_1 = checker.node(branch.name, "node_1", branch.node_1)
+        node_2 = checker.node(branch.name, "node_2", branch.node_2)
+        checker.phases(branch.name, "phases_1", node_1, branch.phases_1)
+        checker.phases(branch.name, "phases_2", node_2, branch.phases_2)
+
+    for transformer in topology.transformers:
+        node_1 = checker.node(transformer.name, "node_1", transformer.node_1)
+        node_2 = checker.node(transformer.name, "node_2", transformer.node_2)
+        checker.phases(transformer.name, "phases_1", node_1, transformer.phases_1)
+        checker.phases(transformer.name, "phases_2", node_2, transformer.phases_2)
+        for i, winding in enumerate(transformer.windings):
+            if winding.node not in {transformer.node_1, transformer.node_2}:
+                checker.node(transformer.name, f"windings[{i}].node", winding.node)
+
+    for load in topology.loads:
+        node = checker.node(load.name, "node", load.node)
+        phases = dict.fromkeys(
+            phase for connection in load.phase_connections.value if connection is not None for phase in connection
+        )
+        checker.phases(load.name, "phase_connections", node, (p for p in phases if p not in REFERENCE_PHASES))
+
+    for external_grid in topology.external_grids:
+        node = checker.node(external_grid.name, "node", external_grid.node)
+        checker.phases(external_grid.name, "phases", node, external_grid.phases)
+
+    return checker.report()
+
+
+def check_steadystate_case(case: SteadystateCase, topology: Topology) -> IntegrityReport:
+    """Check the nodes referenced by the controllers of the loads of a steadystate case against a topology.
+
+    Whether the elements of the case are part of the topology is checked by `SteadystateCase.match_topology`.
+    """
+    checker = _Checker(topology.nodes_by_name)
+    for load in case.loads:
+        for attribute, power in (("active_power", load.active_power), ("reactive_power", load.reactive_power)):
+            controller = power.controller
+            checker.node(load.name, f"{attribute}.controller.node_target", controller.node_target)
+            if isinstance(controller.control_type, ControlCosPhiU):
+                node_ref_u = controller.control_type.node_ref_u
+                checker.node(load.name, f"{attribute}.controller.control_type.node_ref_u", node_ref_u)
+
+    return checker.report()
@@ -0,0 +1,115 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import types
+import typing as t
+
+from loguru import logger
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+SECTION_NAMES = {
+    "loads": "Load",
+    "transformers": "Transformer",
+    "external_grids": "External grid",
+    "elements": "Element",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class SectionDiff:
+    """Element names of a case section that do not match the topology."""
+
+    missing: tuple[str, ...] = ()  # in the topology but not in the case
+    extra: tuple[str, ...] = ()  # in the case but not in the topology
+    duplicated: tuple[str, ...] = ()  # more than once in the case
+
+    def __bool__(self) -> bool:
+        return bool(self.missing or self.extra or self.duplicated)
+
+    @classmethod
+    def compare(
+        cls,
+        names: cabc.Sequence[str],
+        reference: cabc.Set[str],
+        *,
+        check_missing: bool = True,
+    ) -> SectionDiff:
+        unique = set(names)
+        duplicated: tuple[str, ...] = ()
+        if len(unique) != len(names):
+            duplicated = tuple(name for name, count in collections.Counter(names).items() if count > 1)
+
+        return cls(
+            missing=tuple(sorted(reference - unique)) if check_missing else (),
+            extra=tuple(sorted(unique - reference)),
+            duplicated=duplicated,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class MatchReport:
+    """Result of matching a case against a topology.
+
+    In fail-fast mode matching stops at the metadata or at the first section with a difference, so later sections are
+    not contained.
+    """
+
+    case_type: str
+    meta_matches: bool
+    sections: cabc.Mapping[str, SectionDiff] = dataclasses.field(default_factory=lambda: types.MappingProxyType({}))
+
+    def __bool__(self) -> bool:
+        return self.is_match
+
+    @property
+    def is_match(self) -> bool:
+        return self.meta_matches and not any(self.sections.values())
+
+    def log(self) -> None:
+        if not self.meta_matches:
+            logger.error("Metadata does not match.")
+
+        for section, diff in self.sections.items():
+            name = SECTION_NAMES[section]
+            for element in diff.missing:
+                logger.error(
+                    "{name} {element_name} is not in {case_type}.",
+                    name=name,
+                    element_name=element,
+                    case_type=self.case_type,
+                )
+            for element in diff.extra:
+                logger.error("{name} {element_name} is not in topology.", name=name, element_name=element)
+            for element in diff.duplicated:
+                logger.error(
+                    "{name} {element_name} is duplicated in {case_type}.",
+                    name=name,
+                    element_name=element,
+                    case_type=self.case_type,
+                )
+
+
+def match_sections(
+    case_type: str,
+    meta_matches: bool,  # noqa: FBT001
+    sections: cabc.Iterable[tuple[str, cabc.Sequence[str], cabc.Set[str]]],
+    *,
+    check_missing: bool = True,
+    fail_fast: bool = False,
+) -> MatchReport:
+    """Compare the element names of each case section with the reference names of the topology."""
+    diffs: dict[str, SectionDiff] = {}
+    if meta_matches or not fail_fast:
+        for section, names, reference in sections:
+            diffs[section] = SectionDiff.compare(names, reference, check_missing=check_missing)
+            if fail_fast and diffs[section]:
+                break
+
+    return MatchReport(case_type=case_type, meta_matches=meta_matches, sections=types.MappingProxyType(diffs))
@@ -4,18 +4,26 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from psdm.base import Base
 from psdm.base import UniqueTuple
+from psdm.base import name_index
+from psdm.integrity import check_steadystate_case
+from psdm.matching import match_sections
 from psdm.meta import Meta
 from psdm.steadystate_case.external_grid import ExternalGrid
 from psdm.steadystate_case.load import Load
 from psdm.steadystate_case.transformer import Transformer
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from psdm.integrity import IntegrityReport
+    from psdm.matching import MatchReport
     from psdm.topology.topology import Topology
 
 
@@ -30,83 +38,39 @@ class Case(Base):
     transformers: UniqueTuple[Transformer]
     external_grids: UniqueTuple[ExternalGrid]
 
-    def matches_topology(self, topology: Topology) -> bool:
+    @functools.cached_property
+    def loads_by_name(self) -> Mapping[str, Load]:
+        return name_index(self.loads)
+
+    @functools.cached_property
+    def transformers_by_name(self) -> Mapping[str, Transformer]:
+        return name_index(self.transformers)
+
+    @functools.cached_property
+    def external_grids_by_name(self) -> Mapping[str, ExternalGrid]:
+        return name_index(self.external_grids)
+
+    def matches_topology(self, topology: Topology, *, fail_fast: bool = True) -> bool:
         logger.info("Verifying steadystate case ...")
-        if topology.meta != self.meta:
-            logger.error("Metadata does not match.")
-            return False
-
-        if not self._is_proper_element_number(topology):
-            return False
-
-        if not self._is_proper_elements(topology):
-            return False
-
-        logger.info("Verifying steadystate case was successful.")
-        return True
-
-    def _is_proper_element_number(self, topology: Topology) -> bool:
-        if len(self.loads) != len(topology.loads):
-            logger.error(
-                "Number of loads does not match. Is {n_act}, should be {n_ref}.",
-                n_act=len(self.loads),
-                n_ref=len(topology.loads),
-            )
-            return False
-
-        if len(self.transformers) != len(topology.transformers):
-            logger.error(
-                "Number of transformers does not match. Is {n_act}, should be {n_ref}.",
-                n_act=len(self.transformers),
-                n_ref=len(topology.transformers),
-            )
-            return False
-
-        if len(self.external_grids) != len(topology.external_grids):
-            logger.error(
-                "Number of external grids does not match. Is {n_act}, should be {n_ref}.",
-                n_act=len(self.external_grids),
-                n_ref=len(topology.external_grids),
-            )
-            return False
-
-        return True
-
-    def _is_proper_elements(self, topology: Topology) -> bool:
-        if not self._is_proper_loads(topology):
-            return False
-
-        if not self._is_proper_transformers(topology):
-            return False
-
-        return self._is_proper_external_grids(topology)
-
-    def _is_proper_loads(self, topology: Topology) -> bool:
-        load_names = [e.name for e in self.loads]
-        for load in topology.loads:
-            if load.name not in load_names:
-                logger.error("Load {load_name} is not in steadystate case.", load_name=load.name)
-                return False
-
-        return True
-
-    def _is_proper_transformers(self, topology: Topology) -> bool:
-        transformer_names = [e.name for e in self.transformers]
-        for trafo in topology.transformers:
-            if trafo.name not in transformer_names:
-                logger.error("Transformer {trafo_name} is not in steadystate case.", trafo_name=trafo.name)
-                return False
-
-        return True
-
-    def _is_proper_external_grids(self, topology: Topology) -> bool:
-        external_grid_names = [e.name for e in self.external_grids]
-        for ext_grid in topology.external_grids:
-            if ext_grid.name not in external_grid_names:
-                logger.error(
-                    "External grid {ext_grid_name} is not in steadystate case.",
-                    ext_grid_name=ext_grid.name,
-                )
-                return False
-
-        return True
+        report = self.match_topology(topology, fail_fast=fail_fast)
+        report.log()
+        if report:
+            logger.info("Verifying steadystate case was successful.")
+
+        return report.is_match
+
+    def match_topology(self, topology: Topology, *, fail_fast: bool = False) -> MatchReport:
+        """Compare metadata and element names of loads, transformers and external grids with a topology."""
+        return match_sections(
+            "steadystate case",
+            topology.meta == self.meta,
+            (
+                (section, [e.name for e in getattr(self, section)], getattr(topology, f"{section}_by_name").keys())
+                for section in ("loads", "transformers", "external_grids")
+            ),
+            fail_fast=fail_fast,
+        )
+
+    def check_integrity(self, topology: Topology) -> IntegrityReport:
+        """Check that the controllers refer to existing nodes of the topology, see `psdm.integrity`."""
+        return check_steadystate_case(self, topology)
@@ -0,0 +1,163 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Validation that collects the errors of all elements instead of raising at the first invalid document.
+
+The document is scanned element by element and every element of a section, e.g. the loads of a topology, is validated
+on its own. Each error of an invalid element is reported as an `ErrorRecord` as soon as the element has been read, and
+the element is dropped. Elements equal to an earlier element of the same name are reported as duplicated and dropped
+as well. The model is built from the remaining elements, so it is a valid subset of the document.
+
+The other members, e.g. the metadata, are validated together with the model at the end. Without them there is no usable
+model, so their errors are reported and the `pydantic.ValidationError` is raised.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import typing as t
+
+import pydantic
+
+from psdm.base import open_file
+from psdm.storage.json_stream import CHUNK_SIZE
+from psdm.storage.json_stream import JsonScanner
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+    import pathlib
+
+M = t.TypeVar("M", bound=pydantic.BaseModel)
+
+
+@dataclasses.dataclass(frozen=True)
+class ErrorRecord:
+    """Error of a single element, or of the model itself if `section` is None."""
+
+    section: str | None
+    index: int | None  # position of the element in its section
+    element_type: str
+    name: str | None
+    field: str  # path of the invalid field, e.g. "rated_power.cos_phi.value[0]"
+    message: str
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self))
+
+
+def _field_path(loc: tuple[int | str, ...]) -> str:
+    path = ""
+    for part in loc:
+        path += f"[{part}]" if isinstance(part, int) else (f".{part}" if path else part)
+
+    return path
+
+
+def _records(
+    error: pydantic.ValidationError,
+    section: str | None,
+    index: int | None,
+    name: str | None,
+) -> cabc.Iterator[ErrorRecord]:
+    for e in error.errors(include_url=False):
+        yield ErrorRecord(section, index, error.title, name, _field_path(e["loc"]), e["msg"])
+
+
+def sections(model_type: type[pydantic.BaseModel]) -> dict[str, type[pydantic.BaseModel]]:
+    """Return the element types of the fields of a model class which are tuples of models, e.g. `Topology.loads`."""
+    result: dict[str, type[pydantic.BaseModel]] = {}
+    for name, field in model_type.model_fields.items():
+        if t.get_origin(field.annotation) is not tuple:
+            continue
+
+        element_type = t.get_args(field.annotation)[0]
+        if isinstance(element_type, type) and issubclass(element_type, pydantic.BaseModel):
+            result[name] = element_type
+
+    return result
+
+
+def _is_duplicate(groups: dict[t.Any, list[pydantic.BaseModel]], element: pydantic.BaseModel) -> bool:
+    # same grouping by name as the uniqueness check of the sections
+    group = groups.setdefault(getattr(element, "name", element), [])
+    if any(other == element for other in group):
+        return True
+
+    group.append(element)
+    return False
+
+
+def iter_errors(
+    model_type: type[M],
+    file_path: str | pathlib.Path,
+    chunk_size: int = CHUNK_SIZE,
+) -> cabc.Generator[ErrorRecord, None, M]:
+    """Yield the errors of all invalid elements of a JSON file while reading it.
+
+    The model of the valid elements is the return value of the generator, e.g. `model = yield from iter_errors(...)`,
+    see `load` for a plain function.
+    """
+    element_types = sections(model_type)
+    data: dict[str, t.Any] = {}
+    with open_file(file_path, newline="") as file_handle:
+        scanner = JsonScanner(file_handle, chunk_size=chunk_size)
+        for key in scanner.iter_members():
+            if key not in element_types:
+                data[key] = scanner.decode_value()
+                continue
+
+            element_type = element_types[key]
+            elements: list[pydantic.BaseModel] = []
+            groups: dict[t.Any, list[pydantic.BaseModel]] = {}
+            for i, value in enumerate(scanner.iter_array()):
+                name = value.get("name") if isinstance(value, dict) else None
+                name = name if isinstance(name, str) else None
+                try:
+                    element = element_type.model_validate(value)
+                except pydantic.ValidationError as e:
+                    yield from _records(e, key, i, name)
+                    continue
+
+                if _is_duplicate(groups, element):
+                    yield ErrorRecord(key, i, element_type.__name__, name, "", "Element is duplicated.")
+                else:
+                    elements.append(element)
+
+            data[key] = tuple(elements)
+
+    try:
+        return model_type.model_validate(data)
+    except pydantic.ValidationError as e:
+        yield from _records(e, None, None, None)
+        raise
+
+
+def _consume(records: cabc.Generator[ErrorRecord, None, M], on_error: cabc.Callable[[ErrorRecord], object]) -> M:
+    while True:
+        try:
+            record = next(records)
+        except StopIteration as stop:
+            return stop.value
+
+        on_error(record)
+
+
+def load(
+    model_type: type[M],
+    file_path: str | pathlib.Path,
+    report: str | pathlib.Path | cabc.Callable[[ErrorRecord], object] | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> M:
+    """Load the valid elements of a JSON file, writing the errors as JSON lines to a report file or passing them on.
+
+    `report` is either the path of the JSONL file, which may be compressed like the model files, or a callable which
+    receives each `ErrorRecord`. Without a report the errors are dropped.
+    """
+    records = iter_errors(model_type, file_path, chunk_size=chunk_size)
+    if report is None or callable(report):
+        return _consume(records, report if report is not None else lambda _: None)
+
+    with open_file(report, "w") as file_handle:
+        return _consume(records, lambda record: file_handle.write(record.to_json() + "\n"))
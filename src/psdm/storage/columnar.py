@@ -0,0 +1,304 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Columnar binary storage of topologies.
+
+A topology is stored as a zip archive with one table per element type. Every attribute path of an element, e.g.
+`r1.value` or `rated_power.cos_phi.value`, becomes one column:
+
+* `float`, `int` and `bool` columns are packed arrays of doubles, 64 bit integers and bytes,
+* `float_list` columns hold the values of multi phase quantities as packed doubles with row offsets,
+* `category` columns hold dictionary codes of any other JSON value, e.g. names, enums, units or phases.
+
+Columns which hold the same value for all rows, e.g. units and system types, are stored only in the table metadata.
+The `optional_data` of the elements is kept in a side table. All values are stored unrounded, so reading the archive
+back yields the same models.
+"""
+
+from __future__ import annotations
+
+import array
+import dataclasses
+import json
+import pathlib
+import sys
+import typing as t
+import zipfile
+
+from psdm.base import Base
+from psdm.base import _Base
+from psdm.storage.json_stream import TOPOLOGY_SECTIONS
+from psdm.topology.topology import Topology
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+FORMAT = "psdm-columnar"
+FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+
+ABSENT = -1  # code of a row which does not have the attribute at all, e.g. a field of another union member
+NONE = 0
+PRESENT = 1
+
+TYPECODES = {"float": "d", "int": "q", "bool": "b", "float_list": "d"}
+
+
+class _Absent: ...
+
+
+_ABSENT = _Absent()
+
+
+def raw(value: t.Any) -> t.Any:  # noqa: ANN401
+    """Convert a model into plain JSON data without applying any serializer, i.e. without rounding."""
+    if isinstance(value, _Base):
+        return {name: raw(getattr(value, name)) for name in type(value).model_fields}
+
+    if isinstance(value, (tuple, list)):
+        return [raw(e) for e in value]
+
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+
+    return str(value)
+
+
+def _flatten(model: _Base, prefix: str, row: dict[str, t.Any]) -> None:
+    for name in type(model).model_fields:
+        if not prefix and name == "optional_data":
+            continue
+
+        value = getattr(model, name)
+        if isinstance(value, _Base):
+            _flatten(value, prefix + name + ".", row)
+        else:
+            row[prefix + name] = value
+
+
+def _unflatten(row: cabc.Iterable[tuple[str, t.Any]]) -> dict[str, t.Any]:
+    data: dict[str, t.Any] = {}
+    for path, value in row:
+        *parents, name = path.split(".")
+        target = data
+        for parent in parents:
+            target = target.setdefault(parent, {})
+
+        target[name] = value
+
+    return data
+
+
+@dataclasses.dataclass(frozen=True)
+class Column:
+    """Raw column of an element table.
+
+    Depending on the `kind`, `values` holds packed numbers (`float`, `int`, `bool`, `float_list`) or dictionary codes
+    (`category`). `mask` marks rows with None (0) or without the attribute (-1), `offsets` delimits the rows of a
+    `float_list` column.
+    """
+
+    kind: str
+    n_rows: int
+    values: array.array | None = None
+    mask: array.array | None = None
+    offsets: array.array | None = None
+    dictionary: tuple[t.Any, ...] = ()
+
+    def __getitem__(self, i: int) -> t.Any:  # noqa: ANN401
+        if self.kind == "category":
+            if self.values is None:
+                return self.dictionary[0]
+
+            code = self.values[i]
+            return _ABSENT if code == ABSENT else self.dictionary[code]
+
+        if self.mask is not None and self.mask[i] != PRESENT:
+            return None if self.mask[i] == NONE else _ABSENT
+
+        if self.kind == "float_list":
+            return tuple(self.values[self.offsets[i] : self.offsets[i + 1]])  # type: ignore[index]
+
+        value = self.values[i]  # type: ignore[index]
+        return bool(value) if self.kind == "bool" else value
+
+    def to_list(self) -> list[t.Any]:
+        """Return the column as list of Python values with None for missing values."""
+        return [None if (v := self[i]) is _ABSENT else v for i in range(self.n_rows)]
+
+
+def _kind(values: list[t.Any]) -> str:
+    types = {type(v) for v in values if v is not None and v is not _ABSENT}
+    if types == {bool}:
+        return "bool"
+
+    if types == {int}:
+        return "int"
+
+    if types == {float}:
+        return "float"
+
+    if types == {tuple} and all(
+        isinstance(e, float) for v in values if isinstance(v, tuple) for e in v
+    ):  # multi phase quantity values
+        return "float_list"
+
+    return "category"
+
+
+def _encode_column(values: list[t.Any]) -> tuple[dict[str, t.Any], dict[str, bytes]]:
+    kind = _kind(values)
+    info: dict[str, t.Any] = {"kind": kind}
+    buffers: dict[str, bytes] = {}
+    if kind == "category":
+        codes: dict[str, int] = {}
+        column = array.array(
+            "i",
+            [ABSENT if v is _ABSENT else codes.setdefault(json.dumps(raw(v)), len(codes)) for v in values],
+        )
+        info["dictionary"] = [json.loads(e) for e in codes]
+        if len(codes) != 1 or ABSENT in column:
+            buffers["values"] = column.tobytes()
+
+        return info, buffers
+
+    if any(v is None or v is _ABSENT for v in values):
+        mask = array.array("b", [ABSENT if v is _ABSENT else NONE if v is None else PRESENT for v in values])
+        buffers["mask"] = mask.tobytes()
+
+    if kind == "float_list":
+        offsets = array.array("q", [0])
+        flat = array.array("d")
+        for v in values:
+            if isinstance(v, tuple):
+                flat.extend(v)
+
+            offsets.append(len(flat))
+
+        buffers["values"] = flat.tobytes()
+        buffers["offsets"] = offsets.tobytes()
+        return info, buffers
+
+    empty = False if kind == "bool" else 0
+    column = array.array(TYPECODES[kind], [empty if v is None or v is _ABSENT else v for v in values])
+    buffers["values"] = column.tobytes()
+    return info, buffers
+
+
+def _columns(elements: cabc.Sequence[_Base]) -> dict[str, list[t.Any]]:
+    columns: dict[str, list[t.Any]] = {}
+    for i, element in enumerate(elements):
+        row: dict[str, t.Any] = {}
+        _flatten(element, "", row)
+        for path, value in row.items():
+            column = columns.get(path)
+            if column is None:
+                column = columns[path] = [_ABSENT] * i
+
+            column.append(value)
+
+        for column in columns.values():
+            if len(column) == i:
+                column.append(_ABSENT)
+
+    return columns
+
+
+def write_columnar(
+    topology: Topology,
+    file_path: str | pathlib.Path,
+    compression: int = zipfile.ZIP_STORED,
+) -> None:
+    """Write a topology as columnar archive."""
+    file_path = pathlib.Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    index: dict[str, t.Any] = {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "meta": raw(topology.meta),
+        "optional_data": raw(topology.optional_data),
+        "tables": {},
+    }
+    with zipfile.ZipFile(file_path, "w", compression=compression) as archive:
+        for section in TOPOLOGY_SECTIONS:
+            elements: tuple[Base, ...] = getattr(topology, section)
+            table: dict[str, t.Any] = {"n_rows": len(elements), "columns": {}}
+            for path, values in _columns(elements).items():
+                info, buffers = _encode_column(values)
+                table["columns"][path] = info
+                for name, buffer in buffers.items():
+                    archive.writestr(f"{section}/{path}.{name}", buffer)
+
+            optional_data = {i: raw(e.optional_data) for i, e in enumerate(elements) if e.optional_data is not None}
+            archive.writestr(f"{section}/optional_data.json", json.dumps(optional_data))
+            index["tables"][section] = table
+
+        archive.writestr(INDEX_FILE, json.dumps(index))
+
+
+def _read_index(archive: zipfile.ZipFile) -> dict[str, t.Any]:
+    index = json.loads(archive.read(INDEX_FILE))
+    if index.get("format") != FORMAT or index.get("version") != FORMAT_VERSION:
+        msg = f"Unsupported columnar format {index.get('format')} {index.get('version')}."
+        raise ValueError(msg)
+
+    return index
+
+
+def _read_array(archive: zipfile.ZipFile, name: str, typecode: str, *, byteswap: bool) -> array.array | None:
+    if name not in archive.NameToInfo:
+        return None
+
+    values = array.array(typecode)
+    values.frombytes(archive.read(name))
+    if byteswap:
+        values.byteswap()
+
+    return values
+
+
+def _read_table(archive: zipfile.ZipFile, index: dict[str, t.Any], section: str) -> dict[str, Column]:
+    table = index["tables"][section]
+    byteswap = index["byteorder"] != sys.byteorder
+    columns = {}
+    for path, info in table["columns"].items():
+        kind = info["kind"]
+        prefix = f"{section}/{path}."
+        columns[path] = Column(
+            kind=kind,
+            n_rows=table["n_rows"],
+            values=_read_array(archive, prefix + "values", TYPECODES.get(kind, "i"), byteswap=byteswap),
+            mask=_read_array(archive, prefix + "mask", "b", byteswap=byteswap),
+            offsets=_read_array(archive, prefix + "offsets", "q", byteswap=byteswap),
+            dictionary=tuple(info.get("dictionary", ())),
+        )
+
+    return columns
+
+
+def read_columns(file_path: str | pathlib.Path, section: str) -> dict[str, Column]:
+    """Read the raw columns of one element table without creating any model."""
+    with zipfile.ZipFile(file_path) as archive:
+        return _read_table(archive, _read_index(archive), section)
+
+
+def read_columnar(file_path: str | pathlib.Path) -> Topology:
+    """Read a topology from a columnar archive."""
+    with zipfile.ZipFile(file_path) as archive:
+        index = _read_index(archive)
+        data: dict[str, t.Any] = {"meta": index["meta"], "optional_data": index["optional_data"]}
+        for section, element_type in TOPOLOGY_SECTIONS.items():
+            columns = _read_table(archive, index, section)
+            optional_data = json.loads(archive.read(f"{section}/optional_data.json"))
+            elements = []
+            for i in range(index["tables"][section]["n_rows"]):
+                row = ((path, column[i]) for path, column in columns.items())
+                element = _unflatten((path, value) for path, value in row if value is not _ABSENT)
+                element["optional_data"] = optional_data.get(str(i))
+                elements.append(element_type.model_validate(element))
+
+            data[section] = elements
+
+    return Topology.model_validate(data)
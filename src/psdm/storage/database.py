@@ -0,0 +1,251 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""SQLite storage of topologies, steadystate cases and topology cases.
+
+Every document type has a table keyed by `Meta.id` with indexed `grid` and `case` columns. Its elements are stored in
+one table per element type, e.g. `loads` or `steadystate_loads`, that holds the element as JSON together with a few
+indexed columns for filtering, e.g. `type`, `system_type` and `active_power` of topology loads. Any other attribute
+can still be filtered with the SQLite JSON functions, e.g. `json_extract(data, '$.windings[0].node') = ?`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import pathlib
+import sqlite3
+import typing as t
+import uuid
+
+from psdm.steadystate_case.case import Case as SteadystateCase
+from psdm.steadystate_case.external_grid import ExternalGrid as SteadystateExternalGrid
+from psdm.steadystate_case.load import Load as SteadystateLoad
+from psdm.steadystate_case.transformer import Transformer as SteadystateTransformer
+from psdm.storage.columnar import raw
+from psdm.topology.branch import Branch
+from psdm.topology.external_grid import ExternalGrid
+from psdm.topology.load import Load
+from psdm.topology.node import Node
+from psdm.topology.topology import Topology
+from psdm.topology.transformer import Transformer
+from psdm.topology_case.case import Case as TopologyCase
+from psdm.topology_case.element_state import ElementState
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.base import Base
+
+D = t.TypeVar("D", bound="Base")
+
+
+@dataclasses.dataclass(frozen=True)
+class Table:
+    """Element table with indexed columns given as mapping of column definition to value getter."""
+
+    name: str
+    element_type: type[Base]
+    columns: dict[str, cabc.Callable[[t.Any], t.Any]] = dataclasses.field(default_factory=dict)
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        return tuple(column.split()[0] for column in self.columns)
+
+
+@dataclasses.dataclass(frozen=True)
+class Document:
+    name: str
+    sections: dict[str, Table]
+
+
+DOCUMENTS: dict[type[Base], Document] = {
+    Topology: Document(
+        "topologies",
+        {
+            "branches": Table(
+                "branches",
+                Branch,
+                {
+                    "node_1 TEXT": lambda e: e.node_1,
+                    "node_2 TEXT": lambda e: e.node_2,
+                    "type TEXT": lambda e: e.type,
+                    "u_n REAL": lambda e: e.u_n.value,
+                },
+            ),
+            "nodes": Table("nodes", Node, {"u_n REAL": lambda e: e.u_n.value}),
+            "loads": Table(
+                "loads",
+                Load,
+                {
+                    "node TEXT": lambda e: e.node,
+                    "type TEXT": lambda e: e.type,
+                    "system_type TEXT": lambda e: e.system_type,
+                    "active_power REAL": lambda e: e.rated_power.active_power.total,
+                    "apparent_power REAL": lambda e: e.rated_power.apparent_power.total,
+                },
+            ),
+            "transformers": Table("transformers", Transformer, {"vector_group TEXT": lambda e: e.vector_group}),
+            "external_grids": Table(
+                "external_grids",
+                ExternalGrid,
+                {"node TEXT": lambda e: e.node, "type TEXT": lambda e: e.type},
+            ),
+        },
+    ),
+    SteadystateCase: Document(
+        "steadystate_cases",
+        {
+            "loads": Table("steadystate_loads", SteadystateLoad),
+            "transformers": Table("steadystate_transformers", SteadystateTransformer),
+            "external_grids": Table("steadystate_external_grids", SteadystateExternalGrid),
+        },
+    ),
+    TopologyCase: Document(
+        "topology_cases",
+        {"elements": Table("topology_case_elements", ElementState, {"disabled INTEGER": lambda e: e.disabled})},
+    ),
+}
+
+
+def _schema() -> cabc.Iterator[str]:
+    for document in DOCUMENTS.values():
+        yield (
+            f"CREATE TABLE IF NOT EXISTS {document.name} "
+            '(id TEXT PRIMARY KEY, grid TEXT NOT NULL, "case" TEXT, date TEXT NOT NULL, data TEXT NOT NULL)'
+        )
+        yield f'CREATE INDEX IF NOT EXISTS {document.name}_grid_case ON {document.name} (grid, "case")'
+        for table in document.sections.values():
+            columns = "".join(f", {column}" for column in table.columns)
+            yield (
+                f"CREATE TABLE IF NOT EXISTS {table.name} "
+                f"(document_id TEXT NOT NULL REFERENCES {document.name} (id) ON DELETE CASCADE, "
+                f"position INTEGER NOT NULL, name TEXT NOT NULL{columns}, data TEXT NOT NULL, "
+                "PRIMARY KEY (document_id, position))"
+            )
+            for column in ("name", *table.column_names):
+                yield f"CREATE INDEX IF NOT EXISTS {table.name}_{column} ON {table.name} ({column})"
+
+
+class Database:
+    """SQLite database of psdm documents.
+
+    Documents are replaced if a document of the same type with the same `Meta.id` is added again. All documents passed
+    to one call of `add` are inserted within a single transaction.
+    """
+
+    def __init__(self, file_path: str | pathlib.Path = ":memory:") -> None:
+        self.file_path = file_path if file_path == ":memory:" else pathlib.Path(file_path)
+        self.connection = sqlite3.connect(self.file_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.connection:
+            for statement in _schema():
+                self.connection.execute(statement)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add(self, documents: cabc.Iterable[Base]) -> None:
+        """Insert topologies, steadystate cases or topology cases in one transaction."""
+        with self.connection:
+            for document in documents:
+                self._insert(document)
+
+    def _insert(self, document: Base) -> None:
+        spec = DOCUMENTS[type(document)]
+        meta = document.meta  # type: ignore[attr-defined]
+        document_id = str(meta.id)
+        data = {name: raw(getattr(document, name)) for name in type(document).model_fields if name not in spec.sections}
+        self.connection.execute(f"DELETE FROM {spec.name} WHERE id = ?", (document_id,))  # noqa: S608
+        self.connection.execute(
+            f"INSERT INTO {spec.name} VALUES (?, ?, ?, ?, ?)",  # noqa: S608
+            (document_id, meta.grid, meta.case, meta.date.isoformat(), json.dumps(data)),
+        )
+        for section, table in spec.sections.items():
+            placeholders = ", ".join("?" * (len(table.columns) + 4))
+            self.connection.executemany(
+                f"INSERT INTO {table.name} VALUES ({placeholders})",  # noqa: S608
+                (
+                    (
+                        document_id,
+                        position,
+                        element.name,
+                        *(column(element) for column in table.columns.values()),
+                        json.dumps(raw(element)),
+                    )
+                    for position, element in enumerate(getattr(document, section))
+                ),
+            )
+
+    def remove(self, document_type: type[Base], document_id: uuid.UUID | str) -> None:
+        with self.connection:
+            self.connection.execute(
+                f"DELETE FROM {DOCUMENTS[document_type].name} WHERE id = ?",  # noqa: S608
+                (str(document_id),),
+            )
+
+    def ids(self, document_type: type[Base], grid: str | None = None, case: str | None = None) -> list[uuid.UUID]:
+        """Return the ids of all documents of a type, optionally restricted to a grid and a study case."""
+        sql = f"SELECT id FROM {DOCUMENTS[document_type].name} WHERE 1"  # noqa: S608
+        params = []
+        if grid is not None:
+            sql += " AND grid = ?"
+            params.append(grid)
+
+        if case is not None:
+            sql += ' AND "case" = ?'
+            params.append(case)
+
+        return [uuid.UUID(row[0]) for row in self.connection.execute(sql + " ORDER BY date, id", params)]
+
+    def get(self, document_type: type[D], document_id: uuid.UUID | str) -> D:
+        """Rehydrate a single document."""
+        spec = DOCUMENTS[document_type]
+        document_id = str(document_id)
+        row = self.connection.execute(
+            f"SELECT data FROM {spec.name} WHERE id = ?",  # noqa: S608
+            (document_id,),
+        ).fetchone()
+        if row is None:
+            msg = f"{document_type.__name__} {document_id} not found."
+            raise KeyError(msg)
+
+        data = json.loads(row[0])
+        for section, table in spec.sections.items():
+            rows = self.connection.execute(
+                f"SELECT data FROM {table.name} WHERE document_id = ? ORDER BY position",  # noqa: S608
+                (document_id,),
+            )
+            data[section] = [json.loads(e) for (e,) in rows]
+
+        return document_type.model_validate(data)
+
+    def find(self, document_type: type[D], grid: str | None = None, case: str | None = None) -> cabc.Iterator[D]:
+        """Rehydrate all documents of a type, optionally restricted to a grid and a study case."""
+        for document_id in self.ids(document_type, grid=grid, case=case):
+            yield self.get(document_type, document_id)
+
+    def elements(
+        self,
+        document_type: type[Base],
+        section: str,
+        where: str = "1",
+        params: cabc.Sequence[t.Any] = (),
+        document_id: uuid.UUID | str | None = None,
+    ) -> cabc.Iterator[tuple[uuid.UUID, Base]]:
+        """Query the elements of a section and yield them together with the id of their document.
+
+        The `where` clause may use the indexed columns of the element table, e.g. all PV loads above 100 kW:
+
+            database.elements(Topology, "loads", "system_type = ? AND active_power > ?", ("PV", 100_000))
+        """
+        table = DOCUMENTS[document_type].sections[section]
+        sql = f"SELECT document_id, data FROM {table.name} WHERE ({where})"  # noqa: S608
+        params = list(params)
+        if document_id is not None:
+            sql += " AND document_id = ?"
+            params.append(str(document_id))
+
+        for element_document_id, data in self.connection.execute(sql + " ORDER BY document_id, position", params):
+            yield uuid.UUID(element_document_id), table.element_type.model_validate_json(data)
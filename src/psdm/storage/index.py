@@ -0,0 +1,126 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pathlib
+import typing as t
+
+from loguru import logger
+
+from psdm.base import open_file
+from psdm.storage.json_stream import TOPOLOGY_SECTIONS
+from psdm.storage.json_stream import JsonScanner
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.base import Base
+
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+HASH_BLOCK_SIZE = 1 << 20
+
+Check = t.Literal["stat", "hash"]
+
+
+def index_path(file_path: str | pathlib.Path) -> pathlib.Path:
+    file_path = pathlib.Path(file_path)
+    return file_path.with_name(file_path.name + INDEX_SUFFIX)
+
+
+def file_hash(file_path: pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    with file_path.open("rb") as file_handle:
+        while block := file_handle.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+class TopologyIndex:
+    """Sidecar index mapping (section, element name) to the byte range of the element in a topology file.
+
+    Use `TopologyIndex.open` to load a valid sidecar or (re)build a missing or stale one. The sidecar is considered
+    stale if size or modification time of the topology file changed (`check="stat"`) or if its content hash changed
+    (`check="hash"`).
+    """
+
+    def __init__(self, file_path: pathlib.Path, spans: dict[str, dict[str, tuple[int, int]]]) -> None:
+        self.file_path = file_path
+        self.spans = spans
+
+    @classmethod
+    def build(cls, file_path: str | pathlib.Path, check: Check = "stat") -> TopologyIndex:
+        """Scan a topology file once and write its sidecar index."""
+        file_path = pathlib.Path(file_path)
+        logger.debug("Building index of {file_path} ...", file_path=file_path)
+        stat = file_path.stat()
+        spans: dict[str, dict[str, tuple[int, int]]] = {}
+        with open_file(file_path, newline="") as file_handle:
+            scanner = JsonScanner(file_handle)
+            for key in scanner.iter_members():
+                if key in TOPOLOGY_SECTIONS:
+                    spans[key] = {e["name"]: (start, end) for e, start, end in scanner.iter_array_spans()}
+
+        sidecar = {
+            "version": INDEX_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_hash(file_path) if check == "hash" else None,
+            "spans": spans,
+        }
+        index_path(file_path).write_text(json.dumps(sidecar), encoding="utf-8")
+        return cls(file_path, spans)
+
+    @classmethod
+    def open(cls, file_path: str | pathlib.Path, check: Check = "stat") -> TopologyIndex:
+        """Load the sidecar index of a topology file, rebuilding it if it is missing or stale."""
+        file_path = pathlib.Path(file_path)
+        try:
+            sidecar = json.loads(index_path(file_path).read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls.build(file_path, check=check)
+
+        if sidecar.get("version") != INDEX_VERSION or not cls._is_current(file_path, sidecar, check):
+            return cls.build(file_path, check=check)
+
+        spans = {
+            section: {name: (start, end) for name, (start, end) in elements.items()}
+            for section, elements in sidecar["spans"].items()
+        }
+        return cls(file_path, spans)
+
+    @staticmethod
+    def _is_current(file_path: pathlib.Path, sidecar: dict[str, t.Any], check: Check) -> bool:
+        if check == "hash":
+            return sidecar["sha256"] is not None and sidecar["sha256"] == file_hash(file_path)
+
+        stat = file_path.stat()
+        return sidecar["size"] == stat.st_size and sidecar["mtime_ns"] == stat.st_mtime_ns
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        section, name = key
+        return name in self.spans.get(section, {})
+
+    def get(self, section: str, name: str) -> Base:
+        """Read and validate a single element."""
+        return self.get_many(section, (name,))[0]
+
+    def get_many(self, section: str, names: cabc.Iterable[str]) -> tuple[Base, ...]:
+        """Read and validate the requested elements of a section, seeking in file order."""
+        element_type = TOPOLOGY_SECTIONS[section]
+        spans = self.spans[section]
+        names = tuple(names)
+        ordered = sorted(set(names), key=lambda name: spans[name][0])
+        elements = {}
+        with open_file(self.file_path, "rb") as file_handle:
+            for name in ordered:
+                start, end = spans[name]
+                file_handle.seek(start)
+                elements[name] = element_type.model_validate_json(file_handle.read(end - start))
+
+        return tuple(elements[name] for name in names)
@@ -0,0 +1,247 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import json
+import re
+import typing as t
+
+from psdm.base import open_file
+from psdm.topology.branch import Branch
+from psdm.topology.external_grid import ExternalGrid
+from psdm.topology.load import Load
+from psdm.topology.node import Node
+from psdm.topology.topology import Topology
+from psdm.topology.transformer import Transformer
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+    import pathlib
+
+    from psdm.base import Base
+
+CHUNK_SIZE = 1 << 20  # number of characters read from the file at once
+
+TOPOLOGY_SECTIONS: dict[str, type[Base]] = {
+    "branches": Branch,
+    "nodes": Node,
+    "loads": Load,
+    "transformers": Transformer,
+    "external_grids": ExternalGrid,
+}
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+SCALAR_END = re.compile(r"[ \t\n\r,\]}]")
+
+
+class JsonScanner:
+    """Incremental scanner over a JSON document whose root is an object.
+
+    Only a bounded window of the document is kept in memory: the members of the root object are visited one by one
+    and array members can be walked element by element. Positions are tracked as byte offsets of the UTF-8 encoded
+    document, so they can be used for seeking in the underlying file.
+    """
+
+    def __init__(self, file_handle: t.IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self._file_handle = file_handle
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._position = 0  # byte offset of self._buf[self._pos] in the document
+        self._consumed = True
+
+    @property
+    def position(self) -> int:
+        """Byte offset of the next unread character of the document."""
+        return self._position
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+
+        chunk = self._file_handle.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _advance(self, end: int) -> None:
+        if self._buf.isascii():
+            self._position += end - self._pos
+        else:
+            self._position += len(self._buf[self._pos : end].encode("utf-8"))
+
+        self._pos = end
+
+    def _peek(self) -> str:
+        while True:
+            end = WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+            self._advance(end)
+            if end < len(self._buf):
+                return self._buf[end]
+
+            if not self._fill():
+                msg = "Unexpected end of document"
+                raise json.JSONDecodeError(msg, self._buf, self._pos)
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            msg = f"Expecting {char!r}"
+            raise json.JSONDecodeError(msg, self._buf, self._pos)
+
+        self._advance(self._pos + 1)
+
+    def _decode(self) -> t.Any:  # noqa: ANN401
+        if self._peek() not in '{["':
+            # a literal or number is only complete once its delimiter has been read
+            while SCALAR_END.search(self._buf, self._pos) is None and self._fill():
+                pass
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+
+                raise
+
+            self._advance(end)
+            return value
+
+    def decode_value(self) -> t.Any:  # noqa: ANN401
+        """Decode the next complete JSON value."""
+        self._consumed = True
+        return self._decode()
+
+    def skip_value(self) -> None:
+        """Skip the next JSON value; arrays are skipped element by element to keep the memory bounded."""
+        if self._peek() == "[":
+            for _ in self.iter_array_spans():
+                pass
+        else:
+            self.decode_value()
+
+    def iter_array(self) -> cabc.Iterator[t.Any]:
+        """Decode the next JSON array element by element."""
+        for value, _, _ in self.iter_array_spans():
+            yield value
+
+    def iter_array_spans(self) -> cabc.Iterator[tuple[t.Any, int, int]]:
+        """Decode the next JSON array element by element together with the byte range of each element."""
+        self._consumed = True
+        self._expect("[")
+        if self._peek() == "]":
+            self._advance(self._pos + 1)
+            return
+
+        while True:
+            self._peek()
+            start = self._position
+            value = self._decode()
+            yield value, start, self._position
+            char = self._peek()
+            self._advance(self._pos + 1)
+            if char == "]":
+                return
+
+            if char != ",":
+                msg = "Expecting ',' delimiter"
+                raise json.JSONDecodeError(msg, self._buf, self._pos - 1)
+
+    def iter_members(self) -> cabc.Iterator[str]:
+        """Visit the members of the root object.
+
+        After each yielded key the value has to be consumed by `decode_value` or `iter_array`, otherwise it is skipped.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._advance(self._pos + 1)
+            return
+
+        while True:
+            key = self.decode_value()
+            self._expect(":")
+            self._consumed = False
+            yield key
+            if not self._consumed:
+                self.skip_value()
+
+            char = self._peek()
+            self._advance(self._pos + 1)
+            if char == "}":
+                return
+
+            if char != ",":
+                msg = "Expecting ',' delimiter"
+                raise json.JSONDecodeError(msg, self._buf, self._pos - 1)
+
+
+def iter_topology_elements(
+    file_path: str | pathlib.Path,
+    sections: cabc.Collection[str] | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> cabc.Iterator[tuple[str, Base]]:
+    """Yield validated topology elements as (section, element) pairs in file order."""
+    sections = TOPOLOGY_SECTIONS.keys() if sections is None else sections
+    unknown = set(sections) - TOPOLOGY_SECTIONS.keys()
+    if unknown:
+        msg = f"Sections {sorted(unknown)} are not element sections, allowed are {list(TOPOLOGY_SECTIONS)}."
+        raise ValueError(msg)
+
+    with open_file(file_path, newline="") as file_handle:
+        scanner = JsonScanner(file_handle, chunk_size=chunk_size)
+        for key in scanner.iter_members():
+            if key not in sections:
+                continue
+
+            element_type = TOPOLOGY_SECTIONS[key]
+            for data in scanner.iter_array():
+                yield key, element_type.model_validate(data)
+
+
+def iter_topology_batches(
+    file_path: str | pathlib.Path,
+    batch_size: int,
+    sections: cabc.Collection[str] | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> cabc.Iterator[tuple[str, tuple[Base, ...]]]:
+    """Yield validated topology elements in batches of at most `batch_size` elements of the same section."""
+    if batch_size < 1:
+        msg = "batch_size must be positive."
+        raise ValueError(msg)
+
+    batch: list[Base] = []
+    batch_section = None
+    for section, element in iter_topology_elements(file_path, sections=sections, chunk_size=chunk_size):
+        if batch and (section != batch_section or len(batch) == batch_size):
+            yield batch_section, tuple(batch)  # type: ignore[misc]
+            batch = []
+
+        batch_section = section
+        batch.append(element)
+
+    if batch:
+        yield batch_section, tuple(batch)  # type: ignore[misc]
+
+
+def read_topology(file_path: str | pathlib.Path, chunk_size: int = CHUNK_SIZE) -> Topology:
+    """Build a topology from a file without holding the whole document in memory."""
+    data: dict[str, t.Any] = {key: [] for key in TOPOLOGY_SECTIONS}
+    with open_file(file_path, newline="") as file_handle:
+        scanner = JsonScanner(file_handle, chunk_size=chunk_size)
+        for key in scanner.iter_members():
+            if key in TOPOLOGY_SECTIONS:
+                element_type = TOPOLOGY_SECTIONS[key]
+                data[key].extend(element_type.model_validate(e) for e in scanner.iter_array())
+            else:
+                data[key] = scanner.decode_value()
+
+    return Topology.model_validate(data)
@@ -0,0 +1,111 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import pathlib
+import typing as t
+
+import pydantic
+
+from psdm.base import AttributeData
+from psdm.base import UniqueNonEmptyTuple
+from psdm.base import UniqueTuple
+from psdm.base import open_file
+from psdm.meta import Meta
+from psdm.storage.json_stream import TOPOLOGY_SECTIONS
+from psdm.storage.json_stream import JsonScanner
+from psdm.topology.topology import Topology
+
+if t.TYPE_CHECKING:
+    from psdm.base import Base
+    from psdm.topology.branch import Branch
+    from psdm.topology.external_grid import ExternalGrid
+    from psdm.topology.load import Load
+    from psdm.topology.node import Node
+    from psdm.topology.transformer import Transformer
+
+SECTION_ADAPTERS: dict[str, pydantic.TypeAdapter] = {
+    section: pydantic.TypeAdapter(UniqueTuple[element_type])  # type: ignore[valid-type]
+    for section, element_type in TOPOLOGY_SECTIONS.items()
+}
+OPTIONAL_DATA_ADAPTER = pydantic.TypeAdapter(UniqueNonEmptyTuple[AttributeData] | None)
+
+
+class LazyTopology:
+    """Topology whose element sections are parsed and validated on first access.
+
+    Opening the file only records the byte range of each section and validates the small `meta` and `optional_data`.
+    Accessing e.g. `branches` reads and validates just that section, so jobs that never touch `loads` never pay for
+    their validation.
+    """
+
+    def __init__(self, file_path: str | pathlib.Path) -> None:
+        self.file_path = pathlib.Path(file_path)
+        self.spans: dict[str, tuple[int, int]] = {}
+        self._sections: dict[str, tuple[Base, ...]] = {}
+        data = {}
+        with open_file(self.file_path, newline="") as file_handle:
+            scanner = JsonScanner(file_handle)
+            for key in scanner.iter_members():
+                if key in TOPOLOGY_SECTIONS:
+                    start = scanner.position
+                    scanner.skip_value()
+                    self.spans[key] = (start, scanner.position)
+                elif key in ("meta", "optional_data"):
+                    data[key] = scanner.decode_value()
+
+        missing = TOPOLOGY_SECTIONS.keys() - self.spans.keys()
+        if missing:
+            msg = f"Sections {sorted(missing)} are missing in {self.file_path}."
+            raise ValueError(msg)
+
+        self.meta = Meta.model_validate(data.get("meta"))
+        self.optional_data: tuple[AttributeData, ...] | None = OPTIONAL_DATA_ADAPTER.validate_python(
+            data.get("optional_data"),
+        )
+
+    @property
+    def loaded_sections(self) -> frozenset[str]:
+        return frozenset(self._sections)
+
+    def section(self, name: str) -> tuple[Base, ...]:
+        """Return the validated elements of a section, reading them from the file on first access."""
+        if name not in self._sections:
+            start, end = self.spans[name]
+            with open_file(self.file_path, "rb") as file_handle:
+                file_handle.seek(start)
+                raw = file_handle.read(end - start)
+
+            self._sections[name] = SECTION_ADAPTERS[name].validate_json(raw)
+
+        return self._sections[name]
+
+    @property
+    def branches(self) -> tuple[Branch, ...]:
+        return self.section("branches")  # type: ignore[return-value]
+
+    @property
+    def nodes(self) -> tuple[Node, ...]:
+        return self.section("nodes")  # type: ignore[return-value]
+
+    @property
+    def loads(self) -> tuple[Load, ...]:
+        return self.section("loads")  # type: ignore[return-value]
+
+    @property
+    def transformers(self) -> tuple[Transformer, ...]:
+        return self.section("transformers")  # type: ignore[return-value]
+
+    @property
+    def external_grids(self) -> tuple[ExternalGrid, ...]:
+        return self.section("external_grids")  # type: ignore[return-value]
+
+    def to_topology(self) -> Topology:
+        """Validate all remaining sections and return a full topology."""
+        return Topology(
+            meta=self.meta,
+            optional_data=self.optional_data,
+            **{section: self.section(section) for section in TOPOLOGY_SECTIONS},
+        )
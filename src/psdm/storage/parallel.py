@@ -0,0 +1,128 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Validation of large topologies in parallel processes.
+
+The document is scanned for the byte ranges of the elements of each section, consecutive elements are cut into batches
+which are validated by the workers while the scan goes on. Workers send the elements back in the wire format of
+`psdm.storage.wire`. The checks across elements, i.e. the uniqueness of the sections, run once all batches are merged,
+so the result equals that of `Topology.from_json`. If the topology is invalid, the whole document is validated serially
+to raise the same error as `Topology.from_json` would.
+
+The scan decodes every element once in the main process, so it bounds the attainable speedup.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import io
+import json
+import typing as t
+
+import pydantic
+
+from psdm.base import open_file
+from psdm.storage import wire
+from psdm.storage.json_stream import TOPOLOGY_SECTIONS
+from psdm.storage.json_stream import JsonScanner
+from psdm.storage.trusted import gc_paused
+from psdm.topology.topology import Topology
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+BATCH_SIZE = 5000  # number of elements validated by one task
+
+# elements of a batch are validated without the uniqueness check of the section, which runs after merging
+BATCH_ADAPTERS: dict[str, pydantic.TypeAdapter] = {
+    section: pydantic.TypeAdapter(tuple[element_type, ...])  # type: ignore[valid-type]
+    for section, element_type in TOPOLOGY_SECTIONS.items()
+}
+
+
+def _validate_batch(section: str, data: bytes) -> bytes:
+    with gc_paused():
+        elements = BATCH_ADAPTERS[section].validate_json(b"[" + data + b"]")
+
+    return wire.encode(elements)
+
+
+def _submit_batches(
+    data: bytes,
+    executor: concurrent.futures.Executor,
+    batch_size: int,
+    members: dict[str, t.Any],
+) -> None:
+    """Scan the document into members and submit its element batches, sections are stored as lists of futures."""
+    scanner = JsonScanner(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", newline=""))
+    for key in scanner.iter_members():
+        if key not in TOPOLOGY_SECTIONS:
+            members[key] = scanner.decode_value()
+            continue
+
+        members[key] = futures = []
+        start, end, count = 0, 0, 0
+        for _, element_start, end in scanner.iter_array_spans():
+            if not count:
+                start = element_start
+
+            count += 1
+            if count == batch_size:
+                futures.append(executor.submit(_validate_batch, key, data[start:end]))
+                count = 0
+
+        if count:
+            futures.append(executor.submit(_validate_batch, key, data[start:end]))
+
+
+def _merge(futures: list[concurrent.futures.Future[bytes]]) -> tuple[pydantic.BaseModel, ...]:
+    elements: list[pydantic.BaseModel] = []
+    for future in futures:
+        batch = future.result()
+        with gc_paused():
+            elements.extend(wire.decode(batch))  # type: ignore[arg-type]
+
+    return tuple(elements)
+
+
+def load_topology(
+    json_data: str | bytes,
+    executor: concurrent.futures.Executor | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> Topology:
+    """Validate a topology from JSON with the elements validated in batches by an executor.
+
+    By default a `concurrent.futures.ProcessPoolExecutor` with one worker per CPU is used.
+    """
+    if batch_size < 1:
+        msg = "batch_size must be positive."
+        raise ValueError(msg)
+
+    data = json_data.encode() if isinstance(json_data, str) else json_data
+    own_executor = executor is None
+    executor = concurrent.futures.ProcessPoolExecutor() if executor is None else executor
+    members: dict[str, t.Any] = {}
+    try:
+        _submit_batches(data, executor, batch_size, members)
+        merged = {key: _merge(value) if key in TOPOLOGY_SECTIONS else value for key, value in members.items()}
+        return Topology.model_validate(merged)
+    except (json.JSONDecodeError, pydantic.ValidationError):
+        for section in TOPOLOGY_SECTIONS.keys() & members.keys():
+            for future in members[section]:
+                future.cancel()
+
+        return Topology.model_validate_json(json_data)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def read_topology(
+    file_path: str | pathlib.Path,
+    executor: concurrent.futures.Executor | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> Topology:
+    """Read a topology file with the elements validated in parallel, see `load_topology`."""
+    with open_file(file_path, "rb") as file_handle:
+        return load_topology(file_handle.read(), executor=executor, batch_size=batch_size)
@@ -0,0 +1,238 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Sharded export of large topologies.
+
+A topology is split into shards by assigning every node to a shard, either by its voltage level or by its galvanically
+connected area. Each shard is a valid topology file holding the nodes of the shard together with the loads, external
+grids, branches and transformers connected to them only. Branches and transformers connecting nodes of different
+shards are written to a separate boundary topology file. The manifest lists the shards, the boundary nodes and the
+shards each cross-shard element connects.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import pathlib
+import typing as t
+
+from psdm.storage.columnar import raw
+from psdm.storage.json_stream import TOPOLOGY_SECTIONS
+from psdm.topology.graph import transformer_nodes
+from psdm.topology.topology import Topology
+from psdm.topology.transformer import Transformer
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.topology.branch import Branch
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_FORMAT = "psdm-shards"
+MANIFEST_VERSION = 1
+BOUNDARY = "boundary"
+
+ShardKey = t.Literal["voltage", "area"]
+
+
+def shard_by_voltage(topology: Topology) -> dict[str, str]:
+    """Assign every node to a shard named after its nominal voltage, e.g. `20000V`."""
+    return {node.name: f"{node.u_n.value:.10g}V" for node in topology.nodes}
+
+
+def _neighbours_of(neighbours: dict[str, list[str]], node: str, element: str) -> list[str]:
+    try:
+        return neighbours[node]
+    except KeyError:
+        msg = f"Node {node} of {element} is not part of the topology."
+        raise ValueError(msg) from None
+
+
+def shard_by_area(topology: Topology) -> dict[str, str]:
+    """Assign every node to a shard of nodes connected by branches, i.e. a galvanically connected area."""
+    neighbours: dict[str, list[str]] = {node.name: [] for node in topology.nodes}
+    for branch in topology.branches:
+        _neighbours_of(neighbours, branch.node_1, branch.name).append(branch.node_2)
+        _neighbours_of(neighbours, branch.node_2, branch.name).append(branch.node_1)
+
+    shards: dict[str, str] = {}
+    n_areas = 0
+    for node in neighbours:
+        if node in shards:
+            continue
+
+        n_areas += 1
+        shard = f"area_{n_areas}"
+        shards[node] = shard
+        stack = [node]
+        while stack:
+            for neighbour in neighbours[stack.pop()]:
+                if neighbour not in shards:
+                    shards[neighbour] = shard
+                    stack.append(neighbour)
+
+    return shards
+
+
+SHARD_KEYS: dict[str, cabc.Callable[[Topology], dict[str, str]]] = {"voltage": shard_by_voltage, "area": shard_by_area}
+
+
+def _element_nodes(element: Branch | Transformer) -> tuple[str, ...]:
+    if isinstance(element, Transformer):
+        return transformer_nodes(element)
+
+    return (element.node_1, element.node_2)
+
+
+def _shard_of(shards: cabc.Mapping[str, str], node: str, element: str) -> str:
+    try:
+        return shards[node]
+    except KeyError:
+        msg = f"Node {node} of {element} is not assigned to a shard."
+        raise ValueError(msg) from None
+
+
+def write_shards(
+    topology: Topology,
+    directory: str | pathlib.Path,
+    by: ShardKey | cabc.Mapping[str, str] = "voltage",
+    suffix: str = ".json",
+) -> dict[str, t.Any]:
+    """Split a topology into shards and write them together with a manifest to a directory.
+
+    Shards are formed by voltage level (`by="voltage"`), by connected area (`by="area"`) or by a mapping of node name
+    to shard name. The suffix selects the file format of the shards, e.g. `.json.gz` for compressed shards.
+    """
+    shards = dict(SHARD_KEYS[by](topology) if isinstance(by, str) else by)
+    names = list(dict.fromkeys(_shard_of(shards, node.name, node.name) for node in topology.nodes))
+    if BOUNDARY in names:
+        msg = f"Shard name {BOUNDARY} is reserved for the boundary file."
+        raise ValueError(msg)
+
+    sections: dict[str, dict[str, list]] = {name: {section: [] for section in TOPOLOGY_SECTIONS} for name in names}
+    # position of each element in its section of the topology, to restore the order when reading all shards
+    positions: dict[str, dict[str, list[int]]] = {
+        name: {section: [] for section in TOPOLOGY_SECTIONS} for name in [*names, BOUNDARY]
+    }
+    for i, node in enumerate(topology.nodes):
+        sections[shards[node.name]]["nodes"].append(node)
+        positions[shards[node.name]]["nodes"].append(i)
+
+    for section in ("loads", "external_grids"):
+        for i, element in enumerate(getattr(topology, section)):
+            name = _shard_of(shards, element.node, element.name)
+            sections[name][section].append(element)
+            positions[name][section].append(i)
+
+    boundary: dict[str, dict[str, list[str]]] = {"branches": {}, "transformers": {}}
+    boundary_nodes: dict[str, str] = {}
+    for section, elements in boundary.items():
+        for i, element in enumerate(getattr(topology, section)):
+            nodes = _element_nodes(element)
+            element_shards = [_shard_of(shards, node, element.name) for node in nodes]
+            if len(set(element_shards)) == 1:
+                sections[element_shards[0]][section].append(element)
+                positions[element_shards[0]][section].append(i)
+            else:
+                elements[element.name] = list(dict.fromkeys(element_shards))
+                boundary_nodes.update(zip(nodes, element_shards, strict=True))
+                positions[BOUNDARY][section].append(i)
+
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest: dict[str, t.Any] = {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "meta": raw(topology.meta),
+        "shards": {},
+        "boundary": {
+            "file": BOUNDARY + suffix,
+            "nodes": boundary_nodes,
+            **boundary,
+            "positions": {section: positions[BOUNDARY][section] for section in boundary},
+        },
+    }
+    for name in names:
+        shard = Topology(meta=topology.meta, **sections[name])
+        shard.to_json(directory / (name + suffix))
+        manifest["shards"][name] = {"file": name + suffix} | {s: len(sections[name][s]) for s in TOPOLOGY_SECTIONS}
+        manifest["shards"][name]["positions"] = positions[name]
+
+    Topology(
+        meta=topology.meta,
+        optional_data=topology.optional_data,
+        branches=tuple(e for e in topology.branches if e.name in boundary["branches"]),
+        nodes=(),
+        loads=(),
+        transformers=tuple(e for e in topology.transformers if e.name in boundary["transformers"]),
+        external_grids=(),
+    ).to_json(directory / (BOUNDARY + suffix))
+    (directory / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def read_manifest(directory: str | pathlib.Path) -> dict[str, t.Any]:
+    manifest = json.loads((pathlib.Path(directory) / MANIFEST_FILE).read_text(encoding="utf-8"))
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("version") != MANIFEST_VERSION:
+        msg = f"{directory} does not contain a supported shard manifest."
+        raise ValueError(msg)
+
+    return manifest
+
+
+def _read(file_path: pathlib.Path) -> Topology:
+    return Topology.from_file(file_path)  # type: ignore[return-value]
+
+
+def read_shards(
+    directory: str | pathlib.Path,
+    shards: cabc.Iterable[str] | None = None,
+    executor: concurrent.futures.Executor | None = None,
+) -> Topology:
+    """Read the shards of a sharded export in parallel and reassemble them into one topology.
+
+    If only some shards are requested, cross-shard branches and transformers are included if they connect requested
+    shards only. Elements keep their order in the original topology, so reading all shards restores it. By default the shards are read in a thread pool, pass e.g. a
+    `concurrent.futures.ProcessPoolExecutor` to validate them in parallel processes.
+    """
+    directory = pathlib.Path(directory)
+    manifest = read_manifest(directory)
+    names = list(manifest["shards"]) if shards is None else list(shards)
+    unknown = set(names) - manifest["shards"].keys()
+    if unknown:
+        msg = f"Shards {sorted(unknown)} are not part of {directory}."
+        raise ValueError(msg)
+
+    boundary = manifest["boundary"]
+    file_paths = [directory / manifest["shards"][name]["file"] for name in names]
+    file_paths.append(directory / boundary["file"])
+    own_executor = executor is None
+    executor = concurrent.futures.ThreadPoolExecutor() if executor is None else executor
+    try:
+        *parts, boundary_topology = executor.map(_read, file_paths)
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    selected = set(names)
+    sections: dict[str, list[tuple[int, t.Any]]] = {section: [] for section in TOPOLOGY_SECTIONS}
+    for name, part in zip(names, parts, strict=True):
+        for section, elements in sections.items():
+            elements.extend(zip(manifest["shards"][name]["positions"][section], getattr(part, section), strict=True))
+
+    for section in ("branches", "transformers"):
+        sections[section].extend(
+            (i, e)
+            for i, e in zip(boundary["positions"][section], getattr(boundary_topology, section), strict=True)
+            if selected.issuperset(boundary[section][e.name])
+        )
+
+    return Topology(
+        meta=boundary_topology.meta,
+        optional_data=boundary_topology.optional_data,
+        **{
+            section: tuple(e for _, e in sorted(elements, key=lambda p: p[0])) for section, elements in sections.items()
+        },
+    )
@@ -0,0 +1,199 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Memory-mapped time series of steadystate cases.
+
+All cases of a series share the structure of a template case: element names, controller types, units, etc. are
+stored once in the index file. Only the numeric setpoints of each timestep, e.g. `p_set`, `q_set`, `u_0` or `tap_pos`,
+are appended as one row of doubles to a binary file, which is memory-mapped for reading. A single timestep is
+materialized as `Case` on demand, a slice of timesteps is read without touching the rest of the file.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import mmap
+import pathlib
+import typing as t
+
+from psdm.steadystate_case.case import Case
+from psdm.storage.columnar import raw
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.topology.topology import Topology
+
+INDEX_FILE = "index.json"
+VALUES_FILE = "values.f64"
+ITEM_SIZE = array.array("d").itemsize
+STRUCTURAL_KEYS = frozenset({"precision"})  # numeric attributes which are part of the structure of a quantity
+
+
+def _is_number(value: t.Any) -> bool:  # noqa: ANN401
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _extract(template: t.Any, data: t.Any, row: list[float]) -> bool:  # noqa: ANN401
+    """Append the numeric leaves of `data` to `row` and return whether its structure matches the template."""
+    if isinstance(template, dict):
+        if not isinstance(data, dict) or template.keys() != data.keys():
+            return False
+
+        return all(
+            (template[k] == data[k]) if k in STRUCTURAL_KEYS else _extract(template[k], data[k], row) for k in template
+        )
+
+    if isinstance(template, list):
+        if not isinstance(data, list) or len(template) != len(data):
+            return False
+
+        return all(_extract(e, d, row) for e, d in zip(template, data, strict=True))
+
+    if _is_number(template):
+        is_number = _is_number(data)
+        if is_number:
+            row.append(data)
+
+        return is_number
+
+    return template == data
+
+
+def _fill(template: t.Any, values: cabc.Iterator[float]) -> t.Any:  # noqa: ANN401
+    if isinstance(template, dict):
+        return {k: v if k in STRUCTURAL_KEYS else _fill(v, values) for k, v in template.items()}
+
+    if isinstance(template, list):
+        return [_fill(e, values) for e in template]
+
+    if _is_number(template):
+        value = next(values)
+        return int(value) if isinstance(template, int) else value
+
+    return template
+
+
+def _labels(template: t.Any, prefix: str) -> cabc.Iterator[str]:  # noqa: ANN401
+    if isinstance(template, dict):
+        for k, v in template.items():
+            if k not in STRUCTURAL_KEYS:
+                yield from _labels(v, f"{prefix}.{k}" if prefix else k)
+
+    elif isinstance(template, list):
+        for i, e in enumerate(template):
+            key = e["name"] if isinstance(e, dict) and "name" in e else i
+            yield from _labels(e, f"{prefix}[{key}]")
+
+    elif _is_number(template):
+        yield prefix
+
+
+class CaseSeries:
+    """Time series of steadystate cases of one topology backed by a memory-mapped file.
+
+    Create a series with `CaseSeries.create`, open an existing one with `CaseSeries(directory)`.
+    """
+
+    def __init__(self, directory: str | pathlib.Path) -> None:
+        self.directory = pathlib.Path(directory)
+        index = json.loads((self.directory / INDEX_FILE).read_text(encoding="utf-8"))
+        self.topology_id: str = index["topology_id"]
+        self._template = index["template"]
+        row: list[float] = []
+        _extract(self._template, self._template, row)
+        self.n_values = len(row)
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def create(
+        cls,
+        directory: str | pathlib.Path,
+        topology: Topology,
+        cases: cabc.Iterable[Case] = (),
+        template: Case | None = None,
+    ) -> CaseSeries:
+        """Create a series for a topology from a template case (default: the first case) and append the cases."""
+        cases = iter(cases)
+        first = next(cases, None)
+        template = first if template is None else template
+        if template is None:
+            msg = "Either a template or at least one case is required."
+            raise ValueError(msg)
+
+        if not template.matches_topology(topology):
+            msg = "Template case does not match topology."
+            raise ValueError(msg)
+
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        index = {"topology_id": str(topology.meta.id), "template": raw(template)}
+        (directory / INDEX_FILE).write_text(json.dumps(index), encoding="utf-8")
+        (directory / VALUES_FILE).write_bytes(b"")
+        series = cls(directory)
+        series.extend(cases if first is None else (first, *cases))
+        return series
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self) -> int:
+        return (self.directory / VALUES_FILE).stat().st_size // (ITEM_SIZE * self.n_values or 1)
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        """Names of the value columns, e.g. `loads[Load_1].active_power.controller.control_type.p_set.value[0]`."""
+        return tuple(_labels(self._template, ""))
+
+    def _row(self, case: Case) -> array.array:
+        row: list[float] = []
+        if not _extract(self._template, raw(case), row):
+            msg = "Case does not match the structure of the template case."
+            raise ValueError(msg)
+
+        return array.array("d", row)
+
+    def extend(self, cases: cabc.Iterable[Case]) -> None:
+        """Append cases as new timesteps.
+
+        The mapping of the file is renewed on the next read, views returned before keep the previous mapping alive.
+        """
+        self._mmap = None
+        with (self.directory / VALUES_FILE).open("ab") as file_handle:
+            for case in cases:
+                self._row(case).tofile(file_handle)
+
+    def append(self, case: Case) -> None:
+        self.extend((case,))
+
+    def _view(self, start: int, stop: int) -> memoryview[float]:
+        if self._mmap is None:
+            with (self.directory / VALUES_FILE).open("rb") as file_handle:
+                self._mmap = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        row_size = ITEM_SIZE * self.n_values
+        return memoryview(self._mmap)[start * row_size : stop * row_size].cast("d")
+
+    def values(self, start: int = 0, stop: int | None = None) -> memoryview[float]:
+        """Return the values of the timesteps `start` to `stop` as read-only view of shape (n_steps, n_values)."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if stop <= start or self.n_values == 0:
+            return memoryview(array.array("d"))
+
+        return self._view(start, stop).cast("B").cast("d", [stop - start, self.n_values])
+
+    def __getitem__(self, i: int) -> Case:
+        i = range(len(self))[i]
+        return self._materialize(self._view(i, i + 1).tolist())
+
+    def cases(self, start: int = 0, stop: int | None = None) -> cabc.Iterator[Case]:
+        """Materialize the timesteps `start` to `stop` one after another."""
+        for i in range(*slice(start, stop).indices(len(self))):
+            yield self[i]
+
+    def _materialize(self, row: cabc.Sequence[float]) -> Case:
+        return Case.model_validate(_fill(self._template, iter(row)))
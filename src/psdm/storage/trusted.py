@@ -0,0 +1,145 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Loading of trusted JSON without running the validators of the models.
+
+The core schema of a model is stripped of all validator functions, i.e. field and model validators, the uniqueness
+checks of tuples and the conversion of enum members to their values, enums are matched as literal values instead.
+Models are built from their validated fields like `model_construct` does, as pydantic-core would otherwise reuse the
+complete validator of each model class. What remains are the type checks and constraints done by pydantic-core itself,
+which cost little compared to calling back into Python. The garbage collector is paused while the model tree is built,
+it would otherwise scan the growing tree over and over.
+
+Only load data this way that has been validated before, e.g. JSON written by `to_json`. To keep some safety, a random
+sample of the elements of each section can be validated after loading.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import enum
+import functools
+import gc
+import math
+import random
+import typing as t
+
+import pydantic
+import pydantic_core
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+M = t.TypeVar("M", bound=pydantic.BaseModel)
+
+VALIDATOR_FUNCTIONS = frozenset({"function-after", "function-before", "function-wrap"})
+KEPT_KEYS = frozenset({"cls", "config", "function", "metadata", "serialization"})  # no schemas, copied as they are
+
+_object_setattr = object.__setattr__
+
+
+def _constructor(model_type: type[pydantic.BaseModel]) -> cabc.Callable[[tuple[t.Any, ...]], pydantic.BaseModel]:
+    def construct(fields: tuple[dict[str, t.Any], t.Any, set[str]]) -> pydantic.BaseModel:
+        values, _, fields_set = fields
+        model = model_type.__new__(model_type)
+        _object_setattr(model, "__dict__", values)
+        _object_setattr(model, "__pydantic_fields_set__", fields_set)
+        _object_setattr(model, "__pydantic_extra__", None)
+        _object_setattr(model, "__pydantic_private__", None)
+        return model
+
+    return construct
+
+
+def _strip(schema: t.Any) -> t.Any:  # noqa: ANN401
+    """Copy a core schema without validator functions."""
+    if isinstance(schema, list):
+        return [_strip(e) for e in schema]
+
+    if not isinstance(schema, dict):
+        return schema
+
+    schema_type = schema.get("type")
+    if schema_type in VALIDATOR_FUNCTIONS:
+        return _strip(schema["schema"])
+
+    if schema_type == "enum":
+        return {"type": "literal", "expected": [member.value for member in schema["members"]]}
+
+    if schema_type == "model" and not any(schema.get(key) for key in ("custom_init", "post_init", "root_model")):
+        stripped = {
+            "type": "function-after",
+            "function": {"type": "no-info", "function": _constructor(schema["cls"])},
+            "schema": _strip(schema["schema"]),
+        }
+        if "ref" in schema:
+            stripped["ref"] = schema["ref"]
+
+        return stripped
+
+    stripped = {}
+    for key, value in schema.items():
+        if key in KEPT_KEYS:
+            stripped[key] = value
+        elif key == "fields":
+            stripped[key] = {name: _strip(field) for name, field in value.items()}
+        elif key == "default" and isinstance(value, enum.Enum):
+            stripped[key] = value.value
+        else:
+            stripped[key] = _strip(value)
+
+    return stripped
+
+
+@functools.cache
+def validator(model_type: type[pydantic.BaseModel]) -> pydantic_core.SchemaValidator:
+    """Return the validator of a model class which skips all validator functions."""
+    return pydantic_core.SchemaValidator(_strip(model_type.__pydantic_core_schema__))
+
+
+@contextlib.contextmanager
+def gc_paused() -> cabc.Iterator[None]:
+    """Pause the garbage collector while building large trees of models, which hold no reference cycles."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _sections(model: pydantic.BaseModel) -> cabc.Iterator[tuple[str, tuple[pydantic.BaseModel, ...]]]:
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if isinstance(value, tuple) and value and all(isinstance(e, pydantic.BaseModel) for e in value):
+            yield name, value
+
+
+def validate_sample(model: pydantic.BaseModel, sample: float, seed: int | None = None) -> None:
+    """Validate a random share of the elements of each section of a model, at least one element per section.
+
+    Raises a `pydantic.ValidationError` for the first invalid element.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    for _, elements in _sections(model):
+        k = min(len(elements), math.ceil(sample * len(elements)))
+        for i in sorted(rng.sample(range(len(elements)), k)):
+            element = elements[i]
+            type(element).model_validate(element.model_dump())
+
+
+def load(model_type: type[M], json_data: str | bytes, sample: float = 0.0, seed: int | None = None) -> M:
+    """Build a model from trusted JSON, validating the given share of the elements, e.g. 0.01 for 1 %."""
+    if not 0 <= sample <= 1:
+        msg = f"Sample must be a share between 0 and 1, got {sample}."
+        raise ValueError(msg)
+
+    with gc_paused():
+        model = validator(model_type).validate_json(json_data)
+
+    if sample:
+        validate_sample(model, sample, seed)
+
+    return model
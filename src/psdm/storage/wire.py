@@ -0,0 +1,192 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Compact binary wire format for passing models between processes of the same interpreter.
+
+A model is encoded as list of its field values in declaration order followed by its class name, without field names.
+The nested lists are serialized with `marshal`, which writes floats as packed doubles and repeated objects, e.g. class
+names, enum values and models shared between elements, only once and refers to them afterwards. Models referenced more
+than once are flagged, so decoding restores them as one shared instance as well. Decoding restores the
+models without validating them again, so only decode data that was encoded by `encode`, as with `pickle`.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import importlib
+import marshal
+import struct
+import typing as t
+import uuid
+
+import pydantic
+
+HEADER = struct.Struct("<4sBB")
+MAGIC = b"PSDM"
+FORMAT_VERSION = 1
+SHARED = True  # appended to the values of models which are referenced more than once
+
+_object_setattr = object.__setattr__
+
+Memo = dict[int, t.Any]
+Coder = t.Callable[[t.Any, Memo], t.Any]
+
+
+def _contains(annotation: t.Any, predicate: t.Callable[[t.Any], bool]) -> bool:  # noqa: ANN401
+    return predicate(annotation) or any(_contains(arg, predicate) for arg in t.get_args(annotation))
+
+
+def _is_model(annotation: t.Any) -> bool:  # noqa: ANN401
+    return isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel)
+
+
+def _encode_uuid(value: uuid.UUID, _memo: Memo) -> bytes:
+    return value.bytes
+
+
+def _decode_uuid(value: bytes, _memo: Memo) -> uuid.UUID:
+    return uuid.UUID(bytes=value)
+
+
+def _encode_date(value: dt.date, _memo: Memo) -> int:
+    return value.toordinal()
+
+
+def _decode_date(value: int, _memo: Memo) -> dt.date:
+    return dt.date.fromordinal(value)
+
+
+def _encode_value(value: t.Any, memo: Memo) -> t.Any:  # noqa: ANN401
+    if type(value) is tuple:
+        return tuple([_encode_value(e, memo) for e in value])
+
+    if isinstance(value, pydantic.BaseModel):
+        encoded = memo.get(id(value))
+        if encoded is None:
+            encoded = memo[id(value)] = _codec(type(value)).encode(value, memo)
+        elif encoded[-1] is not SHARED:
+            encoded.append(SHARED)
+
+        return encoded
+
+    if type(value) is list:
+        msg = "Lists can not be encoded next to models, use tuples instead."
+        raise ValueError(msg)
+
+    return value
+
+
+def _decode_value(value: t.Any, memo: Memo) -> t.Any:  # noqa: ANN401
+    if type(value) is list:
+        name = value[-1]
+        if name is not SHARED:
+            return _decoder(name).decode(value, memo)
+
+        model = memo.get(id(value))
+        if model is None:
+            model = memo[id(value)] = _decoder(value[-2]).decode(value, memo)
+
+        return model
+
+    if type(value) is tuple:
+        return tuple([_decode_value(e, memo) for e in value])
+
+    return value
+
+
+class _Codec:
+    """Encoder and decoder of one model class, only fields which are no plain data are converted unless they are None."""
+
+    def __init__(self, model_type: type[pydantic.BaseModel]) -> None:
+        if model_type.__private_attributes__:
+            msg = f"{model_type.__qualname__} has private attributes and can not be encoded."
+            raise ValueError(msg)
+
+        self.model_type = model_type
+        self.name = f"{model_type.__module__}:{model_type.__qualname__}"
+        self.fields = tuple(model_type.model_fields)
+        self.fields_set = frozenset(self.fields)
+        encoders: list[tuple[int, Coder]] = []
+        decoders: list[tuple[str, Coder]] = []
+        for i, (name, field) in enumerate(model_type.model_fields.items()):
+            coders: tuple[Coder, Coder]
+            if _contains(field.annotation, lambda a: a is uuid.UUID):
+                coders = (_encode_uuid, _decode_uuid)
+            elif _contains(field.annotation, lambda a: a is dt.date):
+                coders = (_encode_date, _decode_date)
+            elif _contains(field.annotation, _is_model):
+                coders = (_encode_value, _decode_value)
+            else:
+                continue
+
+            encoders.append((i, coders[0]))
+            decoders.append((name, coders[1]))
+
+        self.encoders = tuple(encoders)
+        self.decoders = tuple(decoders)
+
+    def encode(self, model: pydantic.BaseModel, memo: Memo) -> list[t.Any]:
+        data = model.__dict__
+        values = [data[name] for name in self.fields]
+        for i, encoder in self.encoders:
+            if values[i] is not None:
+                values[i] = encoder(values[i], memo)
+
+        values.append(self.name)
+        return values
+
+    def decode(self, values: list[t.Any], memo: Memo) -> pydantic.BaseModel:
+        data = dict(zip(self.fields, values, strict=False))  # the class name is the surplus last value
+        for name, decoder in self.decoders:
+            if data[name] is not None:
+                data[name] = decoder(data[name], memo)
+
+        model = self.model_type.__new__(self.model_type)
+        _object_setattr(model, "__dict__", data)
+        _object_setattr(model, "__pydantic_fields_set__", set(self.fields_set))
+        _object_setattr(model, "__pydantic_extra__", None)
+        _object_setattr(model, "__pydantic_private__", None)
+        return model
+
+
+@functools.cache
+def _codec(model_type: type[pydantic.BaseModel]) -> _Codec:
+    return _Codec(model_type)
+
+
+@functools.cache
+def _decoder(name: str) -> _Codec:
+    module_name, _, qualname = name.partition(":")
+    model_type: t.Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        model_type = getattr(model_type, attribute)
+
+    if not _is_model(model_type):
+        msg = f"{name} is not a model."
+        raise ValueError(msg)
+
+    return _codec(model_type)
+
+
+def encode(model: pydantic.BaseModel | tuple[pydantic.BaseModel, ...]) -> bytes:
+    """Encode a model or a tuple of models, e.g. a batch of elements."""
+    return HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version) + marshal.dumps(_encode_value(model, {}))
+
+
+def decode(data: bytes) -> pydantic.BaseModel | tuple[pydantic.BaseModel, ...]:
+    try:
+        magic, format_version, marshal_version = HEADER.unpack_from(data)
+    except struct.error:
+        magic = None
+
+    if magic != MAGIC:
+        msg = "Data is not in psdm wire format."
+        raise ValueError(msg)
+
+    if (format_version, marshal_version) != (FORMAT_VERSION, marshal.version):
+        msg = f"Unsupported wire format version {format_version}/{marshal_version}."
+        raise ValueError(msg)
+
+    return _decode_value(marshal.loads(memoryview(data)[HEADER.size :]), {})  # noqa: S302
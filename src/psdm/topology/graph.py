@@ -0,0 +1,733 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Node adjacency of a topology in compressed sparse row (CSR) format and analyses based on it.
+
+Nodes are numbered in the order of `Topology.nodes`. Every branch is an edge between its two nodes, every transformer
+an edge between each pair of its terminal nodes, i.e. one edge for a 2-winding and three edges for a 3-winding unit.
+Parallel elements are kept as separate edges. Each edge refers back to its element by element type and index.
+The reverse index of all elements attached to a node, including loads and external grids, is `Attachments`.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import dataclasses
+import itertools
+import types
+import typing as t
+
+from psdm.topology.external_grid import GridType
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.topology.branch import Branch
+    from psdm.topology.external_grid import ExternalGrid
+    from psdm.topology.load import Load
+    from psdm.topology.topology import Topology
+    from psdm.topology.transformer import Transformer
+    from psdm.topology_case.case import Case as TopologyCase
+
+EDGE_ELEMENT_TYPES = ("branches", "transformers")  # element type code of an edge is the index in this tuple
+ATTACHED_ELEMENT_TYPES = (*EDGE_ELEMENT_TYPES, "loads", "external_grids")
+BRANCH = 0
+TRANSFORMER = 1
+LOAD = 2
+EXTERNAL_GRID = 3
+
+
+def transformer_nodes(transformer: Transformer) -> tuple[str, ...]:
+    """Return the distinct terminal nodes of a transformer, including the nodes of further windings."""
+    nodes = (transformer.node_1, transformer.node_2, *(winding.node for winding in transformer.windings))
+    return tuple(dict.fromkeys(nodes))
+
+
+@dataclasses.dataclass(frozen=True)
+class Adjacency:
+    """Adjacency of the nodes of a topology.
+
+    The edges at node `i` are `edges[indptr[i]:indptr[i + 1]]`, the node at their other end is the corresponding entry
+    of `neighbours`. Self-loops are listed once. Edge `e` connects `edge_node_1[e]` and `edge_node_2[e]` and belongs to
+    element `edge_element[e]` of the element type `EDGE_ELEMENT_TYPES[edge_type[e]]`.
+    """
+
+    node_names: tuple[str, ...]
+    node_ids: cabc.Mapping[str, int]
+    indptr: array.array[int]
+    neighbours: array.array[int]
+    edges: array.array[int]
+    edge_node_1: array.array[int]
+    edge_node_2: array.array[int]
+    edge_type: array.array[int]
+    edge_element: array.array[int]
+
+    @classmethod
+    def from_topology(cls, topology: Topology) -> Adjacency:
+        node_names = tuple(node.name for node in topology.nodes)
+        ids = {name: i for i, name in enumerate(node_names)}
+        edge_node_1 = array.array("q")
+        edge_node_2 = array.array("q")
+        edge_type = array.array("b")
+        edge_element = array.array("q")
+
+        def node_id(name: str, element: Branch | Transformer) -> int:
+            try:
+                return ids[name]
+            except KeyError:
+                msg = f"Node {name} of {element.name} is not part of the topology."
+                raise ValueError(msg) from None
+
+        for i, branch in enumerate(topology.branches):
+            edge_node_1.append(node_id(branch.node_1, branch))
+            edge_node_2.append(node_id(branch.node_2, branch))
+            edge_type.append(BRANCH)
+            edge_element.append(i)
+
+        for i, transformer in enumerate(topology.transformers):
+            nodes = [node_id(name, transformer) for name in transformer_nodes(transformer)]
+            for node_1, node_2 in itertools.combinations(nodes, 2):
+                edge_node_1.append(node_1)
+                edge_node_2.append(node_2)
+                edge_type.append(TRANSFORMER)
+                edge_element.append(i)
+
+        # counting sort of the edge ends by node
+        counts = [0] * (len(node_names) + 1)
+        for node_1, node_2 in zip(edge_node_1, edge_node_2, strict=True):
+            counts[node_1 + 1] += 1
+            if node_2 != node_1:
+                counts[node_2 + 1] += 1
+
+        indptr = array.array("q", itertools.accumulate(counts))
+        cursor = indptr.tolist()
+        neighbours = array.array("q", bytes(8 * indptr[-1]))
+        edges = array.array("q", bytes(8 * indptr[-1]))
+        for edge, (node_1, node_2) in enumerate(zip(edge_node_1, edge_node_2, strict=True)):
+            neighbours[cursor[node_1]] = node_2
+            edges[cursor[node_1]] = edge
+            cursor[node_1] += 1
+            if node_2 != node_1:
+                neighbours[cursor[node_2]] = node_1
+                edges[cursor[node_2]] = edge
+                cursor[node_2] += 1
+
+        return cls(
+            node_names=node_names,
+            node_ids=types.MappingProxyType(ids),
+            indptr=indptr,
+            neighbours=neighbours,
+            edges=edges,
+            edge_node_1=edge_node_1,
+            edge_node_2=edge_node_2,
+            edge_type=edge_type,
+            edge_element=edge_element,
+        )
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.node_names)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edge_type)
+
+    def degree(self, node: int) -> int:
+        return self.indptr[node + 1] - self.indptr[node]
+
+    def neighbours_of(self, node: int) -> array.array[int]:
+        return self.neighbours[self.indptr[node] : self.indptr[node + 1]]
+
+    def edges_of(self, node: int) -> array.array[int]:
+        return self.edges[self.indptr[node] : self.indptr[node + 1]]
+
+    def edges_between(self, node_1: int, node_2: int) -> list[int]:
+        """Return all edges between two nodes, i.e. parallel elements."""
+        start, stop = self.indptr[node_1], self.indptr[node_1 + 1]
+        return [self.edges[i] for i in range(start, stop) if self.neighbours[i] == node_2]
+
+    def element(self, topology: Topology, edge: int) -> Branch | Transformer:
+        """Return the element of an edge."""
+        return getattr(topology, EDGE_ELEMENT_TYPES[self.edge_type[edge]])[self.edge_element[edge]]
+
+    def element_edges(self, edge_type: int, element: int) -> range:
+        """Return the edges of an element, which are numbered consecutively."""
+        lo = bisect.bisect_left(self.edge_type, edge_type)
+        hi = bisect.bisect_right(self.edge_type, edge_type, lo)
+        start = bisect.bisect_left(self.edge_element, element, lo, hi)
+        return range(start, bisect.bisect_right(self.edge_element, element, start, hi))
+
+
+@dataclasses.dataclass(frozen=True)
+class Islands:
+    """Island membership of the nodes of a topology.
+
+    `node_island[i]` is the island of node `i` of `Topology.nodes` or `NO_ISLAND` if the node is disabled. Islands are
+    numbered in the order of their first node. An island is energized if it contains an enabled slack external grid.
+    """
+
+    node_names: tuple[str, ...]
+    node_ids: cabc.Mapping[str, int]
+    node_island: array.array[int]
+    n_islands: int
+    energized: frozenset[int]
+
+    def island_of(self, node: str) -> int:
+        return self.node_island[self.node_ids[node]]
+
+    def nodes_of(self, island: int) -> tuple[str, ...]:
+        return tuple(name for name, i in zip(self.node_names, self.node_island, strict=True) if i == island)
+
+    @property
+    def energized_nodes(self) -> tuple[str, ...]:
+        return tuple(name for name, i in zip(self.node_names, self.node_island, strict=True) if i in self.energized)
+
+
+NO_ISLAND = -1
+
+
+def case_masks(topology: Topology, topology_case: TopologyCase | None) -> tuple[bytearray, bytearray]:
+    """Return which nodes are disabled and which edges are disabled or opened by a topology case."""
+    adjacency = topology.adjacency
+    node_disabled = bytearray(adjacency.n_nodes)
+    edge_blocked = bytearray(adjacency.n_edges)
+    if topology_case is None:
+        return node_disabled, edge_blocked
+
+    element_ids = (
+        {e.name: i for i, e in enumerate(topology.branches)},
+        {e.name: i for i, e in enumerate(topology.transformers)},
+    )
+    for state in topology_case.elements:
+        if state.disabled and state.name in adjacency.node_ids:
+            node_disabled[adjacency.node_ids[state.name]] = 1
+
+        open_nodes = {adjacency.node_ids.get(name) for name in state.open_switches}
+        for edge_type, ids in enumerate(element_ids):
+            if state.name in ids:
+                for edge in adjacency.element_edges(edge_type, ids[state.name]):
+                    if state.disabled or {adjacency.edge_node_1[edge], adjacency.edge_node_2[edge]} & open_nodes:
+                        edge_blocked[edge] = 1
+
+    return node_disabled, edge_blocked
+
+
+def components(
+    n_nodes: int,
+    edges: cabc.Iterable[tuple[int, int]],
+    node_excluded: cabc.Sequence[int],
+) -> tuple[array.array[int], int]:
+    """Number the connected components of nodes joined by edges using union-find.
+
+    Components are numbered in the order of their first node. Excluded nodes belong to no component, i.e. -1, and
+    edges at an excluded node are ignored. Returns the component of each node and the number of components.
+    """
+    parent = list(range(n_nodes))
+    for node_1, node_2 in edges:
+        if node_excluded[node_1] or node_excluded[node_2]:
+            continue
+
+        # find the roots with path halving, then attach the larger to the smaller root
+        root_1 = node_1
+        while parent[root_1] != root_1:
+            parent[root_1] = root_1 = parent[parent[root_1]]
+        root_2 = node_2
+        while parent[root_2] != root_2:
+            parent[root_2] = root_2 = parent[parent[root_2]]
+        if root_1 < root_2:
+            parent[root_2] = root_1
+        elif root_2 < root_1:
+            parent[root_1] = root_2
+
+    # parents are always smaller than their children, so a single pass in node order resolves all nodes
+    node_component = array.array("q", bytes(8 * n_nodes))
+    n_components = 0
+    for node in range(n_nodes):
+        if node_excluded[node]:
+            node_component[node] = -1
+        elif parent[node] == node:
+            node_component[node] = n_components
+            n_components += 1
+        else:
+            node_component[node] = node_component[parent[node]]
+
+    return node_component, n_components
+
+
+def islands(topology: Topology, topology_case: TopologyCase | None = None) -> Islands:
+    """Determine the islands of a topology using union-find over the edges of its adjacency.
+
+    Disabled nodes belong to no island. Disabled branches and transformers do not connect their nodes, neither do
+    their terminals with an open switch, i.e. a 3-winding transformer with one open terminal still connects the others.
+    """
+    adjacency = topology.adjacency
+    n_nodes = adjacency.n_nodes
+    node_disabled, edge_blocked = case_masks(topology, topology_case)
+    node_island, n_islands = components(
+        n_nodes,
+        (
+            (node_1, node_2)
+            for node_1, node_2, blocked in zip(adjacency.edge_node_1, adjacency.edge_node_2, edge_blocked, strict=True)
+            if not blocked
+        ),
+        node_disabled,
+    )
+
+    disabled = set() if topology_case is None else {e.name for e in topology_case.elements if e.disabled}
+    energized = frozenset(
+        node_island[adjacency.node_ids[e.node]]
+        for e in topology.external_grids
+        if e.type == GridType.SL.value and e.name not in disabled and e.node in adjacency.node_ids
+    )
+    return Islands(
+        node_names=adjacency.node_names,
+        node_ids=adjacency.node_ids,
+        node_island=node_island,
+        n_islands=n_islands,
+        energized=energized - {NO_ISLAND},
+    )
+
+
+NO_FEEDER = -1
+
+
+def group(
+    items: cabc.Iterable[int],
+    keys: cabc.Sequence[int],
+    n_groups: int,
+) -> tuple[array.array[int], array.array[int]]:
+    """Counting sort of items by their key in `keys`, keeping the order of the items within each group.
+
+    Returns the offsets of the groups and the sorted items, group `k` is `items[indptr[k]:indptr[k + 1]]`.
+    """
+    items = list(items)
+    counts = [0] * (n_groups + 1)
+    for item in items:
+        counts[keys[item] + 1] += 1
+
+    indptr = array.array("q", itertools.accumulate(counts))
+    cursor = indptr.tolist()
+    order = array.array("q", bytes(8 * len(items)))
+    for item in items:
+        key = keys[item]
+        order[cursor[key]] = item
+        cursor[key] += 1
+
+    return indptr, order
+
+
+@dataclasses.dataclass(frozen=True)
+class Feeders:
+    """Radial feeders of a topology traced breadth-first from their roots.
+
+    Roots are the nodes of enabled external grids and the secondary nodes of transformers. Feeders follow branches,
+    transformers are their boundaries. Node `i` belongs to feeder `node_feeder[i]` starting at node
+    `roots[node_feeder[i]]` and is fed from node `node_parent[i]` via branch `parent_branch[i]` at `depth[i]` branches
+    from the root. Nodes which are disabled or not reached from any root have `NO_FEEDER` and -1 everywhere, roots have
+    no parent. The nodes of feeder `f` are `order[indptr[f]:indptr[f + 1]]` in breadth-first order starting with its
+    root, so every node follows its parent, the indices of its loads are `loads[load_indptr[f]:load_indptr[f + 1]]`.
+    Branches which close a mesh, i.e. connect two already fed nodes within or between feeders, are listed in `meshes`.
+    """
+
+    node_names: tuple[str, ...]
+    node_ids: cabc.Mapping[str, int]
+    roots: array.array[int]
+    node_feeder: array.array[int]
+    node_parent: array.array[int]
+    parent_branch: array.array[int]
+    depth: array.array[int]
+    indptr: array.array[int]
+    order: array.array[int]
+    load_indptr: array.array[int]
+    loads: array.array[int]
+    meshes: tuple[int, ...]
+
+    @property
+    def n_feeders(self) -> int:
+        return len(self.roots)
+
+    @property
+    def is_radial(self) -> bool:
+        return not self.meshes
+
+    def feeder_of(self, node: str) -> int:
+        return self.node_feeder[self.node_ids[node]]
+
+    def root_of(self, node: str) -> str | None:
+        feeder = self.feeder_of(node)
+        return None if feeder == NO_FEEDER else self.node_names[self.roots[feeder]]
+
+    def nodes_of(self, feeder: int) -> array.array[int]:
+        """Return the nodes of a feeder in breadth-first order."""
+        return self.order[self.indptr[feeder] : self.indptr[feeder + 1]]
+
+    def branches_of(self, feeder: int) -> list[int]:
+        """Return the branches of a feeder in breadth-first order, i.e. the parent branch of each node but the root."""
+        return [self.parent_branch[node] for node in self.order[self.indptr[feeder] + 1 : self.indptr[feeder + 1]]]
+
+    def loads_of(self, feeder: int) -> array.array[int]:
+        return self.loads[self.load_indptr[feeder] : self.load_indptr[feeder + 1]]
+
+
+def _feeder_roots(
+    topology: Topology,
+    node_disabled: bytearray,
+    edge_blocked: bytearray,
+    disabled: set[str],
+) -> list[int]:
+    adjacency = topology.adjacency
+    roots = {
+        adjacency.node_ids[e.node]: None
+        for e in topology.external_grids
+        if e.name not in disabled and e.node in adjacency.node_ids
+    }
+    for i, transformer in enumerate(topology.transformers):
+        primary = adjacency.node_ids[transformer.node_1]
+        if node_disabled[primary]:
+            continue
+
+        for edge in adjacency.element_edges(TRANSFORMER, i):
+            if not edge_blocked[edge] and adjacency.edge_node_1[edge] == primary:
+                roots.setdefault(adjacency.edge_node_2[edge])
+
+    return [node for node in roots if not node_disabled[node]]
+
+
+def feeders(topology: Topology, topology_case: TopologyCase | None = None) -> Feeders:
+    """Trace the radial feeders of a topology by a breadth-first search from all roots at once.
+
+    Disabled nodes and branches as well as branches with an open switch are not traversed, disabled external grids and
+    transformers, transformers at a disabled primary node or transformer terminals with an open switch do not form a
+    root.
+    """
+    adjacency = topology.adjacency
+    n_nodes = adjacency.n_nodes
+    node_disabled, edge_blocked = case_masks(topology, topology_case)
+    disabled = set() if topology_case is None else {e.name for e in topology_case.elements if e.disabled}
+    roots = _feeder_roots(topology, node_disabled, edge_blocked, disabled)
+    node_feeder = array.array("q", [NO_FEEDER]) * n_nodes
+    node_parent = array.array("q", [-1]) * n_nodes
+    parent_branch = array.array("q", [-1]) * n_nodes
+    depth = array.array("q", [-1]) * n_nodes
+    for feeder, root in enumerate(roots):
+        node_feeder[root] = feeder
+        depth[root] = 0
+
+    indptr, neighbours, edges = adjacency.indptr, adjacency.neighbours, adjacency.edges
+    queue = list(roots)
+    head = 0
+    while head < len(queue):
+        node = queue[head]
+        head += 1
+        for i in range(indptr[node], indptr[node + 1]):
+            edge = edges[i]
+            neighbour = neighbours[i]
+            if (
+                adjacency.edge_type[edge] != BRANCH
+                or edge_blocked[edge]
+                or node_disabled[neighbour]
+                or node_feeder[neighbour] != NO_FEEDER
+            ):
+                continue
+
+            node_feeder[neighbour] = node_feeder[node]
+            node_parent[neighbour] = node
+            parent_branch[neighbour] = adjacency.edge_element[edge]
+            depth[neighbour] = depth[node] + 1
+            queue.append(neighbour)
+
+    tree = set(parent_branch)
+    meshes = tuple(
+        adjacency.edge_element[edge]
+        for edge in range(adjacency.n_edges)
+        if adjacency.edge_type[edge] == BRANCH
+        and not edge_blocked[edge]
+        and node_feeder[adjacency.edge_node_1[edge]] != NO_FEEDER
+        and node_feeder[adjacency.edge_node_2[edge]] != NO_FEEDER
+        and adjacency.edge_element[edge] not in tree
+    )
+    load_feeder = [
+        node_feeder[adjacency.node_ids[e.node]]
+        if e.name not in disabled and e.node in adjacency.node_ids
+        else NO_FEEDER
+        for e in topology.loads
+    ]
+    order_indptr, order = group(queue, node_feeder, len(roots))
+    load_indptr, loads = group(
+        (i for i, feeder in enumerate(load_feeder) if feeder != NO_FEEDER),
+        load_feeder,
+        len(roots),
+    )
+    return Feeders(
+        node_names=adjacency.node_names,
+        node_ids=adjacency.node_ids,
+        roots=array.array("q", roots),
+        node_feeder=node_feeder,
+        node_parent=node_parent,
+        parent_branch=parent_branch,
+        depth=depth,
+        indptr=order_indptr,
+        order=order,
+        load_indptr=load_indptr,
+        loads=loads,
+        meshes=meshes,
+    )
+
+
+NO_SUBNETWORK = -1
+
+
+@dataclasses.dataclass(frozen=True)
+class Subnetworks:
+    """Connected subnetworks of the nodes of one nominal voltage and their fundamental cycles.
+
+    Only edges between nodes of equal `Node.u_n` connect nodes of a subnetwork, so transformers usually separate
+    subnetworks. Node `i` belongs to subnetwork `node_subnetwork[i]`, or to `NO_SUBNETWORK` if it is disabled, and
+    is reached from node `node_parent[i]` via edge `parent_edge[i]` of the spanning tree at `depth[i]`. The nodes of
+    subnetwork `s` are `nodes[indptr[s]:indptr[s + 1]]`. The edges not in the spanning tree, the chords, of subnetwork
+    `s` are `chords[chord_indptr[s]:chord_indptr[s + 1]]`. Each chord closes one cycle of the fundamental cycle basis,
+    so their number is the cyclomatic number of the subnetwork. Cycles are created on request only.
+    """
+
+    node_names: tuple[str, ...]
+    node_ids: cabc.Mapping[str, int]
+    node_subnetwork: array.array[int]
+    node_parent: array.array[int]
+    parent_edge: array.array[int]
+    depth: array.array[int]
+    u_n: tuple[float, ...]
+    indptr: array.array[int]
+    nodes: array.array[int]
+    chord_indptr: array.array[int]
+    chords: array.array[int]
+    chord_node_1: array.array[int]
+    chord_node_2: array.array[int]
+
+    @property
+    def n_subnetworks(self) -> int:
+        return len(self.u_n)
+
+    def subnetwork_of(self, node: str) -> int:
+        return self.node_subnetwork[self.node_ids[node]]
+
+    def nodes_of(self, subnetwork: int) -> tuple[str, ...]:
+        return tuple(
+            self.node_names[node] for node in self.nodes[self.indptr[subnetwork] : self.indptr[subnetwork + 1]]
+        )
+
+    def cyclomatic_number(self, subnetwork: int) -> int:
+        return self.chord_indptr[subnetwork + 1] - self.chord_indptr[subnetwork]
+
+    def is_radial(self, subnetwork: int) -> bool:
+        return self.cyclomatic_number(subnetwork) == 0
+
+    @property
+    def meshed(self) -> tuple[int, ...]:
+        """Subnetworks with at least one cycle."""
+        return tuple(s for s in range(self.n_subnetworks) if not self.is_radial(s))
+
+    def cycle(self, chord: int) -> list[int]:
+        """Return the edges of the fundamental cycle of the chord `chords[chord]`.
+
+        The edges follow the spanning tree from the first node of the chord to its second node, the chord closes it.
+        """
+        node_1, node_2 = self.chord_node_1[chord], self.chord_node_2[chord]
+        path_1: list[int] = []
+        path_2: list[int] = []
+        while self.depth[node_1] > self.depth[node_2]:
+            path_1.append(self.parent_edge[node_1])
+            node_1 = self.node_parent[node_1]
+        while self.depth[node_2] > self.depth[node_1]:
+            path_2.append(self.parent_edge[node_2])
+            node_2 = self.node_parent[node_2]
+        while node_1 != node_2:
+            path_1.append(self.parent_edge[node_1])
+            path_2.append(self.parent_edge[node_2])
+            node_1, node_2 = self.node_parent[node_1], self.node_parent[node_2]
+
+        return [*path_1, *reversed(path_2), self.chords[chord]]
+
+    def cycle_basis(self, subnetwork: int) -> list[list[int]]:
+        """Return the fundamental cycles of a subnetwork as lists of edges."""
+        return [self.cycle(chord) for chord in range(self.chord_indptr[subnetwork], self.chord_indptr[subnetwork + 1])]
+
+
+def subnetworks(topology: Topology, topology_case: TopologyCase | None = None) -> Subnetworks:
+    """Split a topology into subnetworks per nominal voltage and find their spanning trees by breadth-first search.
+
+    Disabled nodes belong to no subnetwork, disabled elements and terminals with an open switch do not connect nodes.
+    """
+    adjacency = topology.adjacency
+    n_nodes = adjacency.n_nodes
+    node_disabled, edge_blocked = case_masks(topology, topology_case)
+    u_n = [node.u_n.value for node in topology.nodes]
+    node_subnetwork = array.array("q", [NO_SUBNETWORK]) * n_nodes
+    node_parent = array.array("q", [-1]) * n_nodes
+    parent_edge = array.array("q", [-1]) * n_nodes
+    depth = array.array("q", [-1]) * n_nodes
+    subnetwork_u_n: list[float] = []
+    indptr, neighbours, edges = adjacency.indptr, adjacency.neighbours, adjacency.edges
+    for start in range(n_nodes):
+        if node_disabled[start] or node_subnetwork[start] != NO_SUBNETWORK:
+            continue
+
+        subnetwork = len(subnetwork_u_n)
+        subnetwork_u_n.append(u_n[start])
+        node_subnetwork[start] = subnetwork
+        depth[start] = 0
+        queue = [start]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for i in range(indptr[node], indptr[node + 1]):
+                neighbour = neighbours[i]
+                if (
+                    node_subnetwork[neighbour] != NO_SUBNETWORK
+                    or node_disabled[neighbour]
+                    or edge_blocked[edges[i]]
+                    or u_n[neighbour] != u_n[node]
+                ):
+                    continue
+
+                node_subnetwork[neighbour] = subnetwork
+                node_parent[neighbour] = node
+                parent_edge[neighbour] = edges[i]
+                depth[neighbour] = depth[node] + 1
+                queue.append(neighbour)
+
+    tree = set(parent_edge)
+    chord_subnetwork = [
+        node_subnetwork[node_1]
+        if node_subnetwork[node_1] != NO_SUBNETWORK
+        and node_subnetwork[node_1] == node_subnetwork[node_2]
+        and not edge_blocked[edge]
+        and edge not in tree
+        else NO_SUBNETWORK
+        for edge, (node_1, node_2) in enumerate(zip(adjacency.edge_node_1, adjacency.edge_node_2, strict=True))
+    ]
+    chord_indptr, chords = group(
+        (edge for edge, s in enumerate(chord_subnetwork) if s != NO_SUBNETWORK),
+        chord_subnetwork,
+        len(subnetwork_u_n),
+    )
+    node_indptr, nodes = group(
+        (node for node in range(n_nodes) if node_subnetwork[node] != NO_SUBNETWORK),
+        node_subnetwork,
+        len(subnetwork_u_n),
+    )
+    return Subnetworks(
+        node_names=adjacency.node_names,
+        node_ids=adjacency.node_ids,
+        node_subnetwork=node_subnetwork,
+        node_parent=node_parent,
+        parent_edge=parent_edge,
+        depth=depth,
+        u_n=tuple(subnetwork_u_n),
+        indptr=node_indptr,
+        nodes=nodes,
+        chord_indptr=chord_indptr,
+        chords=chords,
+        chord_node_1=array.array("q", (adjacency.edge_node_1[edge] for edge in chords)),
+        chord_node_2=array.array("q", (adjacency.edge_node_2[edge] for edge in chords)),
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class Attached:
+    """Elements attached to one node."""
+
+    branches: tuple[tuple[Branch, int], ...]  # branch and its end at the node, 1 or 2
+    transformers: tuple[tuple[Transformer, int], ...]  # transformer and its winding at the node, see `Attachments`
+    loads: tuple[Load, ...]
+    external_grids: tuple[ExternalGrid, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class Attachments:
+    """Reverse index of node to the elements attached to it.
+
+    The attachments of node `i` are the rows `indptr[i]:indptr[i + 1]`. Row `r` refers to element `element[r]` of the
+    element type `ATTACHED_ELEMENT_TYPES[element_type[r]]`, attached by its `terminal[r]`, i.e. the branch end 1 or 2,
+    the winding index of a transformer or 0 for loads and external grids. Transformers are attached to `node_1` and
+    `node_2` as terminal -1 and -2 if no winding is at these nodes, so they are attached to all of their
+    `transformer_nodes`. Rows of a node are ordered by element type.
+    """
+
+    node_names: tuple[str, ...]
+    node_ids: cabc.Mapping[str, int]
+    indptr: array.array[int]
+    element_type: array.array[int]
+    element: array.array[int]
+    terminal: array.array[int]
+
+    @classmethod
+    def from_topology(cls, topology: Topology) -> Attachments:
+        node_names = tuple(node.name for node in topology.nodes)
+        ids = {name: i for i, name in enumerate(node_names)}
+        nodes: list[int] = []
+        element_type = array.array("b")
+        element = array.array("q")
+        terminal = array.array("b")
+
+        def attach(name: str, kind: int, i: int, end: int, element_name: str) -> None:
+            try:
+                nodes.append(ids[name])
+            except KeyError:
+                msg = f"Node {name} of {element_name} is not part of the topology."
+                raise ValueError(msg) from None
+
+            element_type.append(kind)
+            element.append(i)
+            terminal.append(end)
+
+        for i, branch in enumerate(topology.branches):
+            attach(branch.node_1, BRANCH, i, 1, branch.name)
+            attach(branch.node_2, BRANCH, i, 2, branch.name)
+
+        for i, transformer in enumerate(topology.transformers):
+            attached = set()
+            for j, winding in enumerate(transformer.windings):
+                attach(winding.node, TRANSFORMER, i, j, transformer.name)
+                attached.add(winding.node)
+
+            for end, node in ((-1, transformer.node_1), (-2, transformer.node_2)):
+                if node not in attached:
+                    attach(node, TRANSFORMER, i, end, transformer.name)
+                    attached.add(node)
+
+        for i, load in enumerate(topology.loads):
+            attach(load.node, LOAD, i, 0, load.name)
+
+        for i, external_grid in enumerate(topology.external_grids):
+            attach(external_grid.node, EXTERNAL_GRID, i, 0, external_grid.name)
+
+        indptr, order = group(range(len(nodes)), nodes, len(node_names))
+        return cls(
+            node_names=node_names,
+            node_ids=types.MappingProxyType(ids),
+            indptr=indptr,
+            element_type=array.array("b", (element_type[r] for r in order)),
+            element=array.array("q", (element[r] for r in order)),
+            terminal=array.array("b", (terminal[r] for r in order)),
+        )
+
+    def degree(self, node: int) -> int:
+        """Return the number of attachments of a node."""
+        return self.indptr[node + 1] - self.indptr[node]
+
+    def rows(self, node: int) -> range:
+        return range(self.indptr[node], self.indptr[node + 1])
+
+    def attached(self, topology: Topology, node: str) -> Attached:
+        """Return the elements attached to a node, in O(degree) of the node."""
+        sections: tuple[list[t.Any], ...] = ([], [], [], [])
+        for row in self.rows(self.node_ids[node]):
+            kind = self.element_type[row]
+            value = getattr(topology, ATTACHED_ELEMENT_TYPES[kind])[self.element[row]]
+            sections[kind].append((value, self.terminal[row]) if kind in {BRANCH, TRANSFORMER} else value)
+
+        branches, transformers, loads, external_grids = (tuple(section) for section in sections)
+        return Attached(branches=branches, transformers=transformers, loads=loads, external_grids=external_grids)
@@ -0,0 +1,188 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Queries over the elements of a topology backed by lazily built secondary indexes.
+
+Attributes are given as dotted paths, e.g. `type` or `u_n.value`, a path through a missing optional attribute yields
+None. Equality queries use a mapping of attribute value to the set of element indices, range queries a sorted array of
+the numeric attribute values. Both are built on the first query of an attribute and kept for further queries. Queries
+return a `Selection` of element indices, which can be combined with `&`, `|`, `-` and `~`.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import dataclasses
+import enum
+import functools
+import typing as t
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+    from psdm.topology.topology import Topology
+
+
+@dataclasses.dataclass(frozen=True)
+class Selection:
+    """Set of indices of elements of one section."""
+
+    section: tuple[t.Any, ...]
+    members: frozenset[int]
+
+    def _check(self, other: Selection) -> None:
+        if other.section is not self.section:
+            msg = "Selections of different sections can not be combined."
+            raise ValueError(msg)
+
+    def __and__(self, other: Selection) -> Selection:
+        self._check(other)
+        return Selection(self.section, self.members & other.members)
+
+    def __or__(self, other: Selection) -> Selection:
+        self._check(other)
+        return Selection(self.section, self.members | other.members)
+
+    def __sub__(self, other: Selection) -> Selection:
+        self._check(other)
+        return Selection(self.section, self.members - other.members)
+
+    def __invert__(self) -> Selection:
+        return Selection(self.section, frozenset(range(len(self.section))) - self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __contains__(self, index: object) -> bool:
+        return index in self.members
+
+    def indices(self) -> array.array[int]:
+        """Return the selected indices in ascending order."""
+        return array.array("q", sorted(self.members))
+
+    def elements(self) -> tuple[t.Any, ...]:
+        """Return the selected elements in the order of the section."""
+        return tuple(self.section[i] for i in sorted(self.members))
+
+
+def _normalize(value: t.Any) -> t.Any:  # noqa: ANN401
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _path_value(element: t.Any, path: tuple[str, ...]) -> t.Any:  # noqa: ANN401
+    value = element
+    for name in path:
+        if value is None:
+            return None
+
+        value = getattr(value, name)
+
+    return value
+
+
+class SectionIndex:
+    """Secondary indexes of the elements of one topology section."""
+
+    def __init__(self, section: tuple[t.Any, ...]) -> None:
+        self.section = section
+        self._equal: dict[str, dict[t.Any, frozenset[int]]] = {}
+        self._sorted: dict[str, tuple[array.array[float], array.array[int]]] = {}
+        self._optional_data: dict[str, frozenset[int]] | None = None
+
+    def _values(self, attribute: str) -> cabc.Iterator[tuple[int, t.Any]]:
+        path = tuple(attribute.split("."))
+        return ((i, _path_value(e, path)) for i, e in enumerate(self.section))
+
+    def _equal_index(self, attribute: str) -> dict[t.Any, frozenset[int]]:
+        index = self._equal.get(attribute)
+        if index is None:
+            groups: dict[t.Any, list[int]] = {}
+            try:
+                for i, value in self._values(attribute):
+                    groups.setdefault(value, []).append(i)
+            except TypeError:
+                msg = f"Values of {attribute} are not hashable."
+                raise TypeError(msg) from None
+
+            index = self._equal[attribute] = {value: frozenset(indices) for value, indices in groups.items()}
+
+        return index
+
+    def _sorted_index(self, attribute: str) -> tuple[array.array[float], array.array[int]]:
+        index = self._sorted.get(attribute)
+        if index is None:
+            pairs = []
+            for i, value in self._values(attribute):
+                if value is None:
+                    continue
+
+                if isinstance(value, bool) or not isinstance(value, int | float):
+                    msg = f"Values of {attribute} are not numeric."
+                    raise TypeError(msg)
+
+                pairs.append((value, i))
+
+            pairs.sort()
+            index = self._sorted[attribute] = (
+                array.array("d", (value for value, _ in pairs)),
+                array.array("q", (i for _, i in pairs)),
+            )
+
+        return index
+
+    def all(self) -> Selection:
+        return Selection(self.section, frozenset(range(len(self.section))))
+
+    def equal(self, attribute: str, *values: t.Any) -> Selection:  # noqa: ANN401
+        """Select the elements whose attribute equals one of the values, enum members match their value."""
+        index = self._equal_index(attribute)
+        groups = [index.get(_normalize(value), frozenset()) for value in values]
+        return Selection(self.section, groups[0] if len(groups) == 1 else frozenset().union(*groups))
+
+    def between(self, attribute: str, lower: float | None = None, upper: float | None = None) -> Selection:
+        """Select the elements whose numeric attribute is within the closed interval, None leaves a side open."""
+        values, order = self._sorted_index(attribute)
+        start = 0 if lower is None else bisect.bisect_left(values, lower)
+        stop = len(values) if upper is None else bisect.bisect_right(values, upper)
+        return Selection(self.section, frozenset(order[start:stop]))
+
+    def has_optional_data(self, name: str) -> Selection:
+        """Select the elements with an entry of the name in their optional data."""
+        if self._optional_data is None:
+            groups: dict[str, list[int]] = {}
+            for i, element in enumerate(self.section):
+                for data in element.optional_data or ():
+                    groups.setdefault(data.name, []).append(i)
+
+            self._optional_data = {key: frozenset(indices) for key, indices in groups.items()}
+
+        return Selection(self.section, self._optional_data.get(name, frozenset()))
+
+
+class TopologyQuery:
+    """Secondary indexes of all sections of a topology, each built on its first use."""
+
+    def __init__(self, topology: Topology) -> None:
+        self.topology = topology
+
+    @functools.cached_property
+    def branches(self) -> SectionIndex:
+        return SectionIndex(self.topology.branches)
+
+    @functools.cached_property
+    def nodes(self) -> SectionIndex:
+        return SectionIndex(self.topology.nodes)
+
+    @functools.cached_property
+    def loads(self) -> SectionIndex:
+        return SectionIndex(self.topology.loads)
+
+    @functools.cached_property
+    def transformers(self) -> SectionIndex:
+        return SectionIndex(self.topology.transformers)
+
+    @functools.cached_property
+    def external_grids(self) -> SectionIndex:
+        return SectionIndex(self.topology.external_grids)
@@ -0,0 +1,182 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+"""Reduction of a node-breaker topology to a bus-branch topology.
+
+Nodes joined by closed switching branches, i.e. branches of type coupler or fuse, form one electrical bus. A switching
+branch is open if it is disabled or opened at one of its nodes, either by an open switch of the topology case or by a
+`Coupler`, `Switch` or `Fuse` element in open state. Each bus is represented by its first node in topology order.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import types
+import typing as t
+
+from psdm.topology.branch import BranchType
+from psdm.topology.graph import components
+from psdm.topology.graph import group
+from psdm.topology.graph import transformer_nodes
+from psdm.topology.topology import Topology
+
+if t.TYPE_CHECKING:
+    import array
+    import collections.abc as cabc
+
+    from psdm.topology.coupler import Coupler
+    from psdm.topology.fuse import Fuse
+    from psdm.topology.switch import Switch
+    from psdm.topology_case.case import Case as TopologyCase
+
+SWITCHING_BRANCH_TYPES = frozenset({BranchType.COUPLER.value, BranchType.FUSE.value})
+NO_BUS = -1
+
+
+@dataclasses.dataclass(frozen=True)
+class Buses:
+    """Mapping of the nodes of a topology to electrical buses.
+
+    Node `i` of `Topology.nodes` belongs to bus `node_bus[i]` or to `NO_BUS` if it is disabled. Buses are numbered in
+    the order of their first node, the nodes of bus `b` are `nodes[indptr[b]:indptr[b + 1]]` in topology order.
+    """
+
+    node_names: tuple[str, ...]
+    node_ids: cabc.Mapping[str, int]
+    node_bus: array.array[int]
+    bus_names: tuple[str, ...]
+    indptr: array.array[int]
+    nodes: array.array[int]
+    disabled: frozenset[str]  # names of disabled elements
+    open_terminals: frozenset[tuple[str, str]]  # pairs of element name and node name
+
+    @property
+    def n_buses(self) -> int:
+        return len(self.bus_names)
+
+    def bus_of(self, node: str) -> str | None:
+        bus = self.node_bus[self.node_ids[node]]
+        return None if bus == NO_BUS else self.bus_names[bus]
+
+    def nodes_of(self, bus: int) -> tuple[str, ...]:
+        return tuple(self.node_names[node] for node in self.nodes[self.indptr[bus] : self.indptr[bus + 1]])
+
+    def is_connected(self, element: str, node: str) -> bool:
+        """Return whether an element is connected to a node, i.e. it is enabled and not opened at the node."""
+        return (
+            element not in self.disabled
+            and (element, node) not in self.open_terminals
+            and self.node_bus[self.node_ids[node]] != NO_BUS
+        )
+
+    def reduce(self, topology: Topology) -> Topology:
+        """Build the bus-branch topology with one node per bus.
+
+        Switching branches are left out, as are disabled elements, elements that are opened at their only node and
+        branches or transformers that connect less than two buses. A 3-winding transformer opened at one terminal
+        loses the winding of that terminal, if it is `node_1` or `node_2` the next connected terminal takes its place, so
+        the reduced transformer connects the same buses as under the case. A transformer with a disabled terminal node is
+        left out as that node has no bus.
+        """
+        bus_names = {
+            name: self.bus_names[bus] for name, bus in zip(self.node_names, self.node_bus, strict=True) if bus != NO_BUS
+        }
+        nodes = tuple(topology.nodes[self.nodes[self.indptr[bus]]] for bus in range(self.n_buses))
+        branches = []
+        for branch in topology.branches:
+            if branch.type in SWITCHING_BRANCH_TYPES:
+                continue
+
+            if self.is_connected(branch.name, branch.node_1) and self.is_connected(branch.name, branch.node_2):
+                node_1, node_2 = bus_names[branch.node_1], bus_names[branch.node_2]
+                if node_1 != node_2:
+                    branches.append(_rename(branch, {"node_1": node_1, "node_2": node_2}))
+
+        transformers = []
+        for transformer in topology.transformers:
+            terminals = transformer_nodes(transformer)
+            if any(n not in bus_names for n in terminals):
+                continue
+
+            connected = [n for n in terminals if self.is_connected(transformer.name, n)]
+            if len({bus_names[n] for n in connected}) > 1:
+                windings = tuple(
+                    _rename(w, {"node": bus_names[w.node]})
+                    for w in transformer.windings
+                    if self.is_connected(transformer.name, w.node)
+                )
+                update = {"node_1": bus_names[connected[0]], "node_2": bus_names[connected[1]], "windings": windings}
+                transformers.append(_rename(transformer, update))
+
+        loads, external_grids = (
+            tuple(_rename(e, {"node": bus_names[e.node]}) for e in elements if self.is_connected(e.name, e.node))
+            for elements in (topology.loads, topology.external_grids)
+        )
+        return Topology(
+            meta=topology.meta,
+            optional_data=topology.optional_data,
+            branches=tuple(branches),
+            nodes=nodes,
+            loads=loads,
+            transformers=tuple(transformers),
+            external_grids=external_grids,
+        )
+
+
+E = t.TypeVar("E")
+
+
+def _rename(element: E, update: dict[str, t.Any]) -> E:
+    if all(getattr(element, key) == value for key, value in update.items()):
+        return element
+
+    return element.model_copy(update=update)  # type: ignore[attr-defined]
+
+
+def buses(
+    topology: Topology,
+    topology_case: TopologyCase | None = None,
+    switches: cabc.Iterable[Coupler | Switch | Fuse] = (),
+) -> Buses:
+    """Collapse nodes joined by closed couplers and fuses into buses, see `psdm.topology.graph.components`."""
+    node_names = tuple(node.name for node in topology.nodes)
+    ids = {name: i for i, name in enumerate(node_names)}
+    disabled = frozenset(() if topology_case is None else (e.name for e in topology_case.elements if e.disabled))
+    open_terminals = frozenset(
+        itertools.chain(
+            () if topology_case is None else ((e.name, n) for e in topology_case.elements for n in e.open_switches),
+            ((switch.element, switch.node) for switch in switches if not switch.state),
+        ),
+    )
+    node_disabled = bytearray(name in disabled for name in node_names)
+
+    def closed_switching_branches() -> cabc.Iterator[tuple[int, int]]:
+        for branch in topology.branches:
+            if (
+                branch.type not in SWITCHING_BRANCH_TYPES
+                or branch.name in disabled
+                or (branch.name, branch.node_1) in open_terminals
+                or (branch.name, branch.node_2) in open_terminals
+            ):
+                continue
+
+            try:
+                yield ids[branch.node_1], ids[branch.node_2]
+            except KeyError:
+                msg = f"Nodes of {branch.name} are not part of the topology."
+                raise ValueError(msg) from None
+
+    node_bus, n_buses = components(len(node_names), closed_switching_branches(), node_disabled)
+    indptr, nodes = group((node for node in range(len(node_names)) if not node_disabled[node]), node_bus, n_buses)
+    return Buses(
+        node_names=node_names,
+        node_ids=types.MappingProxyType(ids),
+        node_bus=node_bus,
+        bus_names=tuple(node_names[nodes[indptr[bus]]] for bus in range(n_buses)),
+        indptr=indptr,
+        nodes=nodes,
+        disabled=disabled,
+        open_terminals=open_terminals,
+    )
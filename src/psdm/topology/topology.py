@@ -4,15 +4,32 @@
 
 from __future__ import annotations
 
+import functools
+import typing as t
+
 from psdm.base import Base
 from psdm.base import UniqueTuple
+from psdm.base import name_index
+from psdm.integrity import IntegrityReport
+from psdm.integrity import check_topology
 from psdm.meta import Meta
 from psdm.topology.branch import Branch
 from psdm.topology.external_grid import ExternalGrid
+from psdm.topology.graph import Adjacency
+from psdm.topology.graph import Attached
+from psdm.topology.graph import Attachments
+from psdm.topology.graph import Feeders
+from psdm.topology.graph import Subnetworks
+from psdm.topology.graph import feeders
+from psdm.topology.graph import subnetworks
 from psdm.topology.load import Load
 from psdm.topology.node import Node
+from psdm.topology.query import TopologyQuery
 from psdm.topology.transformer import Transformer
 
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
 
 class Topology(Base):
     """This class represents operating point independent topology of a grid.
@@ -26,3 +43,65 @@ class Topology(Base):
     loads: UniqueTuple[Load]
     transformers: UniqueTuple[Transformer]
     external_grids: UniqueTuple[ExternalGrid]
+
+    @functools.cached_property
+    def branches_by_name(self) -> cabc.Mapping[str, Branch]:
+        return name_index(self.branches)
+
+    @functools.cached_property
+    def nodes_by_name(self) -> cabc.Mapping[str, Node]:
+        return name_index(self.nodes)
+
+    @functools.cached_property
+    def loads_by_name(self) -> cabc.Mapping[str, Load]:
+        return name_index(self.loads)
+
+    @functools.cached_property
+    def transformers_by_name(self) -> cabc.Mapping[str, Transformer]:
+        return name_index(self.transformers)
+
+    @functools.cached_property
+    def external_grids_by_name(self) -> cabc.Mapping[str, ExternalGrid]:
+        return name_index(self.external_grids)
+
+    @functools.cached_property
+    def element_names(self) -> frozenset[str]:
+        """Names of all elements of all types."""
+        return frozenset(
+            e.name
+            for section in (self.branches, self.nodes, self.loads, self.transformers, self.external_grids)
+            for e in section
+        )
+
+    @functools.cached_property
+    def adjacency(self) -> Adjacency:
+        """Node adjacency of branches and transformers, see `psdm.topology.graph.Adjacency`."""
+        return Adjacency.from_topology(self)
+
+    @functools.cached_property
+    def attachments(self) -> Attachments:
+        """Reverse index of node to attached elements, see `psdm.topology.graph.Attachments`."""
+        return Attachments.from_topology(self)
+
+    def attached(self, node: str) -> Attached:
+        """Return the branches, transformers, loads and external grids attached to a node."""
+        return self.attachments.attached(self, node)
+
+    @functools.cached_property
+    def feeders(self) -> Feeders:
+        """Radial feeders traced from external grids and transformers, see `psdm.topology.graph.Feeders`."""
+        return feeders(self)
+
+    @functools.cached_property
+    def subnetworks(self) -> Subnetworks:
+        """Subnetworks per nominal voltage with their cycle basis, see `psdm.topology.graph.Subnetworks`."""
+        return subnetworks(self)
+
+    @functools.cached_property
+    def query(self) -> TopologyQuery:
+        """Attribute queries over the elements, see `psdm.topology.query`."""
+        return TopologyQuery(self)
+
+    def check_integrity(self) -> IntegrityReport:
+        """Check that all elements refer to existing nodes and phases, see `psdm.integrity`."""
+        return check_topology(self)
@@ -4,16 +4,23 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from psdm.base import Base
 from psdm.base import UniqueTuple
+from psdm.base import name_index
+from psdm.matching import match_sections
 from psdm.meta import Meta
 from psdm.topology_case.element_state import ElementState
+from psdm.topology_case.view import EffectiveTopology
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from psdm.matching import MatchReport
     from psdm.topology.topology import Topology
 
 
@@ -26,26 +33,29 @@ class Case(Base):
     meta: Meta
     elements: UniqueTuple[ElementState]
 
-    def matches_topology(self, topology: Topology) -> bool:
-        logger.info("Verifying topology case ...")
-        if topology.meta != self.meta:
-            logger.error("Metadata does not match.")
-            return False
-
-        if not self._is_proper_elements(topology):
-            return False
+    @functools.cached_property
+    def elements_by_name(self) -> Mapping[str, ElementState]:
+        return name_index(self.elements)
 
-        logger.info("Verifying topology case was successful.")
-        return True
-
-    def _is_proper_elements(self, topology: Topology) -> bool:
-        topology_elements = (
-            topology.loads + topology.transformers + topology.nodes + topology.branches + topology.external_grids
+    def matches_topology(self, topology: Topology, *, fail_fast: bool = True) -> bool:
+        logger.info("Verifying topology case ...")
+        report = self.match_topology(topology, fail_fast=fail_fast)
+        report.log()
+        if report:
+            logger.info("Verifying topology case was successful.")
+
+        return report.is_match
+
+    def match_topology(self, topology: Topology, *, fail_fast: bool = False) -> MatchReport:
+        """Compare metadata with a topology and check that all element names are part of it."""
+        return match_sections(
+            "topology case",
+            topology.meta == self.meta,
+            (("elements", [e.name for e in self.elements], topology.element_names),),
+            check_missing=False,
+            fail_fast=fail_fast,
         )
-        topology_element_names = [e.name for e in topology_elements]
-        for e in self.elements:
-            if e.name not in topology_element_names:
-                logger.error("Element {element_name} is not in topology.", element_name=e.name)
-                return False
 
-        return True
+    def apply(self, topology: Topology) -> EffectiveTopology:
+        """Return a view of the topology under this case which shares the data of the topology."""
+        return EffectiveTopology(topology, self)
@@ -0,0 +1,199 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import collections.abc as cabc
+import functools
+import typing as t
+
+from psdm.topology.graph import ATTACHED_ELEMENT_TYPES
+from psdm.topology.graph import case_masks
+from psdm.topology.graph import feeders
+from psdm.topology.graph import islands
+from psdm.topology.graph import subnetworks
+
+if t.TYPE_CHECKING:
+    from psdm.meta import Meta
+    from psdm.topology.branch import Branch
+    from psdm.topology.external_grid import ExternalGrid
+    from psdm.topology.graph import Adjacency
+    from psdm.topology.graph import Feeders
+    from psdm.topology.graph import Islands
+    from psdm.topology.graph import Subnetworks
+    from psdm.topology.load import Load
+    from psdm.topology.node import Node
+    from psdm.topology.topology import Topology
+    from psdm.topology.transformer import Transformer
+    from psdm.topology_case.case import Case
+
+V = t.TypeVar("V")
+
+
+class FilteredIndex(cabc.Mapping[str, V]):
+    """Read-only view of a name index without the excluded names."""
+
+    def __init__(self, index: cabc.Mapping[str, V], excluded: cabc.Set[str]) -> None:
+        self._index = index
+        self._excluded = excluded
+
+    def __getitem__(self, name: str) -> V:
+        if name in self._excluded:
+            raise KeyError(name)
+
+        return self._index[name]
+
+    def __iter__(self) -> cabc.Iterator[str]:
+        return (name for name in self._index if name not in self._excluded)
+
+    def __len__(self) -> int:
+        return len(self._index) - sum(1 for name in self._excluded if name in self._index)
+
+
+class EffectiveTopology:
+    """Topology as seen under a topology case, without copying the topology.
+
+    The element accessors leave out disabled elements and the elements attached to disabled nodes, open switches are
+    honored by the masks of the shared adjacency of the topology. Sections and name indexes without disabled elements are those of the topology, others are
+    filtered on first access. The masks are created on first access as well.
+    """
+
+    def __init__(self, topology: Topology, topology_case: Case) -> None:
+        self.topology = topology
+        self.topology_case = topology_case
+        self.disabled = frozenset(e.name for e in topology_case.elements if e.disabled)
+        self._filtered: dict[str, tuple[t.Any, ...]] = {}
+
+    @property
+    def meta(self) -> Meta:
+        return self.topology.meta
+
+    @functools.cached_property
+    def _attached_to_disabled(self) -> dict[str, frozenset[str]]:
+        """Names of the elements attached to disabled nodes per section, found by the attachments of the nodes."""
+        names: dict[str, set[str]] = {section: set() for section in ATTACHED_ELEMENT_TYPES}
+        disabled_nodes = self.disabled & self.topology.nodes_by_name.keys()
+        if disabled_nodes:
+            attachments = self.topology.attachments
+            for node in disabled_nodes:
+                for row in attachments.rows(attachments.node_ids[node]):
+                    section = ATTACHED_ELEMENT_TYPES[attachments.element_type[row]]
+                    names[section].add(getattr(self.topology, section)[attachments.element[row]].name)
+
+        return {section: frozenset(elements) for section, elements in names.items()}
+
+    def _excluded(self, section: str) -> frozenset[str]:
+        return self.disabled | self._attached_to_disabled.get(section, frozenset())
+
+    def _section(self, section: str) -> tuple[t.Any, ...]:
+        elements = self._filtered.get(section)
+        if elements is None:
+            elements = getattr(self.topology, section)
+            excluded = self._excluded(section)
+            if not excluded.isdisjoint(getattr(self.topology, f"{section}_by_name")):
+                elements = tuple(e for e in elements if e.name not in excluded)
+
+            self._filtered[section] = elements
+
+        return elements
+
+    def _index(self, section: str) -> cabc.Mapping[str, t.Any]:
+        index = getattr(self.topology, f"{section}_by_name")
+        excluded = self._excluded(section)
+        if excluded.isdisjoint(index):
+            return index
+
+        return FilteredIndex(index, excluded)
+
+    @property
+    def branches(self) -> tuple[Branch, ...]:
+        return self._section("branches")
+
+    @property
+    def nodes(self) -> tuple[Node, ...]:
+        return self._section("nodes")
+
+    @property
+    def loads(self) -> tuple[Load, ...]:
+        return self._section("loads")
+
+    @property
+    def transformers(self) -> tuple[Transformer, ...]:
+        return self._section("transformers")
+
+    @property
+    def external_grids(self) -> tuple[ExternalGrid, ...]:
+        return self._section("external_grids")
+
+    @property
+    def branches_by_name(self) -> cabc.Mapping[str, Branch]:
+        return self._index("branches")
+
+    @property
+    def nodes_by_name(self) -> cabc.Mapping[str, Node]:
+        return self._index("nodes")
+
+    @property
+    def loads_by_name(self) -> cabc.Mapping[str, Load]:
+        return self._index("loads")
+
+    @property
+    def transformers_by_name(self) -> cabc.Mapping[str, Transformer]:
+        return self._index("transformers")
+
+    @property
+    def external_grids_by_name(self) -> cabc.Mapping[str, ExternalGrid]:
+        return self._index("external_grids")
+
+    @property
+    def adjacency(self) -> Adjacency:
+        """Adjacency of the topology, use the masks to skip inactive nodes and edges."""
+        return self.topology.adjacency
+
+    @functools.cached_property
+    def _masks(self) -> tuple[bytearray, bytearray]:
+        return case_masks(self.topology, self.topology_case)
+
+    @property
+    def node_disabled(self) -> bytearray:
+        return self._masks[0]
+
+    @property
+    def edge_blocked(self) -> bytearray:
+        """Edges of the adjacency which are disabled or opened at one of their nodes."""
+        return self._masks[1]
+
+    def neighbours_of(self, node: int) -> list[int]:
+        """Return the neighbours of a node connected by active edges."""
+        adjacency = self.adjacency
+        node_disabled, edge_blocked = self._masks
+        if node_disabled[node]:
+            return []
+
+        start, stop = adjacency.indptr[node], adjacency.indptr[node + 1]
+        return [
+            adjacency.neighbours[i]
+            for i in range(start, stop)
+            if not edge_blocked[adjacency.edges[i]] and not node_disabled[adjacency.neighbours[i]]
+        ]
+
+    @functools.cached_property
+    def feeders(self) -> Feeders:
+        return feeders(self.topology, self.topology_case)
+
+    @functools.cached_property
+    def subnetworks(self) -> Subnetworks:
+        return subnetworks(self.topology, self.topology_case)
+
+    def islands(self) -> Islands:
+        return islands(self.topology, self.topology_case)
+
+    def to_topology(self) -> Topology:
+        """Materialize the view as topology without the disabled elements and the elements at disabled nodes."""
+        return self.topology.model_copy(
+            update={
+                section: self._section(section)
+                for section in ("branches", "nodes", "loads", "transformers", "external_grids")
+            },
+        )
@@ -0,0 +1,260 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+
+import pytest
+
+from psdm.base import AttributeData
+from psdm.base import VoltageSystemType
+from psdm.meta import Meta
+from psdm.quantities.multi_phase import ActivePower as ActivePowerSet
+from psdm.quantities.multi_phase import ApparentPower as ApparentPowerSet
+from psdm.quantities.multi_phase import CosPhi
+from psdm.quantities.multi_phase import Phase
+from psdm.quantities.multi_phase import PhaseConnections
+from psdm.quantities.multi_phase import ReactivePower as ReactivePowerSet
+from psdm.quantities.multi_phase import Voltage as VoltageSet
+from psdm.quantities.single_phase import AdmittancePosSeq
+from psdm.quantities.single_phase import ApparentPower
+from psdm.quantities.single_phase import Current
+from psdm.quantities.single_phase import ImpedancePosSeq
+from psdm.quantities.single_phase import Length
+from psdm.quantities.single_phase import SystemType as QSystemType
+from psdm.quantities.single_phase import Voltage
+from psdm.steadystate_case.active_power import ActivePower
+from psdm.steadystate_case.case import Case as SteadystateCase
+from psdm.steadystate_case.controller import ControlPConst
+from psdm.steadystate_case.controller import ControlQConst
+from psdm.steadystate_case.controller import PController
+from psdm.steadystate_case.controller import QController
+from psdm.steadystate_case.external_grid import ExternalGrid as SSCExternalGrid
+from psdm.steadystate_case.load import Load as SSCLoad
+from psdm.steadystate_case.reactive_power import ReactivePower
+from psdm.steadystate_case.transformer import Transformer as SSCTransformer
+from psdm.topology.branch import Branch
+from psdm.topology.branch import BranchType
+from psdm.topology.external_grid import ExternalGrid
+from psdm.topology.external_grid import GridType
+from psdm.topology.load import Load
+from psdm.topology.load import LoadType
+from psdm.topology.load import RatedPower
+from psdm.topology.load import SystemType
+from psdm.topology.load_model import LoadModel
+from psdm.topology.node import Node
+from psdm.topology.topology import Topology
+from psdm.topology.transformer import Transformer
+from psdm.topology.transformer import VectorGroup
+from psdm.topology.windings import Winding
+from psdm.topology_case.case import Case as TopologyCase
+from psdm.topology_case.element_state import ElementState
+
+if t.TYPE_CHECKING:
+    import collections.abc as cabc
+
+PHASES = (Phase.A, Phase.B, Phase.C)
+
+META = Meta(grid="test_grid", date=dt.date(2025, 1, 1))
+
+
+def make_node(name: str, u_n: float = 20000) -> Node:
+    return Node(name=name, u_n=Voltage(value=u_n, system_type=QSystemType.NATURAL), phases=PHASES)
+
+
+def make_branch(
+    name: str,
+    node_1: str,
+    node_2: str,
+    u_n: float = 20000,
+    branch_type: BranchType = BranchType.LINE,
+) -> Branch:
+    return Branch(
+        name=name,
+        node_1=node_1,
+        node_2=node_2,
+        phases_1=PHASES,
+        phases_2=PHASES,
+        u_n=Voltage(value=u_n, system_type=QSystemType.NATURAL),
+        i_r=Current(value=400, system_type=QSystemType.NATURAL),
+        type=branch_type,
+        voltage_system_type=VoltageSystemType.AC,
+        r1=ImpedancePosSeq(value=0.1),
+        x1=ImpedancePosSeq(value=0.2),
+        g1=AdmittancePosSeq(value=0),
+        b1=AdmittancePosSeq(value=0.0001),
+        length=Length(value=1000),
+    )
+
+
+def make_transformer(name: str, node_1: str, node_2: str, u_1: float = 110000, u_2: float = 20000) -> Transformer:
+    windings = tuple(
+        Winding(
+            node=node,
+            s_r=ApparentPower(value=40e6, system_type=QSystemType.NATURAL),
+            u_n=Voltage(value=u_n, system_type=QSystemType.NATURAL),
+            u_r=Voltage(value=u_n, system_type=QSystemType.NATURAL),
+            r1=ImpedancePosSeq(value=0.5),
+            x1=ImpedancePosSeq(value=5),
+        )
+        for node, u_n in ((node_1, u_1), (node_2, u_2))
+    )
+    return Transformer(
+        name=name,
+        node_1=node_1,
+        node_2=node_2,
+        phases_1=PHASES,
+        phases_2=PHASES,
+        number=1,
+        vector_group=VectorGroup.YNd5,
+        windings=windings,
+        r_fe1=ImpedancePosSeq(value=1e5),
+        x_h1=ImpedancePosSeq(value=1e6),
+        tap_max=5,
+        tap_min=-5,
+        tap_neutral=0,
+    )
+
+
+def make_load(
+    name: str,
+    node: str,
+    load_type: LoadType = LoadType.CONSUMER,
+    system_type: SystemType = SystemType.FIXED_CONSUMPTION,
+    power: float = 10000,
+) -> Load:
+    return Load(
+        name=name,
+        node=node,
+        rated_power=RatedPower.from_apparent_power(
+            ApparentPowerSet(value=(power, power, power)),
+            CosPhi(value=(0.9, 0.9, 0.9)),
+        ),
+        active_power_model=LoadModel(u_0=VoltageSet(value=(230, 230, 230))),
+        reactive_power_model=LoadModel(u_0=VoltageSet(value=(230, 230, 230))),
+        phase_connections=PhaseConnections(value=((Phase.A, Phase.N), (Phase.B, Phase.N), (Phase.C, Phase.N))),
+        type=load_type,
+        system_type=system_type,
+        voltage_system_type=VoltageSystemType.AC,
+    )
+
+
+def make_external_grid(name: str, node: str, grid_type: GridType = GridType.SL) -> ExternalGrid:
+    return ExternalGrid(
+        name=name,
+        node=node,
+        description=None,
+        phases=PHASES,
+        short_circuit_power_max=ApparentPower(value=1e9, system_type=QSystemType.NATURAL),
+        short_circuit_power_min=ApparentPower(value=5e8, system_type=QSystemType.NATURAL),
+        type=grid_type,
+    )
+
+
+def make_topology(
+    nodes: cabc.Iterable[str | Node],
+    branches: cabc.Iterable[tuple[str, str, str] | Branch] = (),
+    transformers: cabc.Iterable[tuple[str, str, str] | Transformer] = (),
+    loads: cabc.Iterable[tuple[str, str] | Load] = (),
+    external_grids: cabc.Iterable[tuple[str, str] | ExternalGrid] = (),
+) -> Topology:
+    return Topology(
+        meta=META,
+        nodes=tuple(e if isinstance(e, Node) else make_node(e) for e in nodes),
+        branches=tuple(e if isinstance(e, Branch) else make_branch(*e) for e in branches),
+        transformers=tuple(e if isinstance(e, Transformer) else make_transformer(*e) for e in transformers),
+        loads=tuple(e if isinstance(e, Load) else make_load(*e) for e in loads),
+        external_grids=tuple(e if isinstance(e, ExternalGrid) else make_external_grid(*e) for e in external_grids),
+    )
+
+
+def make_steadystate_case(topology: Topology) -> SteadystateCase:
+    return SteadystateCase(
+        meta=topology.meta,
+        loads=tuple(
+            SSCLoad(
+                name=load.name,
+                active_power=ActivePower(
+                    controller=PController(
+                        node_target=load.node,
+                        control_type=ControlPConst(p_set=ActivePowerSet(value=(3000, 3000, 3000))),
+                    ),
+                ),
+                reactive_power=ReactivePower(
+                    controller=QController(
+                        node_target=load.node,
+                        control_type=ControlQConst(q_set=ReactivePowerSet(value=(1000, 1000, 1000))),
+                    ),
+                ),
+            )
+            for load in topology.loads
+        ),
+        transformers=tuple(SSCTransformer(name=e.name, tap_pos=0) for e in topology.transformers),
+        external_grids=tuple(
+            SSCExternalGrid(name=e.name, u_0=VoltageSet(value=(63508.5, 63508.5, 63508.5)))
+            for e in topology.external_grids
+        ),
+    )
+
+
+@pytest.fixture
+def topology() -> Topology:
+    """Small but complete grid: HV/MV/LV levels, one MV mesh, a coupler and a non-ASCII description."""
+    return make_topology(
+        nodes=(
+            make_node("HV", 110000),
+            "MV_1",
+            "MV_2",
+            "MV_3",
+            "MV_4",
+            make_node("LV_1", 400),
+            make_node("LV_2", 400),
+        ),
+        branches=(
+            ("L_1_2", "MV_1", "MV_2"),
+            ("L_2_3", "MV_2", "MV_3"),
+            ("L_3_1", "MV_3", "MV_1"),
+            make_branch("C_3_4", "MV_3", "MV_4", branch_type=BranchType.COUPLER),
+            make_branch("L_LV", "LV_1", "LV_2", u_n=400),
+        ),
+        transformers=(
+            make_transformer("T_HV_MV", "HV", "MV_1"),
+            make_transformer("T_MV_LV", "MV_4", "LV_1", u_1=20000, u_2=400),
+        ),
+        loads=(
+            make_load("Load_MV_2", "MV_2", LoadType.PRODUCER, SystemType.PV, power=200000),
+            make_load("Load_MV_3", "MV_3"),
+            make_load("Load_LV_2", "LV_2"),
+        ),
+        external_grids=(
+            ExternalGrid(
+                name="ExtGrid",
+                node="HV",
+                description="Umspannwerk Süd",
+                phases=PHASES,
+                short_circuit_power_max=ApparentPower(value=1e9, system_type=QSystemType.NATURAL),
+                short_circuit_power_min=ApparentPower(value=5e8, system_type=QSystemType.NATURAL),
+                type=GridType.SL,
+                optional_data=(AttributeData(name="operator", value="DSO"),),
+            ),
+        ),
+    )
+
+
+@pytest.fixture
+def steadystate_case(topology: Topology) -> SteadystateCase:
+    return make_steadystate_case(topology)
+
+
+@pytest.fixture
+def topology_case(topology: Topology) -> TopologyCase:
+    return TopologyCase(
+        meta=topology.meta,
+        elements=(
+            ElementState(name="Load_MV_3", disabled=True),
+            ElementState(name="L_3_1", open_switches=("MV_1",)),
+        ),
+    )
@@ -0,0 +1,177 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import functools
+import json
+import pickle
+
+import pydantic
+import pytest
+
+from psdm.base import AttributeData
+from psdm.base import open_file
+from psdm.quantities.multi_phase import ApparentPower
+from psdm.quantities.multi_phase import CosPhi
+from psdm.storage.json_stream import read_topology
+from psdm.topology.load import RatedPower
+from psdm.topology.topology import Topology
+
+
+def legacy_json(model, indent: int) -> str:
+    return json.dumps(json.loads(model.model_dump_json()), indent=indent, sort_keys=True)
+
+
+class TestToJson:
+    @pytest.mark.parametrize("indent", [0, 2, 4])
+    def test_matches_legacy_format(self, topology, steadystate_case, topology_case, indent) -> None:
+        for model in (topology, steadystate_case, topology_case):
+            assert "".join(model.iter_json(indent=indent)) == legacy_json(model, indent)
+
+    def test_special_values(self) -> None:
+        rated_power = RatedPower.from_apparent_power(
+            ApparentPower(value=(0, 0, 0)),
+            CosPhi(value=(float("nan"), 1, 1)),
+        )
+        attribute = AttributeData(name="a", value=(AttributeData(name="ü", value="\n"),))
+        for model in (rated_power, attribute):
+            assert "".join(model.iter_json()) == legacy_json(model, 2)
+
+    def test_cached_properties_not_written(self, topology) -> None:
+        class CachedTopology(Topology):
+            @functools.cached_property
+            def energized(self) -> tuple:
+                return self.nodes[:1]
+
+        model = CachedTopology.model_validate(topology.model_dump())
+        _ = model.energized
+        assert "".join(model.iter_json()) == legacy_json(topology, 2)
+
+    def test_roundtrip(self, topology, tmp_path) -> None:
+        file_path = tmp_path / "topology.json"
+        topology.to_json(file_path)
+        assert file_path.read_text(encoding="utf-8") == legacy_json(topology, 2)
+        assert Topology.from_file(file_path).model_dump_json() == topology.model_dump_json()
+
+
+class TestCompressedFiles:
+    @pytest.mark.parametrize("suffix", [".json", ".json.gz", ".json.xz", ".json.bz2"])
+    def test_roundtrip(self, topology, tmp_path, suffix) -> None:
+        file_path = tmp_path / ("topology" + suffix)
+        topology.to_json(file_path)
+        with open_file(file_path) as file_handle:
+            assert file_handle.read() == legacy_json(topology, 2)
+
+        assert Topology.from_file(file_path).model_dump_json() == topology.model_dump_json()
+        assert read_topology(file_path, chunk_size=64) == Topology.from_file(file_path)
+
+    def test_detection_by_content(self, topology, tmp_path) -> None:
+        compressed = tmp_path / "topology.json.gz"
+        topology.to_json(compressed)
+        renamed = compressed.rename(tmp_path / "topology.json")
+        assert renamed.read_bytes()[:2] == b"\x1f\x8b"
+        assert Topology.from_file(renamed).model_dump_json() == topology.model_dump_json()
+
+
+class TestToBytes:
+    def test_roundtrip(self, topology, steadystate_case, topology_case) -> None:
+        for model in (topology, steadystate_case, topology_case):
+            result = type(model).from_bytes(model.to_bytes())
+            assert result == model
+            assert result.model_dump_json() == model.model_dump_json()
+            assert pickle.loads(pickle.dumps(result)) == model  # noqa: S301
+
+    def test_special_values(self) -> None:
+        data = AttributeData(
+            name="data",
+            value=(AttributeData(name="nan", value=float("nan")), AttributeData(name="text", value=("ä\\n", True))),
+        )
+        result = AttributeData.from_bytes(data.to_bytes())
+        assert result.model_dump_json() == data.model_dump_json()
+
+    def test_shared_elements(self, topology) -> None:
+        doubled = topology.model_copy(update={"nodes": (*topology.nodes, topology.nodes[0])})
+        result = Topology.from_bytes(doubled.to_bytes())
+        assert result.nodes[0] is result.nodes[-1]  # type: ignore[attr-defined]
+
+    def test_invalid(self, topology) -> None:
+        with pytest.raises(TypeError, match="Topology"):
+            RatedPower.from_bytes(topology.to_bytes())
+
+        with pytest.raises(ValueError, match="wire format"):
+            Topology.from_bytes(topology.model_dump_json().encode())
+
+
+class TestTrustedJson:
+    def test_roundtrip(self, topology, steadystate_case, topology_case) -> None:
+        for model in (topology, steadystate_case, topology_case):
+            json_str = model.model_dump_json()
+            result = type(model).from_json(json_str, trusted=True)
+            assert result == type(model).from_json(json_str)  # values are rounded on serialization
+            assert result.model_dump_json() == json_str
+
+    def test_file(self, topology, tmp_path) -> None:
+        file_path = tmp_path / "topology.json.gz"
+        topology.to_json(file_path)
+        assert Topology.from_file(file_path, trusted=True, sample=1) == Topology.from_file(file_path)
+
+    def test_values_as_validated(self, topology) -> None:
+        result: Topology = Topology.from_json(topology.model_dump_json(), trusted=True)  # type: ignore[assignment]
+        assert type(result.nodes[0].phases) is tuple
+        assert result.meta.id == topology.meta.id
+        assert result.meta.date == topology.meta.date
+        assert result.loads[0].phase_connections.value == topology.loads[0].phase_connections.value
+        assert result.nodes[0].u_n.precision == topology.nodes[0].u_n.precision  # excluded from the dump
+
+    def test_special_values(self) -> None:
+        data = AttributeData(
+            name="data",
+            value=(AttributeData(name="nan", value=float("nan")), AttributeData(name="text", value=("ä\\n", True))),
+        )
+        result = AttributeData.from_json(data.model_dump_json(), trusted=True)
+        assert result.model_dump_json() == data.model_dump_json()
+
+    def test_validators_skipped(self, topology) -> None:
+        data = json.loads(topology.model_dump_json())
+        data["nodes"][0]["u_n"]["unit"] = "HERTZ"
+        result: Topology = Topology.from_json(json.dumps(data), trusted=True)  # type: ignore[assignment]
+        assert result.nodes[0].u_n.unit == "HERTZ"
+
+    def test_sample(self, topology) -> None:
+        data = json.loads(topology.model_dump_json())
+        data["nodes"][-1]["u_n"]["unit"] = "HERTZ"
+        with pytest.raises(pydantic.ValidationError, match="unit"):
+            Topology.from_json(json.dumps(data), trusted=True, sample=1)
+
+        # the sample holds at least one element of each section
+        data = json.loads(topology.model_dump_json())
+        data["external_grids"][0]["phases"] = ["A", "A", "C"]
+        with pytest.raises(pydantic.ValidationError, match="duplicated"):
+            Topology.from_json(json.dumps(data), trusted=True, sample=0.01)
+
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            Topology.from_json(topology.model_dump_json(), trusted=True, sample=2)
+
+
+class TestUniqueTuple:
+    def test_duplicates_by_name(self, topology) -> None:
+        loads = (*topology.loads, topology.loads[1], topology.loads[1])
+        with pytest.raises(pydantic.ValidationError, match="duplicated: Load_MV_3 "):
+            Topology.model_validate(topology.model_dump() | {"loads": [e.model_dump() for e in loads]})
+
+    def test_equal_names_with_different_values(self, topology) -> None:
+        # uniqueness is by value, elements sharing a name are compared as a whole
+        other = topology.loads[1].model_copy(update={"description": "other"})
+        result = topology.model_copy(update={"loads": (*topology.loads, other)})
+        assert len(Topology.model_validate(result.model_dump()).loads) == len(topology.loads) + 1
+
+    def test_duplicates_without_name(self, topology) -> None:
+        with pytest.raises(pydantic.ValidationError, match="duplicated: item 2"):
+            topology.nodes[0].model_validate(topology.nodes[0].model_dump() | {"phases": ("A", "B", "A")})
+
+    def test_cached_hash(self, topology) -> None:
+        load = topology.loads[0]
+        assert hash(load) == hash(load.model_copy())
+        assert "__hash__" in load.__dict__
+        assert hash(load.model_copy(update={"name": "other"})) != hash(load)
+        assert load == pickle.loads(pickle.dumps(load))  # noqa: S301
@@ -0,0 +1,105 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import json
+
+import pydantic
+import pytest
+
+from psdm.base import open_file
+from psdm.steadystate_case.case import Case as SteadystateCase
+from psdm.storage.collecting import ErrorRecord
+from psdm.storage.collecting import iter_errors
+from psdm.storage.collecting import load
+from psdm.topology.topology import Topology
+
+
+def write(data: dict, file_path) -> None:
+    with open_file(file_path, "w") as file_handle:
+        json.dump(data, file_handle)
+
+
+class TestCollecting:
+    def test_valid(self, topology, tmp_path) -> None:
+        file_path = tmp_path / "topology.json"
+        topology.to_json(file_path)
+        records: list[ErrorRecord] = []
+        assert load(Topology, file_path, records.append, chunk_size=64) == Topology.from_file(file_path)
+        assert records == []
+
+    def test_invalid_elements(self, topology, tmp_path) -> None:
+        data = json.loads(topology.model_dump_json())
+        invalid = [data["loads"][0]["name"], data["loads"][2]["name"]]
+        data["loads"][0]["rated_power"]["cos_phi"]["value"] = [2, 2, 2]
+        data["loads"][2]["rated_power"]["cos_phi"]["value"] = [2, 2, 2]
+        data["nodes"].append(data["nodes"][0])
+        file_path = tmp_path / "topology.json"
+        write(data, file_path)
+
+        records: list[ErrorRecord] = []
+        result = load(Topology, file_path, records.append)
+
+        assert [e.name for e in result.loads] == [e.name for e in topology.loads if e.name not in invalid]
+        assert result.nodes == topology.nodes
+        assert [(r.section, r.index, r.element_type, r.name) for r in records] == [
+            ("nodes", len(topology.nodes), "Node", topology.nodes[0].name),
+            ("loads", 0, "Load", invalid[0]),
+            ("loads", 2, "Load", invalid[1]),
+        ]
+        assert records[0].message == "Element is duplicated."
+        assert records[1].field == "rated_power.cos_phi.value"
+
+    def test_report_file(self, topology, tmp_path) -> None:
+        data = json.loads(topology.model_dump_json())
+        data["branches"][1]["node_1"] = 1
+        file_path = tmp_path / "topology.json"
+        write(data, file_path)
+        report_path = tmp_path / "report.jsonl.gz"
+
+        result = load(Topology, file_path, report_path)
+
+        assert len(result.branches) == len(topology.branches) - 1
+        with open_file(report_path) as file_handle:
+            lines = [json.loads(line) for line in file_handle]
+
+        assert lines == [
+            {
+                "section": "branches",
+                "index": 1,
+                "element_type": "Branch",
+                "name": topology.branches[1].name,
+                "field": "node_1",
+                "message": "Input should be a valid string",
+            },
+        ]
+
+    def test_iterator(self, steadystate_case, tmp_path) -> None:
+        data = json.loads(steadystate_case.model_dump_json())
+        del data["loads"][0]["active_power"]
+        file_path = tmp_path / "case.json"
+        write(data, file_path)
+
+        records = iter_errors(SteadystateCase, file_path)
+        errors = []
+        while True:
+            try:
+                errors.append(next(records))
+            except StopIteration as stop:  # noqa: PERF203
+                result = stop.value
+                break
+
+        assert [(e.section, e.field, e.message) for e in errors] == [("loads", "active_power", "Field required")]
+        assert result.loads == steadystate_case.loads[1:]
+
+    def test_invalid_model(self, topology, tmp_path) -> None:
+        data = json.loads(topology.model_dump_json())
+        del data["meta"]
+        file_path = tmp_path / "topology.json"
+        write(data, file_path)
+        records: list[ErrorRecord] = []
+
+        with pytest.raises(pydantic.ValidationError):
+            load(Topology, file_path, records.append)
+
+        assert records == [ErrorRecord(None, None, "Topology", None, "meta", "Field required")]
@@ -0,0 +1,41 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import zipfile
+
+import pytest
+
+from psdm.storage.columnar import read_columnar
+from psdm.storage.columnar import read_columns
+from psdm.storage.columnar import write_columnar
+from psdm.topology.topology import Topology
+
+
+class TestColumnar:
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_roundtrip(self, topology, tmp_path, compression) -> None:
+        file_path = tmp_path / "topology.psdm.zip"
+        write_columnar(topology, file_path, compression=compression)
+        assert read_columnar(file_path) == topology
+
+    def test_empty_topology(self, topology, tmp_path) -> None:
+        empty = Topology(meta=topology.meta, branches=(), nodes=(), loads=(), transformers=(), external_grids=())
+        file_path = tmp_path / "empty.psdm.zip"
+        write_columnar(empty, file_path)
+        assert read_columnar(file_path) == empty
+
+    def test_read_columns(self, topology, tmp_path) -> None:
+        file_path = tmp_path / "topology.psdm.zip"
+        write_columnar(topology, file_path)
+        columns = read_columns(file_path, "branches")
+        assert columns["r1.value"].kind == "float"
+        assert list(columns["r1.value"].values) == [e.r1.value for e in topology.branches]  # type: ignore[arg-type]
+        assert columns["r1.unit"].values is None  # constant columns are kept as metadata only
+        assert columns["r1.unit"].dictionary == ("OHM",)
+        assert columns["name"].to_list() == [e.name for e in topology.branches]
+        assert columns["r0"].to_list() == [None] * len(topology.branches)
+
+        loads = read_columns(file_path, "loads")
+        assert loads["rated_power.cos_phi.value"].kind == "float_list"
+        assert loads["rated_power.cos_phi.value"].to_list() == [e.rated_power.cos_phi.value for e in topology.loads]
@@ -0,0 +1,63 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import contextlib
+import uuid
+
+import pytest
+
+from psdm.steadystate_case.case import Case as SteadystateCase
+from psdm.storage.database import Database
+from psdm.topology.topology import Topology
+from psdm.topology_case.case import Case as TopologyCase
+
+
+@pytest.fixture
+def database(tmp_path):
+    with contextlib.closing(Database(tmp_path / "psdm.sqlite")) as database:
+        yield database
+
+
+class TestDatabase:
+    def test_roundtrip(self, database, topology, steadystate_case, topology_case) -> None:
+        database.add((topology, steadystate_case, topology_case))
+        assert database.get(Topology, topology.meta.id) == topology
+        assert database.get(SteadystateCase, steadystate_case.meta.id) == steadystate_case
+        assert database.get(TopologyCase, topology_case.meta.id) == topology_case
+
+    def test_replace_and_remove(self, database, topology) -> None:
+        database.add((topology,))
+        variant = topology.model_copy(update={"loads": topology.loads[:1]})
+        database.add((variant,))
+        assert list(database.find(Topology)) == [variant]
+        assert len(list(database.elements(Topology, "loads"))) == 1
+        database.remove(Topology, topology.meta.id)
+        assert database.ids(Topology) == []
+        assert list(database.elements(Topology, "loads")) == []
+
+    def test_find(self, database, topology) -> None:
+        meta = topology.meta.model_copy(update={"id": uuid.uuid4(), "case": "winter"})
+        other = topology.model_copy(update={"meta": meta})
+        database.add((topology, other))
+        assert database.ids(Topology, grid=topology.meta.grid, case="winter") == [other.meta.id]
+        assert set(database.ids(Topology, grid=topology.meta.grid)) == {topology.meta.id, other.meta.id}
+        assert database.ids(Topology, grid="unknown") == []
+        with pytest.raises(KeyError):
+            database.get(Topology, uuid.uuid4())
+
+    def test_elements(self, database, topology) -> None:
+        database.add((topology,))
+        result = list(database.elements(Topology, "loads", "system_type = ? AND active_power > ?", ("PV", 100_000)))
+        assert result == [(topology.meta.id, topology.loads[0])]
+        branches = database.elements(Topology, "branches", "type = ?", ("COUPLER",), document_id=topology.meta.id)
+        assert [e.name for _, e in branches] == ["C_3_4"]
+        windings = database.elements(Topology, "transformers", "json_extract(data, '$.windings[0].node') = ?", ("HV",))
+        assert [e.name for _, e in windings] == ["T_HV_MV"]
+
+    def test_transaction_rollback(self, database, topology) -> None:
+        database.add((topology,))
+        with pytest.raises(KeyError):
+            database.add((topology.model_copy(update={"loads": ()}), "invalid"))
+
+        assert database.get(Topology, topology.meta.id) == topology
@@ -0,0 +1,255 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import pytest
+from conftest import META
+from conftest import make_branch
+from conftest import make_external_grid
+from conftest import make_load
+from conftest import make_topology
+from conftest import make_transformer
+
+from psdm.topology.external_grid import GridType
+from psdm.topology.graph import BRANCH
+from psdm.topology.graph import NO_FEEDER
+from psdm.topology.graph import NO_ISLAND
+from psdm.topology.graph import NO_SUBNETWORK
+from psdm.topology.graph import TRANSFORMER
+from psdm.topology.graph import Adjacency
+from psdm.topology.graph import feeders
+from psdm.topology.graph import islands
+from psdm.topology.graph import subnetworks
+from psdm.topology.graph import transformer_nodes
+from psdm.topology_case.case import Case as TopologyCase
+from psdm.topology_case.element_state import ElementState
+
+
+def neighbour_names(adjacency, name) -> list[str]:
+    return sorted(adjacency.node_names[i] for i in adjacency.neighbours_of(adjacency.node_ids[name]))
+
+
+def make_topology_case(*elements) -> TopologyCase:
+    return TopologyCase(meta=META, elements=elements)
+
+
+class TestAdjacency:
+    def test_structure(self, topology) -> None:
+        adjacency = topology.adjacency
+        assert adjacency is topology.adjacency
+        assert adjacency.n_nodes == len(topology.nodes)
+        assert adjacency.n_edges == len(topology.branches) + len(topology.transformers)
+        assert neighbour_names(adjacency, "MV_1") == ["HV", "MV_2", "MV_3"]
+        assert neighbour_names(adjacency, "MV_4") == ["LV_1", "MV_3"]
+        assert adjacency.degree(adjacency.node_ids["LV_2"]) == 1
+        assert len(adjacency.neighbours) == 2 * adjacency.n_edges
+        for edge in range(adjacency.n_edges):
+            element = adjacency.element(topology, edge)
+            nodes = {
+                adjacency.node_names[adjacency.edge_node_1[edge]],
+                adjacency.node_names[adjacency.edge_node_2[edge]],
+            }
+            assert nodes == {element.node_1, element.node_2}
+            kind = TRANSFORMER if element in topology.transformers else BRANCH
+            assert adjacency.edge_type[edge] == kind
+
+    def test_parallel_elements_and_self_loops(self, topology) -> None:
+        parallel = make_branch("L_1_2_b", "MV_1", "MV_2")
+        loop = make_branch("L_loop", "MV_2", "MV_2")
+        extended = topology.model_copy(update={"branches": (*topology.branches, parallel, loop)})
+        adjacency = extended.adjacency
+        mv_1, mv_2 = adjacency.node_ids["MV_1"], adjacency.node_ids["MV_2"]
+        edges = adjacency.edges_between(mv_1, mv_2)
+        assert [adjacency.element(extended, e).name for e in edges] == ["L_1_2", "L_1_2_b"]
+        assert adjacency.edges_between(mv_2, mv_2) == [len(extended.branches) - 1]
+        assert neighbour_names(adjacency, "MV_2") == ["MV_1", "MV_1", "MV_2", "MV_3"]
+
+    def test_three_winding_transformer(self) -> None:
+        transformer = make_transformer("T3", "HV", "MV")
+        winding = transformer.windings[1].model_copy(update={"node": "LV"})
+        transformer = transformer.model_copy(update={"windings": (*transformer.windings, winding)})
+        assert transformer_nodes(transformer) == ("HV", "MV", "LV")
+        topology = make_topology(nodes=("HV", "MV", "LV"), transformers=(transformer,))
+        adjacency = Adjacency.from_topology(topology)
+        assert adjacency.n_edges == 3  # noqa: PLR2004
+        assert set(adjacency.edge_element) == {0}
+        assert neighbour_names(adjacency, "LV") == ["HV", "MV"]
+
+    def test_unknown_node(self, topology) -> None:
+        broken = topology.model_copy(update={"branches": (make_branch("L_x", "MV_1", "unknown"),)})
+        with pytest.raises(ValueError, match="unknown"):
+            broken.adjacency  # noqa: B018
+
+
+class TestIslands:
+    def test_connected(self, topology) -> None:
+        result = islands(topology)
+        assert result.n_islands == 1
+        assert result.energized == {0}
+        assert set(result.energized_nodes) == {e.name for e in topology.nodes}
+
+    def test_topology_case(self, topology, topology_case) -> None:
+        # L_3_1 is opened at MV_1, the MV mesh stays connected via L_1_2 and L_2_3
+        assert islands(topology, topology_case).n_islands == 1
+        case = make_topology_case(ElementState(name="T_MV_LV", open_switches=("LV_1",)))
+        result = islands(topology, case)
+        assert result.n_islands == 2  # noqa: PLR2004
+        assert result.nodes_of(result.island_of("LV_1")) == ("LV_1", "LV_2")
+        assert result.island_of("LV_1") not in result.energized
+        assert "MV_4" in result.energized_nodes
+
+    def test_disabled_elements(self, topology) -> None:
+        case = make_topology_case(
+            ElementState(name="C_3_4", disabled=True),
+            ElementState(name="HV", disabled=True),
+        )
+        result = islands(topology, case)
+        assert result.island_of("HV") == NO_ISLAND
+        assert result.nodes_of(result.island_of("MV_4")) == ("MV_4", "LV_1", "LV_2")
+        assert result.n_islands == 2  # noqa: PLR2004
+        assert result.energized == set()
+
+    def test_external_grid_types(self, topology) -> None:
+        grid = make_external_grid("PV_Grid", "LV_2", GridType.PV)
+        extended = topology.model_copy(update={"external_grids": (grid,)})
+        result = islands(extended)
+        assert result.energized == set()
+        assert islands(topology, make_topology_case(ElementState(name="ExtGrid", disabled=True))).energized == set()
+
+    def test_three_winding_transformer(self) -> None:
+        transformer = make_transformer("T3", "HV", "MV")
+        winding = transformer.windings[1].model_copy(update={"node": "LV"})
+        transformer = transformer.model_copy(update={"windings": (*transformer.windings, winding)})
+        topology = make_topology(nodes=("HV", "MV", "LV"), transformers=(transformer,), external_grids=(("G", "HV"),))
+        result = islands(topology, make_topology_case(ElementState(name="T3", open_switches=("MV",))))
+        assert result.nodes_of(0) == ("HV", "LV")
+        assert result.energized == {0}
+
+
+def names(topology, section, indices) -> list[str]:
+    return [getattr(topology, section)[i].name for i in indices]
+
+
+class TestFeeders:
+    def test_trace(self, topology) -> None:
+        result = topology.feeders
+        assert result is topology.feeders
+        assert names(topology, "nodes", result.roots) == ["HV", "MV_1", "LV_1"]
+        assert result.root_of("MV_4") == "MV_1"
+        assert names(topology, "nodes", result.nodes_of(result.feeder_of("MV_1"))) == ["MV_1", "MV_2", "MV_3", "MV_4"]
+        mv_4 = result.node_ids["MV_4"]
+        assert result.depth[mv_4] == 2  # noqa: PLR2004
+        assert result.node_names[result.node_parent[mv_4]] == "MV_3"
+        assert topology.branches[result.parent_branch[mv_4]].name == "C_3_4"
+        assert result.parent_branch[result.node_ids["MV_1"]] == -1
+        assert names(topology, "branches", result.branches_of(1)) == ["L_1_2", "L_3_1", "C_3_4"]
+        assert names(topology, "loads", result.loads_of(1)) == ["Load_MV_2", "Load_MV_3"]
+        assert names(topology, "loads", result.loads_of(2)) == ["Load_LV_2"]
+        assert names(topology, "branches", result.meshes) == ["L_2_3"]
+        assert not result.is_radial
+
+    def test_parents_precede_children(self, topology) -> None:
+        result = topology.feeders
+        for feeder in range(result.n_feeders):
+            seen = set()
+            for node in result.nodes_of(feeder):
+                assert result.node_parent[node] == -1 or result.node_parent[node] in seen
+                seen.add(node)
+
+    def test_topology_case(self, topology, topology_case) -> None:
+        # L_3_1 is opened at MV_1, so MV_3 is fed via MV_2 and the mesh is gone, Load_MV_3 is disabled
+        result = topology_case.apply(topology).feeders
+        assert result.is_radial
+        assert result.depth[result.node_ids["MV_4"]] == 3  # noqa: PLR2004
+        assert names(topology, "loads", result.loads_of(1)) == ["Load_MV_2"]
+
+    def test_unfed_nodes(self, topology) -> None:
+        case = make_topology_case(
+            ElementState(name="C_3_4", disabled=True),
+            ElementState(name="T_MV_LV", open_switches=("LV_1",)),
+        )
+        result = feeders(topology, case)
+        assert names(topology, "nodes", result.roots) == ["HV", "MV_1"]
+        assert result.root_of("MV_4") is None
+        assert result.feeder_of("LV_2") == NO_FEEDER
+        assert result.depth[result.node_ids["LV_2"]] == -1
+        assert names(topology, "loads", result.loads) == ["Load_MV_2", "Load_MV_3"]
+
+    def test_disabled_primary_node(self, topology) -> None:
+        case = make_topology_case(ElementState(name="HV", disabled=True))
+        result = feeders(topology, case)
+        assert names(topology, "nodes", result.roots) == ["LV_1"]
+        assert result.feeder_of("MV_1") == NO_FEEDER
+        assert not islands(topology, case).energized
+
+
+class TestAttachments:
+    def test_attached(self, topology) -> None:
+        result = topology.attached("MV_3")
+        assert [(e.name, end) for e, end in result.branches] == [("L_2_3", 2), ("L_3_1", 1), ("C_3_4", 1)]
+        assert result.transformers == ()
+        assert [e.name for e in result.loads] == ["Load_MV_3"]
+        assert topology.attachments is topology.attachments
+
+    def test_transformer_windings_and_external_grids(self, topology) -> None:
+        result = topology.attached("HV")
+        assert [(e.name, winding) for e, winding in result.transformers] == [("T_HV_MV", 0)]
+        assert [e.name for e in result.external_grids] == ["ExtGrid"]
+        assert [(e.name, winding) for e, winding in topology.attached("LV_1").transformers] == [("T_MV_LV", 1)]
+
+    def test_transformer_without_windings(self, topology) -> None:
+        transformers = tuple(e.model_copy(update={"windings": ()}) for e in topology.transformers)
+        topology = topology.model_copy(update={"transformers": transformers})
+        assert [(e.name, end) for e, end in topology.attached("HV").transformers] == [("T_HV_MV", -1)]
+        assert [(e.name, end) for e, end in topology.attached("MV_1").transformers] == [("T_HV_MV", -2)]
+
+    def test_rows(self, topology) -> None:
+        attachments = topology.attachments
+        n_rows = 2 * len(topology.branches) + 2 * len(topology.transformers) + len(topology.loads) + 1
+        assert attachments.indptr[-1] == n_rows
+        mv_1 = attachments.node_ids["MV_1"]
+        assert attachments.degree(mv_1) == 3  # noqa: PLR2004
+        assert [attachments.element_type[r] for r in attachments.rows(mv_1)] == [BRANCH, BRANCH, TRANSFORMER]
+
+    def test_unknown_node(self, topology) -> None:
+        broken = topology.model_copy(update={"loads": (make_load("Load_x", "unknown"),)})
+        with pytest.raises(ValueError, match="unknown"):
+            broken.attachments  # noqa: B018
+
+
+class TestSubnetworks:
+    def test_split_by_voltage(self, topology) -> None:
+        result = topology.subnetworks
+        assert result is topology.subnetworks
+        assert result.n_subnetworks == 3  # noqa: PLR2004
+        assert result.u_n == (110000, 20000, 400)
+        assert result.nodes_of(result.subnetwork_of("MV_4")) == ("MV_1", "MV_2", "MV_3", "MV_4")
+        assert result.nodes_of(result.subnetwork_of("LV_2")) == ("LV_1", "LV_2")
+        assert result.meshed == (result.subnetwork_of("MV_1"),)
+        assert result.is_radial(result.subnetwork_of("LV_1"))
+
+    def test_cycle_basis(self, topology) -> None:
+        result = topology.subnetworks
+        mv = result.subnetwork_of("MV_1")
+        assert result.cyclomatic_number(mv) == 1
+        (cycle,) = result.cycle_basis(mv)
+        assert [topology.adjacency.element(topology, edge).name for edge in cycle] == ["L_1_2", "L_3_1", "L_2_3"]
+
+    def test_parallel_elements_and_self_loops(self, topology) -> None:
+        parallel = make_branch("L_LV_b", "LV_1", "LV_2", u_n=400)
+        loop = make_branch("L_loop", "LV_2", "LV_2", u_n=400)
+        extended = topology.model_copy(update={"branches": (*topology.branches, parallel, loop)})
+        result = extended.subnetworks
+        lv = result.subnetwork_of("LV_1")
+        assert result.cyclomatic_number(lv) == 2  # noqa: PLR2004
+        cycles = [[extended.adjacency.element(extended, e).name for e in c] for c in result.cycle_basis(lv)]
+        assert cycles == [["L_LV", "L_LV_b"], ["L_loop"]]
+
+    def test_topology_case(self, topology, topology_case) -> None:
+        # L_3_1 is opened at MV_1, which opens the MV mesh
+        result = topology_case.apply(topology).subnetworks
+        assert result.meshed == ()
+        case = make_topology_case(ElementState(name="C_3_4", disabled=True), ElementState(name="HV", disabled=True))
+        result = subnetworks(topology, case)
+        assert result.subnetwork_of("HV") == NO_SUBNETWORK
+        assert result.nodes_of(result.subnetwork_of("MV_4")) == ("MV_4",)
@@ -0,0 +1,40 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import os
+
+import pytest
+
+from psdm.storage.index import TopologyIndex
+from psdm.storage.index import index_path
+from psdm.storage.json_stream import read_topology
+
+
+class TestTopologyIndex:
+    @pytest.mark.parametrize("suffix", [".json", ".json.gz"])
+    def test_get(self, topology, tmp_path, suffix) -> None:
+        file_path = tmp_path / ("topology" + suffix)
+        topology.to_json(file_path)
+        reference = read_topology(file_path)
+        index = TopologyIndex.open(file_path)
+        assert index_path(file_path).exists()
+        assert ("external_grids", "ExtGrid") in index
+        assert ("loads", "ExtGrid") not in index
+        assert index.get("external_grids", "ExtGrid") == reference.external_grids[0]
+        assert index.get_many("branches", ("L_LV", "L_1_2")) == (reference.branches[4], reference.branches[0])
+        with pytest.raises(KeyError):
+            index.get("loads", "unknown")
+
+    @pytest.mark.parametrize("check", ["stat", "hash"])
+    def test_invalidation(self, topology, tmp_path, check) -> None:
+        file_path = tmp_path / "topology.json"
+        topology.to_json(file_path)
+        TopologyIndex.open(file_path, check=check)
+        changed = topology.model_copy(update={"nodes": topology.nodes[1:]})
+        changed.to_json(file_path)
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        index = TopologyIndex.open(file_path, check=check)
+        assert ("nodes", "HV") not in index
+        assert index.get("nodes", "MV_1") == read_topology(file_path).nodes[0]
@@ -0,0 +1,76 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from conftest import make_branch
+from conftest import make_load
+
+from psdm.integrity import Violation
+from psdm.quantities.multi_phase import CosPhi
+from psdm.quantities.multi_phase import Voltage
+from psdm.quantities.single_phase import PowerFactorDirection
+from psdm.quantities.single_phase import SystemType
+from psdm.steadystate_case.controller import ControlCosPhiU
+
+
+class TestTopology:
+    def test_valid(self, topology) -> None:
+        report = topology.check_integrity()
+        assert report
+        assert report.violations == ()
+
+    def test_dangling_nodes(self, topology) -> None:
+        transformer = topology.transformers[0]
+        winding = transformer.windings[1].model_copy(update={"node": "MV_X"})
+        broken = topology.model_copy(
+            update={
+                "branches": (*topology.branches, make_branch("L_x", "MV_1", "MV_Y")),
+                "transformers": (transformer.model_copy(update={"windings": (transformer.windings[0], winding)}),),
+                "loads": (make_load("Load_x", "LV_X"),),
+            },
+        )
+        report = broken.check_integrity()
+        assert not report
+        assert report.violations == (
+            Violation("L_x", "node_2", "Node MV_Y does not exist."),
+            Violation("T_HV_MV", "windings[1].node", "Node MV_X does not exist."),
+            Violation("Load_x", "node", "Node LV_X does not exist."),
+        )
+
+    def test_phases(self, topology) -> None:
+        node = topology.nodes_by_name["MV_2"].model_copy(update={"phases": ("A", "B")})
+        nodes = tuple(node if e.name == "MV_2" else e for e in topology.nodes)
+        report = topology.model_copy(update={"nodes": nodes}).check_integrity()
+        assert {(v.element, v.attribute) for v in report.violations} == {
+            ("L_1_2", "phases_2"),
+            ("L_2_3", "phases_1"),
+            ("Load_MV_2", "phase_connections"),
+        }
+        assert report.violations[0].message == "Phases C are not phases of node MV_2."
+
+
+class TestSteadystateCase:
+    def test_valid(self, steadystate_case, topology) -> None:
+        assert steadystate_case.check_integrity(topology)
+
+    def test_dangling_controller_nodes(self, steadystate_case, topology) -> None:
+        load = steadystate_case.loads[0]
+        cos_phi = CosPhi(value=(0.9, 0.9, 0.9), direction=PowerFactorDirection.UE, system_type=SystemType.NATURAL)
+        voltage = Voltage(value=(20000, 20000, 20000), system_type=SystemType.NATURAL)
+        control_type = ControlCosPhiU(
+            cos_phi_ue=cos_phi,
+            cos_phi_oe=cos_phi,
+            u_threshold_ue=voltage,
+            u_threshold_oe=voltage,
+            node_ref_u="MV_Y",
+        )
+        controller = load.reactive_power.controller.model_copy(
+            update={"node_target": "MV_X", "control_type": control_type},
+        )
+        reactive_power = load.reactive_power.model_copy(update={"controller": controller})
+        loads = (load.model_copy(update={"reactive_power": reactive_power}), *steadystate_case.loads[1:])
+        report = steadystate_case.model_copy(update={"loads": loads}).check_integrity(topology)
+        assert report.violations == (
+            Violation(load.name, "reactive_power.controller.node_target", "Node MV_X does not exist."),
+            Violation(load.name, "reactive_power.controller.control_type.node_ref_u", "Node MV_Y does not exist."),
+        )
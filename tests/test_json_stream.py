@@ -0,0 +1,68 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import io
+import json
+import typing as t
+
+import pytest
+
+from psdm.storage.json_stream import JsonScanner
+from psdm.storage.json_stream import iter_topology_batches
+from psdm.storage.json_stream import iter_topology_elements
+from psdm.storage.json_stream import read_topology
+from psdm.topology.branch import Branch
+from psdm.topology.topology import Topology
+
+
+class TestJsonScanner:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64])
+    def test_members_and_positions(self, chunk_size) -> None:
+        document = '{"a": 12345, "b": [{"x": "ä"}, 1.5e3, null] , "c": {"d": [true]}}'
+        scanner = JsonScanner(io.StringIO(document), chunk_size=chunk_size)
+        result: dict[str, t.Any] = {}
+        spans = []
+        for key in scanner.iter_members():
+            if key == "b":
+                for value, start, end in scanner.iter_array_spans():
+                    spans.append((start, end))
+                    result.setdefault(key, []).append(value)
+            elif key == "a":
+                result[key] = scanner.decode_value()
+
+        assert result == {"a": 12345, "b": [{"x": "ä"}, 1500.0, None]}
+        raw = document.encode("utf-8")
+        assert [json.loads(raw[start:end]) for start, end in spans] == result["b"]
+
+    def test_invalid_document(self) -> None:
+        scanner = JsonScanner(io.StringIO('{"a": [1 2]}'), chunk_size=4)
+        with pytest.raises(json.JSONDecodeError):
+            list(scanner.iter_members())
+
+
+class TestTopologyStream:
+    @pytest.mark.parametrize("chunk_size", [7, 1 << 20])
+    def test_read_topology(self, topology, tmp_path, chunk_size) -> None:
+        file_path = tmp_path / "topology.json"
+        topology.to_json(file_path)
+        assert read_topology(file_path, chunk_size=chunk_size) == Topology.from_file(file_path)
+
+    def test_iter_elements(self, topology, tmp_path) -> None:
+        file_path = tmp_path / "topology.json"
+        topology.to_json(file_path)
+        branches = [e for _, e in iter_topology_elements(file_path, sections=("branches",), chunk_size=16)]
+        assert all(isinstance(e, Branch) for e in branches)
+        assert tuple(branches) == topology.branches
+        with pytest.raises(ValueError, match=r"\['meta'\] are not element sections, allowed are \['branches'"):
+            next(iter_topology_elements(file_path, sections=("meta",)))
+
+    def test_iter_batches(self, topology, tmp_path) -> None:
+        file_path = tmp_path / "topology.json"
+        topology.to_json(file_path)
+        batch_size = 2
+        batches = list(iter_topology_batches(file_path, batch_size=batch_size))
+        assert all(0 < len(batch) <= batch_size for _, batch in batches)
+        assert sum(len(batch) for section, batch in batches if section == "nodes") == len(topology.nodes)
+        with pytest.raises(ValueError, match="batch_size"):
+            next(iter_topology_batches(file_path, batch_size=0))
@@ -0,0 +1,42 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import json
+
+import pydantic
+import pytest
+
+from psdm.storage.json_stream import read_topology
+from psdm.storage.lazy import LazyTopology
+from psdm.topology.topology import Topology
+
+
+class TestLazyTopology:
+    @pytest.mark.parametrize("suffix", [".json", ".json.gz"])
+    def test_sections_on_demand(self, topology, tmp_path, suffix) -> None:
+        file_path = tmp_path / ("topology" + suffix)
+        topology.to_json(file_path)
+        lazy = LazyTopology(file_path)
+        assert lazy.meta == topology.meta
+        assert lazy.loaded_sections == frozenset()
+        assert lazy.nodes == read_topology(file_path).nodes
+        assert lazy.loaded_sections == {"nodes"}
+        assert lazy.to_topology() == Topology.from_file(file_path)
+        assert lazy.loaded_sections == {"branches", "nodes", "loads", "transformers", "external_grids"}
+
+    def test_invalid_section_is_not_validated_until_access(self, topology, tmp_path) -> None:
+        data = json.loads(topology.model_dump_json())
+        data["loads"][0]["rated_power"]["cos_phi"]["value"] = [2, 2, 2]
+        file_path = tmp_path / "topology.json"
+        file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        lazy = LazyTopology(file_path)
+        assert len(lazy.branches) == len(topology.branches)
+        with pytest.raises(pydantic.ValidationError):
+            _ = lazy.loads
+
+    def test_missing_section(self, tmp_path) -> None:
+        file_path = tmp_path / "topology.json"
+        file_path.write_text('{"meta": {}, "nodes": []}', encoding="utf-8")
+        with pytest.raises(ValueError, match="missing"):
+            LazyTopology(file_path)
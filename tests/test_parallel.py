@@ -0,0 +1,76 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import concurrent.futures
+import json
+
+import pydantic
+import pytest
+
+from psdm.storage.parallel import load_topology
+from psdm.storage.parallel import read_topology
+from psdm.topology.topology import Topology
+
+
+def serial_error(json_str: str) -> str:
+    with pytest.raises(pydantic.ValidationError) as excinfo:
+        Topology.from_json(json_str)
+
+    return str(excinfo.value)
+
+
+class TestParallel:
+    @pytest.mark.parametrize("suffix", [".json", ".json.gz"])
+    def test_equals_serial(self, topology, tmp_path, suffix) -> None:
+        file_path = tmp_path / ("topology" + suffix)
+        topology.to_json(file_path)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            result = read_topology(file_path, executor=executor, batch_size=2)
+
+        assert result == Topology.from_file(file_path)
+        assert result.model_dump_json() == topology.model_dump_json()
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 100])
+    def test_batch_sizes(self, topology, batch_size) -> None:
+        json_str = topology.model_dump_json()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            result = load_topology(json_str, executor=executor, batch_size=batch_size)
+
+        assert result == Topology.from_json(json_str)
+        with pytest.raises(ValueError, match="positive"):
+            load_topology(json_str, batch_size=0)
+
+    def test_invalid_element(self, topology) -> None:
+        data = json.loads(topology.model_dump_json())
+        data["loads"][2]["rated_power"]["cos_phi"]["value"] = [2, 2, 2]
+        json_str = json.dumps(data)
+        with (
+            concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor,
+            pytest.raises(pydantic.ValidationError) as excinfo,
+        ):
+            load_topology(json_str, executor=executor, batch_size=1)
+
+        assert str(excinfo.value) == serial_error(json_str)
+
+    def test_duplicates_across_batches(self, topology) -> None:
+        data = json.loads(topology.model_dump_json())
+        data["nodes"].append(data["nodes"][0])
+        json_str = json.dumps(data)
+        with (
+            concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor,
+            pytest.raises(pydantic.ValidationError, match="duplicated: HV") as excinfo,
+        ):
+            load_topology(json_str, executor=executor, batch_size=2)
+
+        assert str(excinfo.value) == serial_error(json_str)
+
+    def test_invalid_json(self, topology) -> None:
+        json_str = topology.model_dump_json()[:-10]
+        with (
+            concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+            pytest.raises(pydantic.ValidationError) as excinfo,
+        ):
+            load_topology(json_str, executor=executor)
+
+        assert str(excinfo.value) == serial_error(json_str)
@@ -0,0 +1,59 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import pytest
+
+from psdm.topology.branch import BranchType
+from psdm.topology.load import LoadType
+from psdm.topology.load import SystemType
+
+
+def element_names(selection) -> list[str]:
+    return [e.name for e in selection.elements()]
+
+
+class TestSectionIndex:
+    def test_equal(self, topology) -> None:
+        loads = topology.query.loads
+        assert element_names(loads.equal("type", LoadType.CONSUMER)) == ["Load_MV_3", "Load_LV_2"]
+        assert element_names(loads.equal("system_type", "PV", SystemType.WIND)) == ["Load_MV_2"]
+        assert len(loads.equal("type", LoadType.STORAGE)) == 0
+        assert topology.query is topology.query
+        assert topology.query.loads is loads
+
+    def test_equal_nested_attribute(self, topology) -> None:
+        branches = topology.query.branches
+        assert element_names(branches.equal("type", BranchType.COUPLER)) == ["C_3_4"]
+        assert len(branches.equal("length.value", None)) == 0
+
+    def test_between(self, topology) -> None:
+        nodes = topology.query.nodes
+        assert element_names(nodes.between("u_n.value", 1000, 20000)) == ["MV_1", "MV_2", "MV_3", "MV_4"]
+        assert element_names(nodes.between("u_n.value", upper=400)) == ["LV_1", "LV_2"]
+        assert element_names(nodes.between("u_n.value", lower=20001)) == ["HV"]
+        assert list(nodes.between("u_n.value", 400, 400).indices()) == [5, 6]
+        with pytest.raises(TypeError, match="not numeric"):
+            nodes.between("name")
+
+    def test_optional_data(self, topology) -> None:
+        grids = topology.query.external_grids
+        assert element_names(grids.has_optional_data("operator")) == ["ExtGrid"]
+        assert len(grids.has_optional_data("owner")) == 0
+
+
+class TestSelection:
+    def test_combine(self, topology) -> None:
+        loads = topology.query.loads
+        consumers = loads.equal("type", LoadType.CONSUMER)
+        mv = loads.equal("node", "MV_2", "MV_3")
+        assert element_names(consumers & mv) == ["Load_MV_3"]
+        assert element_names(consumers | mv) == ["Load_MV_2", "Load_MV_3", "Load_LV_2"]
+        assert element_names(consumers - mv) == ["Load_LV_2"]
+        assert element_names(~consumers) == ["Load_MV_2"]
+        assert 0 in ~consumers
+        assert len(loads.all()) == len(topology.loads)
+
+    def test_different_sections(self, topology) -> None:
+        with pytest.raises(ValueError, match="different sections"):
+            topology.query.loads.all() & topology.query.nodes.all()
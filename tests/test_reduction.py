@@ -0,0 +1,97 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import pytest
+from conftest import META
+from conftest import make_branch
+from conftest import make_topology
+from conftest import make_transformer
+
+from psdm.topology.branch import BranchType
+from psdm.topology.coupler import Coupler
+from psdm.topology.graph import islands
+from psdm.topology.reduction import NO_BUS
+from psdm.topology.reduction import buses
+from psdm.topology_case.case import Case as TopologyCase
+from psdm.topology_case.element_state import ElementState
+
+
+class TestBuses:
+    def test_closed_coupler(self, topology) -> None:
+        result = buses(topology)
+        assert result.n_buses == len(topology.nodes) - 1
+        assert result.bus_of("MV_4") == "MV_3"
+        assert result.nodes_of(result.node_bus[result.node_ids["MV_3"]]) == ("MV_3", "MV_4")
+        assert result.bus_names == ("HV", "MV_1", "MV_2", "MV_3", "LV_1", "LV_2")
+
+    def test_open_coupler(self, topology) -> None:
+        case = TopologyCase(meta=META, elements=(ElementState(name="C_3_4", open_switches=("MV_4",)),))
+        assert buses(topology, case).n_buses == len(topology.nodes)
+        switch = Coupler(element="C_3_4", node="MV_3", state=False)
+        assert buses(topology, switches=(switch,)).bus_of("MV_4") == "MV_4"
+        assert buses(topology, switches=(switch.model_copy(update={"state": True}),)).bus_of("MV_4") == "MV_3"
+
+    def test_fuses_and_disabled_nodes(self, topology) -> None:
+        fuse = make_branch("F_2_3", "MV_2", "MV_3", branch_type=BranchType.FUSE)
+        extended = topology.model_copy(update={"branches": (*topology.branches, fuse)})
+        assert buses(extended).nodes_of(2) == ("MV_2", "MV_3", "MV_4")
+        case = TopologyCase(meta=META, elements=(ElementState(name="MV_3", disabled=True),))
+        result = buses(extended, case)
+        assert result.bus_of("MV_3") is None
+        assert result.node_bus[result.node_ids["MV_3"]] == NO_BUS
+        assert result.bus_of("MV_4") == "MV_4"
+
+
+class TestReduce:
+    def test_reduce(self, topology) -> None:
+        reduced = buses(topology).reduce(topology)
+        assert [e.name for e in reduced.nodes] == ["HV", "MV_1", "MV_2", "MV_3", "LV_1", "LV_2"]
+        assert [e.name for e in reduced.branches] == ["L_1_2", "L_2_3", "L_3_1", "L_LV"]
+        transformer = reduced.transformers_by_name["T_MV_LV"]
+        assert transformer.node_1 == "MV_3"
+        assert [w.node for w in transformer.windings] == ["MV_3", "LV_1"]
+        assert reduced.transformers_by_name["T_HV_MV"] is topology.transformers_by_name["T_HV_MV"]
+        assert reduced.loads == topology.loads
+        assert reduced.adjacency.n_nodes == len(reduced.nodes)
+
+    def test_topology_case(self, topology, topology_case) -> None:
+        # L_3_1 is opened at MV_1 and Load_MV_3 is disabled
+        reduced = buses(topology, topology_case).reduce(topology)
+        assert "L_3_1" not in reduced.branches_by_name
+        assert "Load_MV_3" not in reduced.loads_by_name
+        case = TopologyCase(meta=META, elements=(ElementState(name="T_MV_LV", open_switches=("LV_1",)),))
+        assert "T_MV_LV" not in buses(topology, case).reduce(topology).transformers_by_name
+
+    def test_branch_within_bus(self, topology) -> None:
+        parallel = make_branch("L_3_4", "MV_3", "MV_4")
+        extended = topology.model_copy(update={"branches": (*topology.branches, parallel)})
+        assert "L_3_4" not in buses(extended).reduce(extended).branches_by_name
+
+    @pytest.mark.parametrize("disabled", ["HV", "MV", "LV"])
+    def test_three_winding_disabled_node(self, disabled) -> None:
+        transformer = make_transformer("T", "HV", "MV")
+        lv = transformer.windings[1].model_copy(update={"node": "LV"})
+        transformer = transformer.model_copy(update={"windings": (*transformer.windings, lv)})
+        topology = make_topology(["HV", "MV", "LV"], transformers=[transformer])
+        assert buses(topology).reduce(topology).transformers == (transformer,)
+
+        case = TopologyCase(meta=META, elements=(ElementState(name=disabled, disabled=True),))
+        reduced = buses(topology, case).reduce(topology)
+        assert reduced.transformers == ()
+        assert [e.name for e in reduced.nodes] == [n for n in ("HV", "MV", "LV") if n != disabled]
+
+    @pytest.mark.parametrize(("opened", "nodes"), [("LV", ("HV", "MV")), ("MV", ("HV", "LV")), ("HV", ("MV", "LV"))])
+    def test_three_winding_open_terminal(self, opened, nodes) -> None:
+        transformer = make_transformer("T", "HV", "MV")
+        lv = transformer.windings[1].model_copy(update={"node": "LV"})
+        transformer = transformer.model_copy(update={"windings": (*transformer.windings, lv)})
+        topology = make_topology(["HV", "MV", "LV"], transformers=[transformer])
+        case = TopologyCase(meta=META, elements=(ElementState(name="T", open_switches=(opened,)),))
+
+        (result,) = buses(topology, case).reduce(topology).transformers
+        assert (result.node_1, result.node_2) == nodes
+        assert tuple(w.node for w in result.windings) == tuple(n for n in ("HV", "MV", "LV") if n != opened)
+        reduced_islands = islands(buses(topology, case).reduce(topology))
+        assert reduced_islands.island_of(opened) != reduced_islands.island_of(nodes[0])
+        assert reduced_islands.island_of(nodes[0]) == reduced_islands.island_of(nodes[1])
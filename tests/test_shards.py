@@ -0,0 +1,88 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import concurrent.futures
+
+import pytest
+
+from psdm.storage.shards import read_manifest
+from psdm.storage.shards import read_shards
+from psdm.storage.shards import shard_by_area
+from psdm.storage.shards import shard_by_voltage
+from psdm.storage.shards import write_shards
+from psdm.topology.topology import Topology
+
+
+def names(topology, section) -> set[str]:
+    return {e.name for e in getattr(topology, section)}
+
+
+class TestShards:
+    def test_shard_by(self, topology) -> None:
+        assert shard_by_voltage(topology) == {
+            "HV": "110000V",
+            "MV_1": "20000V",
+            "MV_2": "20000V",
+            "MV_3": "20000V",
+            "MV_4": "20000V",
+            "LV_1": "400V",
+            "LV_2": "400V",
+        }
+        assert shard_by_area(topology) == {
+            "HV": "area_1",
+            "MV_1": "area_2",
+            "MV_2": "area_2",
+            "MV_3": "area_2",
+            "MV_4": "area_2",
+            "LV_1": "area_3",
+            "LV_2": "area_3",
+        }
+
+    @pytest.mark.parametrize(("by", "suffix"), [("voltage", ".json"), ("area", ".json.gz")])
+    def test_roundtrip(self, topology, tmp_path, by, suffix) -> None:
+        manifest = write_shards(topology, tmp_path, by=by, suffix=suffix)
+        assert read_manifest(tmp_path) == manifest
+        assert len(manifest["shards"]) == 3  # noqa: PLR2004
+        assert manifest["boundary"]["transformers"].keys() == {"T_HV_MV", "T_MV_LV"}
+        assert manifest["boundary"]["branches"] == {}
+        assert manifest["boundary"]["nodes"].keys() == {"HV", "MV_1", "MV_4", "LV_1"}
+        for shard in manifest["shards"].values():
+            assert isinstance(Topology.from_file(tmp_path / shard["file"]), Topology)
+
+        # values are rounded to their precision when written, so compare with the topology read from a single file
+        topology.to_json(tmp_path / "topology.json")
+        assert read_shards(tmp_path) == Topology.from_file(tmp_path / "topology.json")
+
+    def test_read_subset(self, topology, tmp_path) -> None:
+        write_shards(topology, tmp_path)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            result = read_shards(tmp_path, shards=("20000V", "400V"), executor=executor)
+
+        assert names(result, "nodes") == {"MV_1", "MV_2", "MV_3", "MV_4", "LV_1", "LV_2"}
+        assert names(result, "transformers") == {"T_MV_LV"}
+        assert names(result, "external_grids") == set()
+        with pytest.raises(ValueError, match="not part"):
+            read_shards(tmp_path, shards=("1V",))
+
+    def test_custom_shards(self, topology, tmp_path) -> None:
+        shards = dict.fromkeys(names(topology, "nodes"), "all") | {"LV_2": "rest"}
+        manifest = write_shards(topology, tmp_path, by=shards)
+        assert manifest["boundary"]["branches"] == {"L_LV": ["all", "rest"]}
+        assert manifest["shards"]["rest"]["loads"] == 1
+        with pytest.raises(ValueError, match="not assigned"):
+            write_shards(topology, tmp_path, by={"HV": "all"})
+        with pytest.raises(ValueError, match="reserved"):
+            write_shards(topology, tmp_path, by=shards | {"LV_2": "boundary"})
+
+    def test_missing_node(self, topology) -> None:
+        branch = topology.branches[0].model_copy(update={"node_2": "X"})
+        with pytest.raises(ValueError, match="Node X of"):
+            shard_by_area(topology.model_copy(update={"branches": (branch,)}))
+
+    def test_transformer_without_windings(self, topology, tmp_path) -> None:
+        transformers = tuple(e.model_copy(update={"windings": ()}) for e in topology.transformers)
+        topology = topology.model_copy(update={"transformers": transformers})
+        manifest = write_shards(topology, tmp_path)
+        assert manifest["boundary"]["transformers"]["T_MV_LV"] == ["20000V", "400V"]
+        assert names(read_shards(tmp_path, shards=("20000V",)), "transformers") == set()
@@ -0,0 +1,49 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import pytest
+
+from psdm.matching import SectionDiff
+
+
+class TestNameIndexes:
+    @pytest.mark.parametrize("section", ["loads", "transformers", "external_grids"])
+    def test_index(self, steadystate_case, topology, section) -> None:
+        index = getattr(steadystate_case, f"{section}_by_name")
+        topology_index = getattr(topology, f"{section}_by_name")
+        assert all(index[e.name] is e for e in getattr(steadystate_case, section))
+        assert index.keys() == topology_index.keys()
+
+
+class TestMatchTopology:
+    def test_match(self, steadystate_case, topology) -> None:
+        report = steadystate_case.match_topology(topology)
+        assert report
+        assert report.sections.keys() == {"loads", "transformers", "external_grids"}
+        assert steadystate_case.matches_topology(topology)
+
+    def test_all_differences(self, steadystate_case, topology) -> None:
+        load = steadystate_case.loads[0]
+        case = steadystate_case.model_copy(
+            update={
+                "loads": (*steadystate_case.loads[1:], load.model_copy(update={"name": "Load_X"})),
+                "transformers": (*steadystate_case.transformers, steadystate_case.transformers[0]),
+                "external_grids": (),
+            },
+        )
+        report = case.match_topology(topology)
+        assert not report
+        assert report.meta_matches
+        assert report.sections["loads"] == SectionDiff(missing=("Load_MV_2",), extra=("Load_X",))
+        assert report.sections["transformers"] == SectionDiff(duplicated=("T_HV_MV",))
+        assert report.sections["external_grids"] == SectionDiff(missing=("ExtGrid",))
+        assert not case.matches_topology(topology, fail_fast=False)
+
+    def test_fail_fast(self, steadystate_case, topology) -> None:
+        case = steadystate_case.model_copy(update={"loads": (), "external_grids": ()})
+        assert case.match_topology(topology, fail_fast=True).sections.keys() == {"loads"}
+        meta = topology.meta.model_copy(update={"grid": "other"})
+        report = case.model_copy(update={"meta": meta}).match_topology(topology, fail_fast=True)
+        assert not report.meta_matches
+        assert report.sections == {}
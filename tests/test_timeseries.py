@@ -0,0 +1,65 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import pytest
+
+from psdm.quantities.multi_phase import ActivePower as ActivePowerSet
+from psdm.quantities.multi_phase import Voltage as VoltageSet
+from psdm.steadystate_case.controller import ControlPConst
+from psdm.storage.timeseries import CaseSeries
+
+
+def scaled_case(case, i: int):
+    loads = tuple(
+        load.model_copy(
+            update={
+                "active_power": load.active_power.model_copy(
+                    update={
+                        "controller": load.active_power.controller.model_copy(
+                            update={"control_type": ControlPConst(p_set=ActivePowerSet(value=(i, 2 * i, 3 * i)))},
+                        ),
+                    },
+                ),
+            },
+        )
+        for load in case.loads
+    )
+    transformers = tuple(e.model_copy(update={"tap_pos": i}) for e in case.transformers)
+    external_grids = tuple(e.model_copy(update={"u_0": VoltageSet(value=(1.0 + i,) * 3)}) for e in case.external_grids)
+    return case.model_copy(update={"loads": loads, "transformers": transformers, "external_grids": external_grids})
+
+
+class TestCaseSeries:
+    def test_create_and_read(self, topology, steadystate_case, tmp_path) -> None:
+        cases = [scaled_case(steadystate_case, i) for i in range(5)]
+        series = CaseSeries.create(tmp_path / "series", topology, cases)
+        assert len(series) == len(cases)
+        assert series[3] == cases[3]
+        assert series[-1] == cases[-1]
+        assert list(series.cases(1, 3)) == cases[1:3]
+        series.close()
+
+        series = CaseSeries(tmp_path / "series")
+        values = series.values(2, 4)
+        assert values.shape == (2, series.n_values)
+        assert len(series.labels) == series.n_values
+        column = series.labels.index("transformers[T_HV_MV].tap_pos")
+        assert [row[column] for row in values.tolist()] == [2, 3]  # type: ignore[index]
+        series.append(cases[0])
+        assert len(series) == len(cases) + 1
+        assert series[5] == cases[0]
+        assert [row[column] for row in values.tolist()] == [2, 3]  # type: ignore[index]
+
+    def test_structure_mismatch(self, topology, steadystate_case, tmp_path) -> None:
+        series = CaseSeries.create(tmp_path / "series", topology, template=steadystate_case)
+        assert len(series) == 0
+        assert series.values().tolist() == []
+        other = steadystate_case.model_copy(update={"transformers": ()})
+        with pytest.raises(ValueError, match="structure"):
+            series.append(other)
+
+    def test_template_must_match_topology(self, topology, steadystate_case, tmp_path) -> None:
+        other = steadystate_case.model_copy(update={"loads": steadystate_case.loads[:1]})
+        with pytest.raises(ValueError, match="topology"):
+            CaseSeries.create(tmp_path / "series", topology, [other])
@@ -0,0 +1,39 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+import pickle
+
+import pytest
+
+from psdm.topology.topology import Topology
+
+
+class TestNameIndexes:
+    @pytest.mark.parametrize("section", ["branches", "nodes", "loads", "transformers", "external_grids"])
+    def test_index(self, topology, section) -> None:
+        index = getattr(topology, f"{section}_by_name")
+        assert list(index.values()) == list(getattr(topology, section))
+        assert all(index[e.name] is e for e in getattr(topology, section))
+        assert getattr(topology, f"{section}_by_name") is index
+        with pytest.raises(TypeError):
+            index["new"] = None
+
+    def test_cache_is_not_copied(self, topology) -> None:
+        assert "MV_1" in topology.nodes_by_name
+        copied = topology.model_copy(update={"nodes": topology.nodes[:1]})
+        assert copied.nodes_by_name.keys() == {"HV"}
+        assert copied == topology.model_copy(update={"nodes": topology.nodes[:1]})
+
+    def test_cache_is_not_pickled(self, topology) -> None:
+        _ = topology.loads_by_name
+        result = pickle.loads(pickle.dumps(topology))  # noqa: S301
+        assert result == topology
+        assert "loads_by_name" not in result.__dict__
+        assert Topology.from_bytes(topology.to_bytes()) == topology
+
+    def test_cache_is_not_iterated(self, topology) -> None:
+        fields = dict(topology)
+        _ = topology.branches_by_name, topology.adjacency, topology.feeders, topology.query, hash(topology)
+        assert dict(topology) == fields
+        assert list(fields) == list(type(topology).model_fields)
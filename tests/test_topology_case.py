@@ -0,0 +1,70 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2025.
+# :license: BSD 3-Clause
+
+from psdm.matching import SectionDiff
+from psdm.topology.graph import NO_ISLAND
+from psdm.topology_case.case import Case
+from psdm.topology_case.element_state import ElementState
+
+
+class TestNameIndexes:
+    def test_index(self, topology_case) -> None:
+        index = topology_case.elements_by_name
+        assert index.keys() == {"Load_MV_3", "L_3_1"}
+        assert index["Load_MV_3"].disabled
+        assert index["L_3_1"].open_switches == ("MV_1",)
+
+
+class TestMatchTopology:
+    def test_match(self, topology_case, topology) -> None:
+        assert topology_case.match_topology(topology)
+        assert topology_case.matches_topology(topology)
+
+    def test_unknown_elements(self, topology_case, topology) -> None:
+        states = (*topology_case.elements, ElementState(name="X"), ElementState(name="X", disabled=True))
+        report = topology_case.model_copy(update={"elements": states}).match_topology(topology)
+        assert report.sections["elements"] == SectionDiff(extra=("X",), duplicated=("X",))
+        assert not report
+
+
+class TestEffectiveTopology:
+    def test_filters_disabled_elements(self, topology_case, topology) -> None:
+        view = topology_case.apply(topology)
+        assert "Load_MV_3" not in {e.name for e in view.loads}
+        assert len(view.loads) == len(topology.loads) - 1
+        assert view.branches is topology.branches
+        assert "Load_MV_3" not in view.loads_by_name
+        assert len(view.loads_by_name) == len(view.loads)
+        assert list(view.loads_by_name) == [e.name for e in view.loads]
+        assert view.branches_by_name["L_3_1"] is topology.branches_by_name["L_3_1"]
+        assert view.adjacency is topology.adjacency
+
+    def test_open_switches(self, topology_case, topology) -> None:
+        view = topology_case.apply(topology)
+        adjacency = view.adjacency
+        mv_1, mv_3 = adjacency.node_ids["MV_1"], adjacency.node_ids["MV_3"]
+        assert mv_3 in adjacency.neighbours_of(mv_1)
+        assert mv_3 not in view.neighbours_of(mv_1)
+        assert sum(view.edge_blocked) == 1
+        assert not any(view.node_disabled)
+
+    def test_disabled_node(self, topology) -> None:
+        case = Case(meta=topology.meta, elements=(ElementState(name="MV_3", disabled=True),))
+        view = case.apply(topology)
+        mv_3 = view.adjacency.node_ids["MV_3"]
+        assert view.neighbours_of(mv_3) == []
+        assert mv_3 not in view.neighbours_of(view.adjacency.node_ids["MV_1"])
+        assert view.islands().island_of("MV_3") == NO_ISLAND
+        assert {e.name for e in view.branches} == {e.name for e in topology.branches} - {"L_2_3", "L_3_1", "C_3_4"}
+        assert "Load_MV_3" not in view.loads_by_name
+
+        result = view.to_topology()
+        assert result.adjacency.n_nodes == len(topology.nodes) - 1
+        assert result.check_integrity()
+
+    def test_to_topology(self, topology_case, topology) -> None:
+        result = topology_case.apply(topology).to_topology()
+        assert {e.name for e in result.loads} == {e.name for e in topology.loads} - {"Load_MV_3"}
+        assert result.branches == topology.branches
+        assert result.meta == topology.meta